@@ -0,0 +1,290 @@
+"""
+여러 문서 일괄 처리
+- 일괄 변환: 문서(텍스트 또는 URL) × 채널 작업을 하나의 동시 실행 한도 아래에서 스케줄링하고,
+  작업이 끝나는 대로 이벤트를 내보냅니다 (POST /transform/batch의 NDJSON 응답).
+  같은 URL은 한 번만 스크랩하고, 내용이 같은 문서는 한 번만 변환해 결과를 함께 돌려줍니다.
+- 일괄 스크랩: 전체/호스트별 동시 요청 수와 호스트별 최소 요청 간격을 지키며 여러 URL을
+  가져오고 끝나는 대로 결과를 내보냅니다 (POST /scrape/batch의 NDJSON 응답).
+"""
+import os
+import time
+import asyncio
+import hashlib
+from dataclasses import dataclass, field
+from collections import Counter
+from typing import AsyncIterator, Optional
+from urllib.parse import urlparse
+
+from scheduler import build_calendar
+from scrape_cache import normalize_url
+
+# 한 번에 받을 수 있는 최대 문서 수
+BATCH_MAX_DOCUMENTS = int(os.getenv("BATCH_MAX_DOCUMENTS", 100))
+
+# 일괄 스크랩: 최대 URL 수, 전체/호스트별 동시 요청 수, 같은 호스트 요청 시작 사이 최소 간격(초)
+SCRAPE_BATCH_MAX_URLS = int(os.getenv("SCRAPE_BATCH_MAX_URLS", 500))
+SCRAPE_BATCH_CONCURRENCY = int(os.getenv("SCRAPE_BATCH_CONCURRENCY", 16))
+SCRAPE_BATCH_PER_HOST = int(os.getenv("SCRAPE_BATCH_PER_HOST", 2))
+SCRAPE_BATCH_HOST_DELAY = float(os.getenv("SCRAPE_BATCH_HOST_DELAY", 0.5))
+
+
+@dataclass
+class _ContentGroup:
+    """내용이 같은 문서 묶음 (변환은 한 번, 결과는 모든 문서에 전달)"""
+    document_ids: list[str]
+    results: dict[str, dict] = field(default_factory=dict)  # 채널 → 결과 이벤트
+    remaining: int = 0
+
+
+async def stream_batch(
+    repurposer,
+    scraper,
+    documents: list[dict],
+    channels: list[str],
+    style_config: Optional[dict] = None,
+    custom_prompts: Optional[dict[str, str]] = None,
+    max_concurrency: Optional[int] = None,
+    reuse_similar: bool = True
+) -> AsyncIterator[dict]:
+    """
+    문서 × 채널 변환 이벤트를 완료 순서대로 생성
+
+    이벤트 (step):
+        duplicate      - 앞선 문서와 내용이 같아 결과를 공유 (duplicate_of)
+        result / error - (문서, 채널) 작업 하나의 결과 또는 오류 (문서 단위 오류는 channel 없음)
+        document_done  - 문서의 모든 채널 완료 (규칙 기반 캘린더 포함)
+        done           - 전체 요약
+    """
+    custom_prompts = custom_prompts or {}
+    semaphore = asyncio.Semaphore(max(1, max_concurrency or repurposer.max_concurrency))
+    queue: asyncio.Queue = asyncio.Queue()
+    scrapes: dict[str, asyncio.Task] = {}
+    groups: dict[str, _ContentGroup] = {}
+    counters = {"tasks": 0, "cached": 0, "errors": 0, "duplicates": 0}
+    started = time.perf_counter()
+
+    def document_done(group: _ContentGroup, document_id: str) -> None:
+        done_channels = [channel for channel in channels if group.results[channel]["step"] == "result"]
+        queue.put_nowait({
+            "step": "document_done",
+            "document": document_id,
+            "channels": len(done_channels),
+            "calendar": build_calendar(done_channels) if done_channels else None
+        })
+
+    def publish(group: _ContentGroup, channel: str, event: dict) -> None:
+        group.results[channel] = event
+        group.remaining -= 1
+        for document_id in group.document_ids:
+            queue.put_nowait({**event, "document": document_id})
+            if group.remaining == 0:
+                document_done(group, document_id)
+
+    async def load(document: dict) -> str:
+        if document.get("content"):
+            return document["content"]
+        url = document["url"]
+        if url not in scrapes:
+            scrapes[url] = asyncio.create_task(scraper.ascrape(url))
+        return (await scrapes[url]).content
+
+    async def run_channel(group: _ContentGroup, text: str, fingerprint: Optional[int], channel: str) -> None:
+        async with semaphore:
+            try:
+                result = await repurposer.atransform_single_with_style(
+                    text,
+                    channel=channel,
+                    style_config=style_config,
+                    custom_prompt=custom_prompts.get(channel),
+                    reuse_similar=reuse_similar,
+                    fingerprint=fingerprint
+                )
+            except Exception as e:
+                counters["errors"] += 1
+                publish(group, channel, {"step": "error", "channel": channel, "message": str(e)})
+                return
+        counters["tasks"] += 1
+        counters["cached"] += int(result.cached)
+        publish(group, channel, {
+            "step": "result",
+            "channel": result.channel,
+            "channel_name": result.channel_name,
+            "content": result.content,
+            "char_count": len(result.content),
+            "cached": result.cached,
+            "near_duplicate": result.near_duplicate,
+            "similarity": result.similarity
+        })
+
+    async def run_document(document_id: str, document: dict) -> None:
+        try:
+            text = await load(document)
+        except Exception as e:
+            counters["errors"] += 1
+            queue.put_nowait({"step": "error", "document": document_id, "message": str(e)})
+            return
+
+        key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        group = groups.get(key)
+        if group is not None:
+            # 이미 변환 중이거나 끝난 내용 → 나온 결과를 바로 보내고 나머지는 함께 받음
+            counters["duplicates"] += 1
+            queue.put_nowait({"step": "duplicate", "document": document_id, "duplicate_of": group.document_ids[0]})
+            group.document_ids.append(document_id)
+            for event in group.results.values():
+                queue.put_nowait({**event, "document": document_id})
+            if group.results and group.remaining == 0:
+                document_done(group, document_id)
+            return
+
+        group = groups[key] = _ContentGroup(document_ids=[document_id], remaining=len(channels))
+        try:
+            async with semaphore:
+                text, _ = await repurposer.acondense(text)
+                fingerprint = await repurposer.afingerprint(text)
+        except Exception as e:
+            for channel in channels:
+                counters["errors"] += 1
+                publish(group, channel, {"step": "error", "channel": channel, "message": str(e)})
+            return
+        await asyncio.gather(*(run_channel(group, text, fingerprint, channel) for channel in channels))
+
+    document_tasks = [
+        asyncio.create_task(run_document(document.get("id") or str(index), document))
+        for index, document in enumerate(documents)
+    ]
+
+    async def close_when_finished():
+        await asyncio.gather(*document_tasks)
+        await queue.put(None)
+
+    closer = asyncio.create_task(close_when_finished())
+    try:
+        while (event := await queue.get()) is not None:
+            yield event
+    finally:
+        # 클라이언트 연결이 끊기면 남은 작업 취소
+        for task in document_tasks + list(scrapes.values()) + [closer]:
+            if not task.done():
+                task.cancel()
+
+    yield {
+        "step": "done",
+        "documents": len(documents),
+        "unique_documents": len(groups),
+        "channels": channels,
+        **counters,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 1)
+    }
+
+
+class _HostGate:
+    """호스트 하나의 동시 요청 수 제한 + 요청 시작 사이 최소 간격"""
+
+    def __init__(self, concurrency: int, delay: float):
+        self.slots = asyncio.Semaphore(max(1, concurrency))
+        self.delay = delay
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait_turn(self) -> None:
+        """이전 요청 시작으로부터 delay가 지날 때까지 대기 (slots를 잡은 뒤 호출)"""
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+async def stream_scrape_batch(
+    scraper,
+    urls: list[str],
+    max_concurrency: Optional[int] = None,
+    per_host_concurrency: Optional[int] = None,
+    host_delay: Optional[float] = None,
+    revalidate: bool = False
+) -> AsyncIterator[dict]:
+    """
+    여러 URL을 예의 있게 동시 스크랩하며 완료 순서대로 이벤트 생성
+
+    같은 URL(정규화 기준)은 한 번만 요청하고 결과를 모든 위치에 돌려줍니다.
+    호스트 대기가 전체 동시 실행 자리를 차지하지 않도록 호스트 차례를 먼저 기다립니다.
+    요청한 동시 요청 수는 SCRAPE_BATCH_CONCURRENCY / SCRAPE_BATCH_PER_HOST보다 크게, 간격은
+    SCRAPE_BATCH_HOST_DELAY보다 짧게 할 수 없습니다.
+    revalidate=True면 스크랩 캐시의 신선한 결과도 조건부 요청으로 다시 확인합니다 (BlogScraper.ascrape).
+
+    이벤트 (step):
+        result - ScrapedContent (index: 요청 목록에서의 위치)
+        error  - URL 하나의 실패 (다른 URL에는 영향 없음)
+        done   - 전체 요약
+    """
+    # 요청 값은 더 보수적인 쪽으로만 허용 (환경변수 값이 동시 요청 수 상한 / 간격 하한)
+    semaphore = asyncio.Semaphore(max(1, min(max_concurrency or SCRAPE_BATCH_CONCURRENCY, SCRAPE_BATCH_CONCURRENCY)))
+    per_host = max(1, min(per_host_concurrency or SCRAPE_BATCH_PER_HOST, SCRAPE_BATCH_PER_HOST))
+    delay = max(SCRAPE_BATCH_HOST_DELAY, host_delay or 0.0)
+    gates: dict[str, _HostGate] = {}
+    queue: asyncio.Queue = asyncio.Queue()
+    counters = Counter()
+    started = time.perf_counter()
+
+    # 정규화한 URL → 요청 목록 위치들
+    positions: dict[str, list[int]] = {}
+    for index, url in enumerate(urls):
+        positions.setdefault(normalize_url(url), []).append(index)
+
+    async def run(indexes: list[int]) -> None:
+        url = urls[indexes[0]]
+        host = urlparse(url).netloc.lower()
+        gate = gates.setdefault(host, _HostGate(per_host, delay))
+        fetch_started = time.perf_counter()
+        try:
+            async with gate.slots:
+                await gate.wait_turn()
+                async with semaphore:
+                    fetch_started = time.perf_counter()
+                    result = await scraper.ascrape(url, revalidate=revalidate)
+        except Exception as e:
+            counters["failed"] += len(indexes)
+            for index in indexes:
+                queue.put_nowait({"step": "error", "index": index, "url": urls[index], "message": str(e)})
+            return
+        counters["succeeded"] += len(indexes)
+        latency_ms = round((time.perf_counter() - fetch_started) * 1000, 1)
+        for index in indexes:
+            queue.put_nowait({
+                "step": "result",
+                "index": index,
+                "url": urls[index],
+                "title": result.title,
+                "content": result.content,
+                "source": result.source,
+                "char_count": len(result.content),
+                "latency_ms": latency_ms
+            })
+
+    tasks = [asyncio.create_task(run(indexes)) for indexes in positions.values()]
+
+    async def close_when_finished():
+        await asyncio.gather(*tasks)
+        await queue.put(None)
+
+    closer = asyncio.create_task(close_when_finished())
+    try:
+        while (event := await queue.get()) is not None:
+            yield event
+    finally:
+        # 클라이언트 연결이 끊기면 남은 스크랩 취소
+        for task in tasks + [closer]:
+            if not task.done():
+                task.cancel()
+
+    yield {
+        "step": "done",
+        "urls": len(urls),
+        "unique_urls": len(positions),
+        "hosts": len(gates),
+        "succeeded": counters["succeeded"],
+        "failed": counters["failed"],
+        "latency_ms": round((time.perf_counter() - started) * 1000, 1)
+    }
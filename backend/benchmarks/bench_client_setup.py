@@ -0,0 +1,67 @@
+"""
+요청당 클라이언트 준비 비용 측정
+- 이전 방식: 요청마다 ContentRepurposer / StyleAnalyzer / Provider 새로 생성
+- 현재 방식: lifespan에서 한 번 만든 공유 인스턴스를 의존성 주입으로 재사용
+
+실행: cd backend && python benchmarks/bench_client_setup.py [반복 횟수]
+(네트워크 호출 없이 생성 비용만 측정하므로 GEMINI_API_KEY는 임의 값이어도 됩니다)
+"""
+import os
+import sys
+import time
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GEMINI_API_KEY", "benchmark-dummy-key")
+
+from fastapi.testclient import TestClient
+
+from repurposer import ContentRepurposer
+from style_analyzer import StyleAnalyzer
+from providers import get_provider
+import main as app_module
+
+
+def measure(label: str, func, iterations: int) -> float:
+    """func를 iterations번 실행하고 1회 평균(ms) 출력"""
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    mean = statistics.mean(samples)
+    p95 = statistics.quantiles(samples, n=20)[-1] if len(samples) > 1 else samples[0]
+    print(f"{label:<40} mean={mean:8.3f}ms  p95={p95:8.3f}ms")
+    return mean
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    print(f"=== 요청당 클라이언트 준비 비용 ({iterations}회) ===\n")
+
+    print("[이전] 요청마다 생성")
+    before = sum([
+        measure("ContentRepurposer()  (/transform)", ContentRepurposer, iterations),
+        measure("StyleAnalyzer()      (/analyze-style)", StyleAnalyzer, iterations),
+        measure("get_provider()       (/youtube/rewrite)", lambda: get_provider("gemini"), iterations),
+    ])
+
+    print("\n[현재] lifespan 공유 인스턴스 의존성 주입")
+    with TestClient(app_module.app) as client:
+        state = client.app.state
+
+        class FakeRequest:
+            app = client.app
+
+        after = sum([
+            measure("get_repurposer()", lambda: app_module.get_repurposer(FakeRequest), iterations),
+            measure("get_style_analyzer()", lambda: app_module.get_style_analyzer(FakeRequest), iterations),
+            measure("get_llm_providers()", lambda: app_module.get_llm_providers(FakeRequest), iterations),
+        ])
+        print(f"\n앱 시작 시 1회 생성 비용(ms): {state.client_setup_ms}")
+
+    print(f"\n요청당 합계: 이전 {before:.3f}ms → 현재 {after:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+parallel(채널별 호출) vs fused(단일 호출) 변환 모드 비교
+같은 원본 콘텐츠를 두 모드로 변환하고 LLM 호출 수, 입력/출력 토큰, 소요 시간을 나란히 출력합니다.
+캐시를 끈 상태로 실행하므로 실제 Gemini 호출이 발생합니다 (GEMINI_API_KEY 필요).
+
+실행: cd backend && python benchmarks/bench_fused.py [콘텐츠 파일] [반복 횟수]
+"""
+import os
+import sys
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cache import TransformCache
+from repurposer import ContentRepurposer
+from prompts import CHANNEL_PROMPTS
+
+SAMPLE_CONTENT = """재택근무 3년 차, 생산성을 지키기 위해 바꾼 다섯 가지 습관을 정리했습니다.
+첫째, 출근 시간과 퇴근 시간을 정해두고 알람으로 강제합니다. 집이 곧 회사가 되면 일이 끝나지 않기 때문입니다.
+둘째, 오전 두 시간은 메신저를 끄고 가장 어려운 일 하나에만 집중합니다.
+셋째, 점심 후에는 반드시 20분 산책을 합니다. 오후 졸음이 눈에 띄게 줄었습니다.
+넷째, 하루 업무를 세 줄로 회고합니다. 무엇을 했고, 무엇이 막혔고, 내일 무엇을 할지.
+다섯째, 일주일에 한 번은 카페나 공유 오피스에서 일하며 환경을 바꿉니다.
+작은 습관이지만 꾸준히 지키니 야근이 줄고 주말이 온전히 제 것이 되었습니다."""
+
+
+async def run_mode(mode: str, content: str, channels: list[str]) -> dict:
+    # 모드마다 빈 캐시로 시작해야 실제 호출 비용이 측정됨
+    repurposer = ContentRepurposer(cache=TransformCache(max_entries=0))
+    _, stats = await repurposer.atransform_with_stats(content, channels=channels, mode=mode)
+    return stats
+
+
+async def main():
+    content = SAMPLE_CONTENT
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf-8") as f:
+            content = f.read()
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    channels = list(CHANNEL_PROMPTS.keys())
+
+    print(f"=== 변환 모드 비교: 채널 {len(channels)}개, 원본 {len(content)}자, {iterations}회 ===\n")
+    print(f"{'mode':<10}{'llm_calls':>10}{'input_tok':>12}{'output_tok':>12}{'latency_ms':>12}  fallback")
+
+    for _ in range(iterations):
+        for mode in ("parallel", "fused"):
+            stats = await run_mode(mode, content, channels)
+            print(
+                f"{mode:<10}{stats['llm_calls']:>10}{stats['input_tokens']:>12}"
+                f"{stats['output_tokens']:>12}{stats['latency_ms']:>12}  {stats.get('fallback_channels', '-')}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""
+동시 요청 부하 중 이벤트 루프 응답성 측정
+실행 중인 서버에 N개의 요청을 동시에 보내면서 헬스 체크 응답 시간과
+서버가 보고하는 이벤트 루프 지연(event_loop_lag)을 함께 기록합니다.
+
+실행 예:
+    uvicorn main:app --port 8000
+    python benchmarks/bench_loop_lag.py --path /scrape --json '{"url": "https://example.com"}'
+    python benchmarks/bench_loop_lag.py --base-url http://localhost:8001 --method GET \
+        --path "/api/search?keyword=AI" --health-path /api/health
+"""
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+
+import httpx
+
+
+async def fire(client: httpx.AsyncClient, method: str, path: str, body) -> tuple[int, float]:
+    """부하 요청 1개 (상태 코드, 소요 시간)"""
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, path, json=body)
+        status = response.status_code
+    except httpx.HTTPError:
+        status = -1
+    return status, time.perf_counter() - started
+
+
+async def probe_health(client: httpx.AsyncClient, health_path: str, stop: asyncio.Event, samples: list[float]):
+    """부하가 끝날 때까지 헬스 체크를 반복하며 응답 시간 수집"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get(health_path)
+        samples.append(time.perf_counter() - started)
+        await asyncio.sleep(0.05)
+
+
+async def run(args) -> None:
+    body = json.loads(args.json) if args.json else None
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+        baseline = (await client.get(args.health_path)).json().get("event_loop_lag", {})
+
+        stop = asyncio.Event()
+        health_samples: list[float] = []
+        prober = asyncio.create_task(probe_health(client, args.health_path, stop, health_samples))
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(fire(client, args.method, args.path, body) for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        await prober
+        after = (await client.get(args.health_path)).json()
+
+    statuses: dict[int, int] = {}
+    for status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    latencies = sorted(latency for _, latency in results)
+
+    print(f"=== {args.concurrency}개 동시 요청: {args.method} {args.path} ===")
+    print(f"전체 소요: {elapsed:.2f}s, 상태 코드: {statuses}")
+    print(f"요청 지연: p50={latencies[len(latencies) // 2]:.2f}s  max={latencies[-1]:.2f}s")
+    if health_samples:
+        ordered = sorted(health_samples)
+        print(
+            f"부하 중 헬스 체크 ({len(ordered)}회): "
+            f"mean={statistics.mean(ordered) * 1000:.1f}ms  max={ordered[-1] * 1000:.1f}ms"
+        )
+    print(f"서버 이벤트 루프 지연 (부하 전): {baseline}")
+    print(f"서버 이벤트 루프 지연 (부하 후): {after.get('event_loop_lag')}")
+    print(f"executor 상태: {after.get('executors')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--method", default="POST")
+    parser.add_argument("--path", default="/scrape")
+    parser.add_argument("--json", default=None, help="요청 본문 (JSON 문자열)")
+    parser.add_argument("--health-path", default="/health")
+    parser.add_argument("--concurrency", "-n", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=120)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
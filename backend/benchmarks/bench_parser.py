@@ -0,0 +1,100 @@
+"""
+HTML 파서 엔진 비교 (soup vs selectolax)
+저장해 둔 블로그 HTML(benchmarks/fixtures)로 BlogScraper._extract_content의 파싱 시간과
+엔진별 추출 결과(제목/본문)가 기준 엔진(soup)과 같은지 확인합니다.
+파일 이름 앞부분(naver_, tistory_ 등)이 플랫폼이며, 모르는 이름은 default 선택자를 씁니다.
+
+실행: cd backend && python benchmarks/bench_parser.py [반복 횟수] [fixture 디렉터리]
+(selectolax가 설치되어 있지 않으면 soup만 측정합니다: pip install selectolax)
+"""
+import os
+import sys
+import time
+import difflib
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper import BlogScraper, PARSER_BACKENDS
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixtures(directory: str) -> list[tuple[str, str, str]]:
+    """(파일 이름, 플랫폼, HTML) 목록"""
+    fixtures = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".html"):
+            continue
+        platform = filename.split("_")[0]
+        if platform not in BlogScraper.PLATFORM_SELECTORS:
+            platform = "default"
+        with open(os.path.join(directory, filename), encoding="utf-8") as f:
+            fixtures.append((filename, platform, f.read()))
+    return fixtures
+
+
+def build_scrapers() -> dict[str, BlogScraper]:
+    """설치된 파서 엔진별 스크래퍼 (기준 엔진 soup이 첫 번째)"""
+    scrapers = {}
+    for name, backend in PARSER_BACKENDS.items():
+        try:
+            scrapers[name] = BlogScraper(parser=backend())
+        except ImportError as e:
+            print(f"[skip] {name}: {e}")
+    return scrapers
+
+
+def measure(scraper: BlogScraper, html: str, platform: str, iterations: int) -> tuple[list[float], tuple[str, str]]:
+    """_extract_content를 iterations번 실행한 시간(ms) 목록과 추출 결과"""
+    samples = []
+    result = ("", "")
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = scraper._extract_content(html, platform)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples, result
+
+
+def parity(baseline: tuple[str, str], result: tuple[str, str]) -> str:
+    """기준 엔진 결과와의 일치 여부 (본문이 다르면 줄 단위 유사도)"""
+    if result == baseline:
+        return "identical"
+    title_note = "" if result[0] == baseline[0] else " title differs"
+    ratio = difflib.SequenceMatcher(None, baseline[1].splitlines(), result[1].splitlines()).ratio()
+    return f"content {ratio:.2%}{title_note}"
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    directory = sys.argv[2] if len(sys.argv) > 2 else FIXTURES_DIR
+    fixtures = load_fixtures(directory)
+    scrapers = build_scrapers()
+    print(f"=== HTML 파서 엔진 비교 ({iterations}회, fixture {len(fixtures)}개) ===\n")
+
+    totals = {name: 0.0 for name in scrapers}
+    for filename, platform, html in fixtures:
+        print(f"{filename}  ({platform}, {len(html) / 1024:.0f}KB)")
+        baseline = None
+        baseline_mean = None
+        for name, scraper in scrapers.items():
+            samples, result = measure(scraper, html, platform, iterations)
+            mean = statistics.mean(samples)
+            p95 = statistics.quantiles(samples, n=20)[-1] if len(samples) > 1 else samples[0]
+            totals[name] += mean
+            if baseline is None:
+                baseline, baseline_mean = result, mean
+                note = f"{len(result[1])}자 (기준)"
+            else:
+                note = f"x{baseline_mean / mean:.1f}  {parity(baseline, result)}"
+            print(f"  {name:<12} mean={mean:8.2f}ms  p95={p95:8.2f}ms  {note}")
+        print()
+
+    baseline_name = next(iter(scrapers))
+    for name, total in totals.items():
+        speedup = totals[baseline_name] / total if total else 0.0
+        print(f"합계 {name:<12} {total:8.2f}ms  (x{speedup:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+스트리밍 조기 종료 검증
+저장해 둔 블로그 HTML(benchmarks/fixtures)을 조각 단위로 BoundedBody에 넣어 다운로드가 어디서 멈추는지와,
+받은 만큼만 파싱한 결과가 전체 HTML을 파싱한 결과와 같은지 확인합니다.
+결과가 하나라도 다르면 종료 코드 1로 끝납니다 (tistory_stray_close: 짝 없는 닫는 태그 회귀 사례).
+
+실행: cd backend && python benchmarks/bench_stream.py [조각 크기(바이트)] [fixture 디렉터리]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper import BlogScraper, STREAM_CHUNK_BYTES
+from bench_parser import FIXTURES_DIR, load_fixtures
+
+
+def stream(scraper: BlogScraper, html: str, platform: str, chunk_size: int) -> tuple[str, int, str]:
+    """(받은 HTML, 받은 바이트 수, 멈춘 이유) - 실제 스크랩과 같은 BoundedBody 설정 사용"""
+    raw = html.encode("utf-8")
+    body = scraper._new_body("text/html; charset=utf-8", platform)
+    for start in range(0, len(raw), chunk_size):
+        if body.feed(raw[start:start + chunk_size]):
+            break
+    return body.text(), body.size, body.stop_reason or "complete"
+
+
+def main():
+    chunk_size = int(sys.argv[1]) if len(sys.argv) > 1 else STREAM_CHUNK_BYTES
+    directory = sys.argv[2] if len(sys.argv) > 2 else FIXTURES_DIR
+    scraper = BlogScraper()
+    print(f"=== 스트리밍 조기 종료 검증 (조각 {chunk_size}B) ===\n")
+
+    failures = 0
+    for filename, platform, html in load_fixtures(directory):
+        partial, size, reason = stream(scraper, html, platform, chunk_size)
+        expected = scraper._extract_content(html, platform)
+        actual = scraper._extract_content(partial, platform)
+        same = actual == expected
+        failures += not same
+        total = len(html.encode("utf-8"))
+        note = "identical" if same else f"DIFFERENT ({len(actual[1])}자 / 전체 {len(expected[1])}자)"
+        print(f"{filename:<28} {reason:<16} {size / 1024:7.1f}KB / {total / 1024:7.1f}KB  {note}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
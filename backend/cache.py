@@ -0,0 +1,191 @@
+"""
+변환 결과 캐시
+콘텐츠 해시 기반 키로 변환 결과를 저장하는 2단 캐시 (메모리 LRU + 선택적 SQLite)
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+from dotenv import load_dotenv
+
+from metrics import CACHE_REQUESTS
+
+load_dotenv()
+
+
+class TransformCache:
+    """
+    변환 결과 캐시
+
+    - 1단계: 메모리 LRU (max_entries개까지 유지)
+    - 2단계: SQLite 디스크 캐시 (db_path 지정 시, 서버 재시작 후에도 유지)
+    두 단계 모두 ttl(초)이 지나면 만료됩니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float = 86400,
+        db_path: Optional[str] = None,
+        max_db_entries: int = 5000
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.db_path = db_path
+        self.max_db_entries = max_db_entries
+
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expired": 0
+        }
+
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS transform_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_transform_cache_accessed ON transform_cache (accessed_at)"
+            )
+            self._db.commit()
+
+    @classmethod
+    def from_env(cls) -> "TransformCache":
+        """환경변수 설정으로 캐시 생성"""
+        return cls(
+            max_entries=int(os.getenv("TRANSFORM_CACHE_SIZE", 256)),
+            ttl=float(os.getenv("TRANSFORM_CACHE_TTL", 86400)),
+            db_path=os.getenv("TRANSFORM_CACHE_DB") or None,
+            max_db_entries=int(os.getenv("TRANSFORM_CACHE_DB_SIZE", 5000))
+        )
+
+    @staticmethod
+    def make_key(**parts) -> str:
+        """키 구성 요소(콘텐츠, 채널, 프롬프트, 설정 등)의 SHA-256 해시"""
+        raw = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 or self._db is not None
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시 조회 (없거나 만료되었으면 None)"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if now - created_at <= self.ttl:
+                    self._memory.move_to_end(key)
+                    self._counters["hits"] += 1
+                    self._counters["memory_hits"] += 1
+                    CACHE_REQUESTS.inc(cache="transform", result="memory_hit")
+                    return value
+                del self._memory[key]
+                self._counters["expired"] += 1
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, created_at FROM transform_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value, created_at = row
+                    if now - created_at <= self.ttl:
+                        self._db.execute(
+                            "UPDATE transform_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                        )
+                        self._db.commit()
+                        self._remember(key, created_at, value)
+                        self._counters["hits"] += 1
+                        self._counters["disk_hits"] += 1
+                        CACHE_REQUESTS.inc(cache="transform", result="disk_hit")
+                        return value
+                    self._db.execute("DELETE FROM transform_cache WHERE key = ?", (key,))
+                    self._db.commit()
+                    self._counters["expired"] += 1
+
+            self._counters["misses"] += 1
+            CACHE_REQUESTS.inc(cache="transform", result="miss")
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """캐시 저장"""
+        if not self.enabled:
+            return
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            self._counters["sets"] += 1
+
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO transform_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, value, now, now)
+                )
+                # 용량 초과 시 가장 오래 사용되지 않은 항목부터 삭제
+                overflow = self._db.execute("SELECT COUNT(*) FROM transform_cache").fetchone()[0] - self.max_db_entries
+                if overflow > 0:
+                    self._db.execute(
+                        "DELETE FROM transform_cache WHERE key IN "
+                        "(SELECT key FROM transform_cache ORDER BY accessed_at ASC LIMIT ?)",
+                        (overflow,)
+                    )
+                    self._counters["evictions"] += overflow
+                self._db.commit()
+
+    def _remember(self, key: str, created_at: float, value: str) -> None:
+        """메모리 LRU에 저장 (락을 잡은 상태에서 호출)"""
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM transform_cache")
+                self._db.commit()
+
+    def stats(self) -> dict:
+        """캐시 적중률 및 크기 통계"""
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            disk_entries = None
+            if self._db is not None:
+                disk_entries = self._db.execute("SELECT COUNT(*) FROM transform_cache").fetchone()[0]
+            return {
+                **self._counters,
+                "hit_rate": round(self._counters["hits"] / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "disk_entries": disk_entries,
+                "max_disk_entries": self.max_db_entries if self._db is not None else None,
+                "ttl": self.ttl
+            }
+
+
+# 프로세스 전역 변환 캐시
+transform_cache = TransformCache.from_env()
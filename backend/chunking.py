@@ -0,0 +1,65 @@
+"""
+긴 텍스트 분할 유틸리티
+단락(줄) 경계를 지키며 텍스트를 일정 길이 이하의 조각으로 나눕니다.
+"""
+import re
+
+# 한 단락이 조각 크기보다 길 때 문장 경계로 나눔
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+")
+
+
+def _split_long(paragraph: str, max_chars: int) -> list[str]:
+    """조각 크기를 넘는 단락을 문장 경계로, 그래도 길면 글자 수로 자름"""
+    pieces = []
+    current = ""
+    for sentence in filter(None, _SENTENCE_END.split(paragraph)):
+        while len(sentence) > max_chars:
+            pieces.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_paragraphs(text: str, max_chars: int) -> list[str]:
+    """
+    단락 경계로 텍스트를 max_chars 이하 조각으로 분할
+
+    이어지는 단락은 max_chars를 넘지 않는 한 한 조각으로 묶습니다.
+    """
+    chunks = []
+    current: list[str] = []
+    size = 0
+    for paragraph in (line.strip() for line in text.split("\n")):
+        if not paragraph:
+            continue
+        parts = [paragraph] if len(paragraph) <= max_chars else _split_long(paragraph, max_chars)
+        for part in parts:
+            if current and size + 1 + len(part) > max_chars:
+                chunks.append("\n".join(current))
+                current, size = [], 0
+            current.append(part)
+            size += len(part) + (1 if size else 0)
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def sample_excerpt(text: str, max_chars: int) -> str:
+    """
+    긴 글에서 앞/중간/끝 부분을 단락 단위로 골라 max_chars 이내 발췌본 생성
+
+    문체 분석처럼 요약이 아닌 원문 표현이 필요할 때, 앞부분만 자르지 않고 글 전체의 흐름을 담습니다.
+    """
+    if len(text) <= max_chars:
+        return text
+    separator = "\n...\n"
+    budget = (max_chars - 2 * len(separator)) // 3
+    chunks = split_paragraphs(text, budget)
+    picks = [chunks[0], chunks[len(chunks) // 2], chunks[-1]] if len(chunks) >= 3 else chunks
+    return separator.join(dict.fromkeys(picks))[:max_chars]
@@ -0,0 +1,211 @@
+"""
+크기 제한 스트리밍 HTML 수신
+응답 본문을 조각 단위로 받으면서 바이트 상한에 닿거나, 플랫폼 본문 컨테이너가 닫혔거나,
+본문 텍스트가 충분히 모이면 다운로드를 멈춥니다. 판단은 정규식 태그 스캔으로만 하므로
+(전체 파싱 없음) 인라인 스크립트가 가득한 수 MB 페이지도 메모리/CPU 사용량이 제한됩니다.
+"""
+import re
+import codecs
+from typing import Callable, Optional
+
+# 태그/주석 시작 토큰 (주석, script/style 안의 '<'는 태그로 보지 않음)
+_TOKEN = re.compile(r"<!--|<(/?)([a-zA-Z][^\s/>]*)([^>]*)>")
+_RAW_END = {
+    "!--": re.compile(r"-->"),
+    "script": re.compile(r"</script\s*>", re.IGNORECASE),
+    "style": re.compile(r"</style\s*>", re.IGNORECASE),
+}
+_VOID_TAGS = frozenset(("area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"))
+_SIMPLE_SELECTOR = re.compile(r"^([a-zA-Z][\w-]*)?(?:([.#])([\w-]+))?$")
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?([\w-]+)""", re.IGNORECASE)
+_CONTENT_TYPE_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w-]+)", re.IGNORECASE)
+
+# '>'가 끝내 오지 않는 '<' 뒤의 텍스트를 다음 조각까지 보관하는 최대 길이
+_MAX_PENDING = 4096
+# 본문 컨테이너로 인정하는 최소 텍스트 길이 (HTMLParserBackend.extract의 기준과 같음)
+_MIN_CONTAINER_CHARS = 100
+
+
+def compile_selector(selector: str) -> Optional[Callable[[str, str], bool]]:
+    """
+    tag / .class / #id / tag.class 형태의 단순 선택자를 (태그 이름, 속성 문자열) 판별 함수로 변환
+
+    속성 선택자 등 지원하지 않는 형태면 None (조기 종료 없이 바이트 상한만 적용)
+    """
+    match = _SIMPLE_SELECTOR.match(selector.strip())
+    if not match or not any(match.groups()):
+        return None
+    tag, kind, name = match.groups()
+    tag = tag.lower() if tag else None
+    attribute = {".": "class", "#": "id"}.get(kind)
+    pattern = re.compile(rf"""(?<![\w-]){attribute}\s*=\s*["']?([^"'>]*)""", re.IGNORECASE) if attribute else None
+
+    def matches(tag_name: str, attrs: str) -> bool:
+        if tag and tag_name != tag:
+            return False
+        if pattern is None:
+            return True
+        if name not in attrs:
+            return False
+        found = pattern.search(attrs)
+        return bool(found) and name in found.group(1).split()
+
+    return matches
+
+
+class ContentBoundaryScanner:
+    """
+    스트리밍 중 본문 컨테이너 경계 감지
+
+    추출할 때 처음 시도할 선택자에 맞는 첫 요소를 추적해
+    - 컨테이너가 닫혔고 텍스트가 충분하면 "container_closed"
+    - 컨테이너 텍스트가 max_chars 이상 모이면 "enough_text"
+    를 stop_reason에 기록합니다. 컨테이너 안에서 열린 태그 이름을 쌓아 두고, 닫는 태그가
+    마지막으로 열린 태그와 다르면 (짝 없는 닫는 태그, 생략된 닫는 태그) 컨테이너 끝을 알 수 없고,
+    첫 요소가 짧게 끝나면 파서가 다른 선택자를 쓸 수 있으므로 조기 종료를 포기합니다.
+    """
+
+    def __init__(self, selector: str, max_chars: int):
+        self._matches = compile_selector(selector)
+        self.max_chars = max_chars
+        self.stop_reason: Optional[str] = None
+        self.text_chars = 0
+        self._pending = ""
+        self._raw_end: Optional[re.Pattern] = None
+        self._open: list[str] = []  # 컨테이너와 그 안에서 열린 태그 이름 (비어 있으면 컨테이너 밖)
+
+    @property
+    def active(self) -> bool:
+        return self._matches is not None and self.stop_reason is None
+
+    def feed(self, text: str) -> bool:
+        """디코딩된 조각 처리. 다운로드를 멈춰도 되면 True"""
+        if not self.active:
+            return self.stop_reason is not None
+        data = self._pending + text
+        self._pending = ""
+        pos = 0
+        while self.active:
+            if self._raw_end is not None:
+                end = self._raw_end.search(data, pos)
+                if end is None:
+                    # 닫는 토큰이 조각 경계에 걸쳤을 수 있으므로 끝부분만 보관
+                    self._pending = data[-16:]
+                    return False
+                pos = end.end()
+                self._raw_end = None
+                continue
+
+            token = _TOKEN.search(data, pos)
+            if token is None:
+                pending_start = data.find("<", pos)
+                if pending_start == -1 or len(data) - pending_start > _MAX_PENDING:
+                    self._text(data[pos:])
+                else:
+                    self._text(data[pos:pending_start])
+                    self._pending = data[pending_start:]
+                return False
+
+            self._text(data[pos:token.start()])
+            pos = token.end()
+            if token.group(0) == "<!--":
+                self._raw_end = _RAW_END["!--"]
+                continue
+            closing, name, attrs = token.group(1), token.group(2).lower(), token.group(3)
+            if name in ("script", "style") and not closing:
+                self._raw_end = _RAW_END[name]
+            elif closing:
+                self._end(name)
+            elif not attrs.endswith("/"):
+                self._start(name, attrs)
+        return True
+
+    def _start(self, name: str, attrs: str) -> None:
+        if self._open:
+            if name not in _VOID_TAGS:
+                self._open.append(name)
+        elif self._matches(name, attrs):
+            self._open.append(name)
+
+    def _end(self, name: str) -> None:
+        if not self._open or name in _VOID_TAGS:
+            return
+        if name != self._open[-1]:
+            # 태그 짝이 어긋남 (생략된 닫는 태그, 짝 없는 닫는 태그) → 컨테이너 끝을 알 수 없으니 끝까지 받음
+            self._matches = None
+            return
+        self._open.pop()
+        if self._open:
+            return
+        if self.text_chars > _MIN_CONTAINER_CHARS:
+            self.stop_reason = "container_closed"
+        else:
+            # 짧은 첫 요소 → 다른 선택자가 쓰일 수 있으니 끝까지 받음
+            self._matches = None
+
+    def _text(self, text: str) -> None:
+        if not self._open:
+            return
+        length = len(text.strip())
+        if length:
+            self.text_chars += length + 1
+            if self.text_chars >= self.max_chars:
+                self.stop_reason = "enough_text"
+
+
+def charset_from_content_type(content_type: Optional[str]) -> Optional[str]:
+    match = _CONTENT_TYPE_CHARSET.search(content_type or "")
+    return match.group(1) if match else None
+
+
+class BoundedBody:
+    """
+    바이트 상한과 조기 종료를 적용하며 응답 본문 조각을 모으는 버퍼
+
+    인코딩은 Content-Type의 charset, 없으면 첫 조각의 <meta charset>, 둘 다 없으면 UTF-8입니다.
+    """
+
+    def __init__(self, max_bytes: int, content_type: Optional[str] = None, scanner: Optional[ContentBoundaryScanner] = None):
+        self.max_bytes = max_bytes
+        self.scanner = scanner
+        self.size = 0
+        self.stop_reason: Optional[str] = None
+        self._encoding = charset_from_content_type(content_type)
+        self._decoder = None
+        self._parts: list[str] = []
+
+    def _start_decoder(self, first_chunk: bytes) -> None:
+        encoding = self._encoding
+        if encoding is None:
+            match = _META_CHARSET.search(first_chunk[:4096])
+            encoding = match.group(1).decode("ascii", "ignore") if match else "utf-8"
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = "utf-8"
+        self._encoding = encoding
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+    def feed(self, chunk: bytes) -> bool:
+        """조각 추가. 더 받지 않아도 되면 True"""
+        if self.stop_reason is not None:
+            return True
+        if self._decoder is None:
+            self._start_decoder(chunk)
+        remaining = self.max_bytes - self.size
+        if len(chunk) >= remaining:
+            chunk = chunk[:remaining]
+            self.stop_reason = "byte_cap"
+        self.size += len(chunk)
+        text = self._decoder.decode(chunk)
+        self._parts.append(text)
+        if self.scanner is not None and self.scanner.feed(text) and self.stop_reason is None:
+            self.stop_reason = self.scanner.stop_reason
+        return self.stop_reason is not None
+
+    def text(self) -> str:
+        """받은 만큼의 HTML"""
+        if self._decoder is not None:
+            self._parts.append(self._decoder.decode(b"", final=True))
+            self._decoder = None
+        return "".join(self._parts)
@@ -0,0 +1,150 @@
+"""
+공유 비동기 HTTP 클라이언트
+프로세스 전체가 httpx.AsyncClient 하나를 재사용해 호스트별 keep-alive 커넥션을 공유하므로
+같은 블로그 호스트를 다시 스크랩할 때 TCP/TLS 핸드셰이크를 건너뜁니다.
+h2 패키지가 설치되어 있으면 HTTP/2로 한 커넥션에서 여러 요청을 동시에 보냅니다.
+"""
+import os
+import asyncio
+import importlib.util
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from urllib.parse import urlparse
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# HTTP/2 사용 여부 (h2 패키지가 없으면 HTTP/1.1 keep-alive만 사용)
+HTTP2_ENABLED = (
+    os.getenv("SCRAPE_HTTP2", "1") not in ("0", "false", "False")
+    and importlib.util.find_spec("h2") is not None
+)
+# 전체/keep-alive 커넥션 수, 유휴 커넥션 유지 시간(초)
+MAX_CONNECTIONS = int(os.getenv("SCRAPE_MAX_CONNECTIONS", 100))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("SCRAPE_MAX_KEEPALIVE", 20))
+KEEPALIVE_EXPIRY = float(os.getenv("SCRAPE_KEEPALIVE_EXPIRY", 30))
+# 호스트 하나에 동시에 보내는 최대 요청 수 (대상 블로그 서버 보호)
+MAX_PER_HOST = int(os.getenv("SCRAPE_MAX_PER_HOST", 6))
+REQUEST_TIMEOUT = float(os.getenv("SCRAPE_TIMEOUT", 10))
+# 세마포어/통계를 보관하는 최대 호스트 수 (넘으면 요청 중이 아닌 가장 오래 쓰지 않은 호스트부터 제거)
+MAX_TRACKED_HOSTS = int(os.getenv("SCRAPE_MAX_TRACKED_HOSTS", 256))
+# /health에 보여주는 호스트 수 (요청 수가 많은 순)
+STATS_MAX_HOSTS = int(os.getenv("SCRAPE_STATS_MAX_HOSTS", 20))
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+# 클라이언트와 호스트별 세마포어는 만든 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_host_slots: OrderedDict[str, asyncio.Semaphore] = OrderedDict()
+_host_stats: OrderedDict[str, dict] = OrderedDict()
+_evicted_hosts = 0
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프의 공유 AsyncClient 반환 (없으면 생성)"""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_ENABLED,
+            headers=DEFAULT_HEADERS,
+            timeout=REQUEST_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            )
+        )
+        _client_loop = loop
+        _host_slots.clear()
+    return _client
+
+
+def _host_state(host: str) -> tuple[asyncio.Semaphore, dict]:
+    """호스트의 세마포어와 통계 (최근 사용으로 표시하고, 한도를 넘으면 유휴 호스트 정리)"""
+    global _evicted_hosts
+    slots = _host_slots.get(host)
+    if slots is None:
+        slots = _host_slots[host] = asyncio.Semaphore(max(1, MAX_PER_HOST))
+    stats = _host_stats.get(host)
+    if stats is None:
+        stats = _host_stats[host] = {"requests": 0, "errors": 0, "in_flight": 0, "http_versions": {}}
+    _host_slots.move_to_end(host)
+    _host_stats.move_to_end(host)
+
+    # 요청 중이거나 차례를 기다리는 호스트는 세마포어를 공유해야 하므로 남겨 둠
+    if len(_host_stats) > MAX_TRACKED_HOSTS:
+        for name in list(_host_stats):
+            if len(_host_stats) <= MAX_TRACKED_HOSTS:
+                break
+            name_slots = _host_slots.get(name)
+            if name == host or _host_stats[name]["in_flight"] or (name_slots is not None and name_slots.locked()):
+                continue
+            del _host_stats[name]
+            _host_slots.pop(name, None)
+            _evicted_hosts += 1
+    return slots, stats
+
+
+@asynccontextmanager
+async def open_stream(url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+    """
+    공유 클라이언트로 스트리밍 GET 요청 (호스트별 동시 요청 수 제한)
+
+    본문은 with 블록 안에서 aiter_bytes()로 필요한 만큼만 읽습니다.
+    상태 코드 확인은 호출하는 쪽에서 합니다.
+    """
+    client = get_http_client()
+    host = urlparse(url).netloc.lower()
+    slots, stats = _host_state(host)
+    async with slots:
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        try:
+            async with client.stream("GET", url, **kwargs) as response:
+                versions = stats["http_versions"]
+                versions[response.http_version] = versions.get(response.http_version, 0) + 1
+                yield response
+        except httpx.HTTPError:
+            stats["errors"] += 1
+            raise
+        finally:
+            stats["in_flight"] -= 1
+
+
+async def fetch(url: str, **kwargs) -> httpx.Response:
+    """공유 클라이언트로 GET 요청 (본문 전체 수신)"""
+    async with open_stream(url, **kwargs) as response:
+        await response.aread()
+    return response
+
+
+async def aclose_http_client() -> None:
+    """공유 클라이언트의 커넥션 풀 정리 (앱 종료 시)"""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+    _host_slots.clear()
+
+
+def http_client_stats() -> dict:
+    """HTTP/2 사용 여부, 커넥션 한도, 호스트별 요청 수 (요청 수가 많은 STATS_MAX_HOSTS개 호스트만)"""
+    busiest = sorted(_host_stats.items(), key=lambda item: item[1]["requests"], reverse=True)[:STATS_MAX_HOSTS]
+    return {
+        "http2": HTTP2_ENABLED,
+        "max_connections": MAX_CONNECTIONS,
+        "max_keepalive_connections": MAX_KEEPALIVE_CONNECTIONS,
+        "max_per_host": MAX_PER_HOST,
+        "tracked_hosts": len(_host_stats),
+        "evicted_hosts": _evicted_hosts,
+        "hosts": {host: {**stats, "http_versions": dict(stats["http_versions"])} for host, stats in busiest}
+    }
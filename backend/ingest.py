@@ -0,0 +1,399 @@
+"""
+블로그 증분 수집 (RSS / Atom / 사이트맵)
+블로그 주소에서 피드나 사이트맵을 찾아 글 목록을 만들고, 글마다 본문 해시와 피드의 변경 신호
+(lastmod / updated / pubDate, 피드에 실린 요약 해시)를 SQLite에 저장합니다.
+다음 실행에서는 새 글과 신호가 바뀐 글만 가져와 다시 추출하고, 피드 자체가 304이면 글 요청을 하지 않습니다.
+"""
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+import xml.etree.ElementTree as ElementTree
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+from urllib.parse import urlparse, parse_qs
+from dotenv import load_dotenv
+
+import httpx
+
+from http_client import fetch
+from scraper import resolve_naver_post_url
+from scrape_cache import normalize_url
+from batch import stream_scrape_batch, SCRAPE_BATCH_MAX_URLS
+
+load_dotenv()
+
+INGEST_DB = os.getenv("INGEST_DB", "ingest.db")
+# 한 번에 수집하는 최대 글 수 (피드/사이트맵 순서상 앞쪽부터)
+INGEST_MAX_POSTS = int(os.getenv("INGEST_MAX_POSTS", 200))
+# 사이트맵 인덱스에서 따라가는 최대 하위 사이트맵 수
+INGEST_MAX_SITEMAPS = int(os.getenv("INGEST_MAX_SITEMAPS", 10))
+
+_NAVER_BLOG_ID = re.compile(r"^/([A-Za-z0-9_-]+)")
+# 사이트맵에서 글로 인정하는 경로 (카테고리/태그/페이지 목록 제외)
+_POST_PATHS = {
+    "tistory": re.compile(r"^/(?:entry/.+|\d+)/?$"),
+    "naver": re.compile(r"^/[A-Za-z0-9_-]+/\d+/?$"),
+}
+
+
+@dataclass
+class FeedEntry:
+    """피드/사이트맵에서 찾은 글 하나"""
+    url: str
+    title: Optional[str] = None
+    updated: Optional[str] = None  # lastmod / updated / pubDate 원문
+    digest: Optional[str] = None  # 피드에 실린 요약/본문의 해시
+
+    @property
+    def key(self) -> str:
+        """저장소 키 (네이버는 주소 형태가 달라도 같은 글이면 같은 키)"""
+        return normalize_url(resolve_naver_post_url(self.url, view="mobile") or self.url)
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _local_name(tag: str) -> str:
+    """XML 네임스페이스를 뗀 태그 이름"""
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+def _child_text(element, *names: str) -> Optional[str]:
+    """names 중 처음 나오는 자식 요소의 텍스트"""
+    for child in element:
+        if _local_name(child.tag) in names and child.text and child.text.strip():
+            return child.text.strip()
+    return None
+
+
+def feed_candidates(blog_url: str) -> list[str]:
+    """
+    블로그 주소에서 시도할 피드/사이트맵 주소 (우선순위 순)
+
+    피드나 사이트맵 주소를 직접 주면 그 주소만 사용합니다.
+    """
+    parsed = urlparse(blog_url.strip())
+    host = parsed.netloc.lower()
+    path = parsed.path.lower()
+    if path.endswith(".xml") or path.rstrip("/").endswith(("/rss", "/feed", "/atom")):
+        return [blog_url.strip()]
+
+    origin = f"{parsed.scheme or 'https'}://{host}"
+    if host in ("blog.naver.com", "m.blog.naver.com", "rss.blog.naver.com"):
+        match = _NAVER_BLOG_ID.match(parsed.path)
+        blog_id = match.group(1) if match and match.group(1).lower() != "postview" else None
+        blog_id = blog_id or parse_qs(parsed.query).get("blogId", [None])[0]
+        return [f"https://rss.blog.naver.com/{blog_id}.xml"] if blog_id else []
+    if host.endswith("tistory.com"):
+        return [f"{origin}/rss", f"{origin}/sitemap.xml"]
+    if host == "velog.io" and parsed.path.startswith("/@"):
+        return [f"https://v2.velog.io/rss/{parsed.path[2:].split('/')[0]}"]
+    return [f"{origin}/rss", f"{origin}/feed", f"{origin}/sitemap.xml"]
+
+
+def parse_feed(xml: bytes) -> tuple[str, list[FeedEntry], list[str]]:
+    """
+    피드/사이트맵 XML 파싱
+
+    Returns:
+        (종류: rss / atom / sitemap / sitemapindex, 글 목록, 하위 사이트맵 주소 목록)
+    """
+    root = ElementTree.fromstring(xml)
+    kind = _local_name(root.tag)
+    entries: list[FeedEntry] = []
+    sitemaps: list[str] = []
+
+    if kind == "rss":
+        for item in root.iter():
+            if _local_name(item.tag) != "item":
+                continue
+            link = _child_text(item, "link") or _child_text(item, "guid")
+            body = _child_text(item, "encoded", "description")
+            if link:
+                entries.append(FeedEntry(
+                    url=link,
+                    title=_child_text(item, "title"),
+                    updated=_child_text(item, "updated", "pubdate", "date"),
+                    digest=_sha256(body) if body else None
+                ))
+    elif kind == "feed":
+        kind = "atom"
+        for item in root:
+            if _local_name(item.tag) != "entry":
+                continue
+            link = next(
+                (child.get("href") for child in item
+                 if _local_name(child.tag) == "link" and child.get("rel", "alternate") == "alternate"),
+                None
+            )
+            body = _child_text(item, "content", "summary")
+            if link:
+                entries.append(FeedEntry(
+                    url=link,
+                    title=_child_text(item, "title"),
+                    updated=_child_text(item, "updated", "published"),
+                    digest=_sha256(body) if body else None
+                ))
+    elif kind in ("urlset", "sitemapindex"):
+        for item in root:
+            location = _child_text(item, "loc")
+            if not location:
+                continue
+            if kind == "sitemapindex":
+                sitemaps.append(location)
+            else:
+                entries.append(FeedEntry(url=location, updated=_child_text(item, "lastmod")))
+        kind = "sitemap" if kind == "urlset" else kind
+    else:
+        raise ValueError(f"피드/사이트맵 형식이 아닙니다: <{kind}>")
+    return kind, entries, sitemaps
+
+
+def _is_post(url: str) -> bool:
+    """사이트맵 항목 중 글 주소만 남김 (플랫폼 규칙이 없으면 블로그 홈만 제외)"""
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    platform = "naver" if host.endswith("blog.naver.com") else "tistory" if host.endswith("tistory.com") else None
+    path = parsed.path
+    pattern = _POST_PATHS.get(platform)
+    return bool(pattern.match(path)) if pattern else path.strip("/") != ""
+
+
+class IngestStore:
+    """피드 검증자와 글별 본문 해시/변경 신호를 저장하는 SQLite 저장소"""
+
+    def __init__(self, db_path: str = INGEST_DB):
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS ingest_feeds (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                checked_at REAL NOT NULL
+            )"""
+        )
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS ingest_posts (
+                key TEXT PRIMARY KEY,
+                feed_url TEXT NOT NULL,
+                url TEXT NOT NULL,
+                title TEXT,
+                content TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                updated TEXT,
+                digest TEXT,
+                ingested_at REAL NOT NULL,
+                checked_at REAL NOT NULL
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_ingest_posts_feed ON ingest_posts (feed_url)")
+        self._db.commit()
+
+    def feed_headers(self, feed_url: str) -> dict:
+        """피드 재검증 요청 헤더 (저장된 검증자가 없으면 빈 dict)"""
+        with self._lock:
+            row = self._db.execute("SELECT etag, last_modified FROM ingest_feeds WHERE url = ?", (feed_url,)).fetchone()
+        headers = {}
+        if row is not None and row["etag"]:
+            headers["If-None-Match"] = row["etag"]
+        if row is not None and row["last_modified"]:
+            headers["If-Modified-Since"] = row["last_modified"]
+        return headers
+
+    def save_feed(self, feed_url: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO ingest_feeds (url, etag, last_modified, checked_at) VALUES (?, ?, ?, ?)",
+                (feed_url, etag, last_modified, time.time())
+            )
+            self._db.commit()
+
+    def get_posts(self, keys: list[str]) -> dict[str, dict]:
+        """키 → 저장된 글 (본문 제외)"""
+        found = {}
+        with self._lock:
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = self._db.execute(
+                    f"SELECT key, url, title, content_hash, updated, digest FROM ingest_posts WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                found.update((row["key"], dict(row)) for row in rows)
+        return found
+
+    def save_post(self, feed_url: str, entry: FeedEntry, title: str, content: str, content_hash: str, changed: bool) -> None:
+        """가져온 글 저장 (본문이 같으면 ingested_at은 그대로 두고 변경 신호만 갱신)"""
+        now = time.time()
+        with self._lock:
+            if changed:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO ingest_posts "
+                    "(key, feed_url, url, title, content, content_hash, updated, digest, ingested_at, checked_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (entry.key, feed_url, entry.url, title, content, content_hash, entry.updated, entry.digest, now, now)
+                )
+            else:
+                self._db.execute(
+                    "UPDATE ingest_posts SET updated = ?, digest = ?, checked_at = ? WHERE key = ?",
+                    (entry.updated, entry.digest, now, entry.key)
+                )
+            self._db.commit()
+
+    def posts(self, feed_url: str) -> list[dict]:
+        """피드 하나에서 수집한 글 전체 (최근 수집 순)"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT url, title, content, content_hash, updated, ingested_at, checked_at "
+                "FROM ingest_posts WHERE feed_url = ? ORDER BY ingested_at DESC",
+                (feed_url,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def _needs_fetch(entry: FeedEntry, stored: Optional[dict]) -> bool:
+    """새 글이거나 변경 신호가 바뀌었거나 신호가 없어 판단할 수 없으면 True"""
+    if stored is None:
+        return True
+    if entry.updated is None and entry.digest is None:
+        return True
+    return entry.updated != stored["updated"] or entry.digest != stored["digest"]
+
+
+async def discover(store: IngestStore, blog_url: str, force: bool = False) -> tuple[str, str, Optional[httpx.Response], list[FeedEntry]]:
+    """
+    피드/사이트맵을 찾아 글 목록 생성
+
+    Returns:
+        (피드 주소, 종류, 피드 응답, 글 목록). 저장된 검증자로 304를 받으면 종류는 "not_modified", 글 목록은 빈 목록
+    """
+    errors = []
+    for feed_url in feed_candidates(blog_url):
+        try:
+            response = await fetch(feed_url, headers={} if force else store.feed_headers(feed_url))
+            if response.status_code == 304:
+                return feed_url, "not_modified", response, []
+            response.raise_for_status()
+            kind, entries, sitemaps = parse_feed(response.content)
+        except (httpx.HTTPError, ElementTree.ParseError, ValueError) as e:
+            errors.append(f"{feed_url}: {e}")
+            continue
+
+        # 사이트맵 인덱스는 하위 사이트맵을 따라가며 글 주소를 모음 (검증자는 인덱스 기준으로만 저장)
+        for sitemap_url in sitemaps[:INGEST_MAX_SITEMAPS]:
+            if len(entries) >= INGEST_MAX_POSTS:
+                break
+            try:
+                child = await fetch(sitemap_url)
+                child.raise_for_status()
+                entries.extend(parse_feed(child.content)[1])
+            except (httpx.HTTPError, ElementTree.ParseError, ValueError) as e:
+                errors.append(f"{sitemap_url}: {e}")
+        if kind in ("sitemap", "sitemapindex"):
+            entries = [entry for entry in entries if _is_post(entry.url)]
+        if entries:
+            return feed_url, kind, response, entries
+        errors.append(f"{feed_url}: 글이 없습니다.")
+
+    detail = "; ".join(errors) if errors else "지원하지 않는 블로그 주소입니다."
+    raise ValueError(f"피드/사이트맵을 찾을 수 없습니다. ({detail})")
+
+
+async def stream_ingest(
+    scraper,
+    store: IngestStore,
+    blog_url: str,
+    max_posts: Optional[int] = None,
+    force: bool = False,
+    max_concurrency: Optional[int] = None
+) -> AsyncIterator[dict]:
+    """
+    블로그 증분 수집 이벤트 생성
+
+    새 글과 변경 신호가 바뀐 글만 stream_scrape_batch로 (호스트별 간격을 지키며) 가져오고,
+    본문 해시를 저장된 해시와 비교해 new / changed / unchanged로 구분합니다.
+    force=True면 피드 검증자와 변경 신호를 무시하고 모든 글을 다시 가져옵니다.
+    max_posts는 INGEST_MAX_POSTS(와 SCRAPE_BATCH_MAX_URLS)를 넘을 수 없습니다.
+
+    이벤트 (step):
+        discovered - 피드 주소/종류, 글 수, 가져올 글 수, 글 수 제한으로 잘렸는지 (truncated)
+        post       - 새 글/바뀐 글 (본문 포함) 또는 가져왔지만 본문이 같은 글 (status: unchanged)
+        error      - 글 하나의 실패
+        done       - 전체 요약
+    """
+    started = time.perf_counter()
+    feed_url, kind, response, entries = await discover(store, blog_url, force)
+
+    # 같은 글이 여러 번 나오면 첫 항목만 사용 (피드는 최신 글이 앞쪽)
+    unique: dict[str, FeedEntry] = {}
+    for entry in entries:
+        unique.setdefault(entry.key, entry)
+    # 요청 값은 서버 설정을 넘지 못하게 제한
+    limit = max(1, min(max_posts or INGEST_MAX_POSTS, INGEST_MAX_POSTS, SCRAPE_BATCH_MAX_URLS))
+    truncated = len(unique) > limit
+    entries = list(unique.values())[:limit]
+
+    stored = store.get_posts([entry.key for entry in entries])
+    to_fetch = [entry for entry in entries if force or _needs_fetch(entry, stored.get(entry.key))]
+    yield {
+        "step": "discovered",
+        "feed_url": feed_url,
+        "kind": kind,
+        "posts": len(entries),
+        "to_fetch": len(to_fetch),
+        "truncated": truncated
+    }
+
+    counts = {"new": 0, "changed": 0, "unchanged": 0, "failed": 0}
+    if to_fetch:
+        # 변경 신호가 바뀐 글은 스크랩 캐시 TTL 안이라도 서버에 확인해야 수정 내용을 놓치지 않음
+        urls = [entry.url for entry in to_fetch]
+        async for event in stream_scrape_batch(scraper, urls, max_concurrency=max_concurrency, revalidate=True):
+            if event["step"] == "error":
+                counts["failed"] += 1
+                yield {"step": "error", "url": event["url"], "message": event["message"]}
+                continue
+            if event["step"] != "result":
+                continue
+
+            entry = to_fetch[event["index"]]
+            content_hash = _sha256(event["content"])
+            previous = stored.get(entry.key)
+            if previous is None:
+                status = "new"
+            elif previous["content_hash"] != content_hash:
+                status = "changed"
+            else:
+                status = "unchanged"
+            counts[status] += 1
+            store.save_post(feed_url, entry, event["title"], event["content"], content_hash, changed=status != "unchanged")
+
+            post = {"step": "post", "status": status, "url": entry.url, "content_hash": content_hash}
+            if status != "unchanged":
+                post.update(title=event["title"], content=event["content"], source=event["source"], char_count=event["char_count"])
+            yield post
+
+    # 실패한 글이 있거나 글 수 제한으로 일부만 처리했으면 다음 실행에서 피드 304로 나머지를
+    # 건너뛰지 않도록 검증자를 저장하지 않음
+    if response is not None and kind != "not_modified" and not counts["failed"] and not truncated:
+        store.save_feed(feed_url, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+    yield {
+        "step": "done",
+        "feed_url": feed_url,
+        "posts": len(entries),
+        "skipped": len(entries) - len(to_fetch),
+        **counts,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 1)
+    }
@@ -0,0 +1,292 @@
+"""
+변환 작업 큐
+POST /jobs/transform 요청을 즉시 접수하고, 워커 풀에서 스크랩 → 변환 → 캘린더 파이프라인을 실행합니다.
+작업 상태와 채널별 중간 결과는 SQLite에 저장되어 서버가 재시작되어도 조회/재개할 수 있습니다.
+"""
+import os
+import json
+import time
+import uuid
+import sqlite3
+import asyncio
+import threading
+from typing import Optional
+from dotenv import load_dotenv
+
+from repurposer import TransformedContent
+from usage import current_endpoint
+
+load_dotenv()
+
+JOBS_DB = os.getenv("JOBS_DB", "jobs.db")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", 2))
+JOB_RETENTION_SECONDS = float(os.getenv("JOB_RETENTION_SECONDS", 86400))
+# 보관 기간이 지난 작업을 정리하는 주기(초)
+JOB_PURGE_INTERVAL = float(os.getenv("JOB_PURGE_INTERVAL", 3600))
+
+# 작업 상태
+QUEUED = "queued"
+SCRAPING = "scraping"
+TRANSFORMING = "transforming"
+CALENDAR = "calendar"
+COMPLETED = "completed"
+FAILED = "failed"
+UNFINISHED = (QUEUED, SCRAPING, TRANSFORMING, CALENDAR)
+
+
+def _result_dict(result: TransformedContent) -> dict:
+    """작업에 저장하는 채널 결과"""
+    return {
+        "channel": result.channel,
+        "channel_name": result.channel_name,
+        "content": result.content,
+        "char_count": len(result.content),
+        "cached": result.cached,
+        "near_duplicate": result.near_duplicate,
+        "similarity": result.similarity
+    }
+
+
+class JobStore:
+    """SQLite 기반 작업 상태 저장소"""
+
+    JSON_FIELDS = ("request", "progress", "results")
+
+    def __init__(self, db_path: str = JOBS_DB):
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                request TEXT NOT NULL,
+                progress TEXT NOT NULL,
+                results TEXT NOT NULL,
+                calendar TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)")
+        self._db.commit()
+
+    def create(self, request: dict) -> str:
+        """새 작업 등록 후 작업 ID 반환"""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        progress = {channel: "pending" for channel in request["channels"]}
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO jobs (id, status, request, progress, results, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, QUEUED, json.dumps(request, ensure_ascii=False), json.dumps(progress), "{}", now, now)
+            )
+            self._db.commit()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """작업 조회 (없으면 None)"""
+        with self._lock:
+            row = self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        for field in self.JSON_FIELDS:
+            job[field] = json.loads(job[field])
+        return job
+
+    def update(self, job_id: str, **fields) -> None:
+        """작업 필드 갱신 (progress/results/request는 dict로 전달)"""
+        for field in self.JSON_FIELDS:
+            if field in fields:
+                fields[field] = json.dumps(fields[field], ensure_ascii=False)
+        fields["updated_at"] = time.time()
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._db.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+            self._db.commit()
+
+    def unfinished_ids(self) -> list[str]:
+        """완료되지 않은 작업 ID (생성 순서)"""
+        placeholders = ", ".join("?" for _ in UNFINISHED)
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT id FROM jobs WHERE status IN ({placeholders}) ORDER BY created_at", UNFINISHED
+            ).fetchall()
+        return [row["id"] for row in rows]
+
+    def purge(self, retention: float = JOB_RETENTION_SECONDS) -> int:
+        """보관 기간이 지난 완료/실패 작업 삭제"""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (COMPLETED, FAILED, time.time() - retention)
+            )
+            self._db.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class JobManager:
+    """
+    변환 작업 워커 풀
+
+    작업마다 (URL이면) 스크랩 → 채널 변환 → 캘린더 순으로 진행하며,
+    채널 하나가 끝날 때마다 (fused 모드는 호출 한 번이 끝나면) 진행 상황과 결과를 저장합니다.
+    시작 시 완료되지 않은 작업을 다시 큐에 넣고, 이미 끝난 채널은 건너뜁니다.
+    보관 기간이 지난 작업은 JOB_PURGE_INTERVAL마다 삭제합니다.
+    """
+
+    def __init__(self, store: JobStore, repurposer, scraper, workers: int = JOB_WORKERS):
+        self.store = store
+        self.repurposer = repurposer
+        self.scraper = scraper
+        self.workers = workers
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """워커 시작 및 미완료 작업 재등록"""
+        self.store.purge()
+        for job_id in self.store.unfinished_ids():
+            self.store.update(job_id, status=QUEUED)
+            self._queue.put_nowait(job_id)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(max(1, self.workers))]
+        self._tasks.append(asyncio.create_task(self._purge_loop()))
+
+    async def stop(self) -> None:
+        """워커/정리 작업 종료 (진행 중이던 작업은 다음 시작 시 재개)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, request: dict) -> str:
+        """작업 등록 후 바로 작업 ID 반환"""
+        job_id = self.store.create(request)
+        self._queue.put_nowait(job_id)
+        return job_id
+
+    async def _purge_loop(self) -> None:
+        """서버가 계속 떠 있어도 JOB_RETENTION_SECONDS가 지난 작업을 주기적으로 삭제"""
+        while True:
+            await asyncio.sleep(JOB_PURGE_INTERVAL)
+            try:
+                purged = self.store.purge()
+            except sqlite3.Error as e:
+                print(f"[jobs] 작업 정리 실패: {e}")  # Server log
+                continue
+            if purged:
+                print(f"[jobs] 보관 기간이 지난 작업 {purged}건 삭제")  # Server log
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.store.update(job_id, status=FAILED, error=str(e))
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        current_endpoint.set("job:transform")
+        job = self.store.get(job_id)
+        if job is None or job["status"] not in UNFINISHED:
+            return
+        request = job["request"]
+        progress = job["progress"]
+        results = job["results"]
+
+        # 1. URL이면 스크랩 (재개 시에는 저장해 둔 콘텐츠 사용)
+        if not request.get("content"):
+            self.store.update(job_id, status=SCRAPING)
+            scraped = await self.scraper.ascrape(request["url"])
+            request["content"] = scraped.content
+            request["title"] = scraped.title
+            self.store.update(job_id, request=request)
+
+        # 2. 남은 채널 변환 - 채널이 끝날 때마다 결과 저장
+        self.store.update(job_id, status=TRANSFORMING)
+        # 긴 원본은 채널 변환 전에 한 번만 요약 (조각 요약은 캐시되므로 재개 시 다시 호출하지 않음)
+        content, _ = await self.repurposer.acondense(request["content"])
+        fingerprint = await self.repurposer.afingerprint(content)
+        custom_prompts = request.get("custom_prompts") or {}
+        remaining = [channel for channel in request["channels"] if progress.get(channel) != "done"]
+        semaphore = asyncio.Semaphore(max(1, request.get("max_concurrency") or self.repurposer.max_concurrency))
+
+        async def run_channel(channel: str) -> None:
+            async with semaphore:
+                progress[channel] = "running"
+                self.store.update(job_id, progress=progress)
+                try:
+                    result = await self.repurposer.atransform_single_with_style(
+                        content,
+                        channel=channel,
+                        style_config=request.get("style_config"),
+                        custom_prompt=custom_prompts.get(channel),
+                        reuse_similar=request.get("reuse_similar", True),
+                        fingerprint=fingerprint
+                    )
+                except Exception as e:
+                    progress[channel] = "error"
+                    results[channel] = {"channel": channel, "error": str(e)}
+                else:
+                    progress[channel] = "done"
+                    results[channel] = _result_dict(result)
+                self.store.update(job_id, progress=progress, results=results)
+
+        async def run_fused() -> None:
+            # 남은 채널을 호출 한 번으로 변환 (JSON에서 빠진 채널은 atransform_fused가 채널별 호출로 대체)
+            for channel in remaining:
+                progress[channel] = "running"
+            self.store.update(job_id, progress=progress)
+            try:
+                fused, _ = await self.repurposer.atransform_fused(
+                    content,
+                    channels=remaining,
+                    style_config=request.get("style_config"),
+                    custom_prompts=custom_prompts,
+                    max_concurrency=request.get("max_concurrency"),
+                    reuse_similar=request.get("reuse_similar", True)
+                )
+            except Exception as e:
+                for channel in remaining:
+                    progress[channel] = "error"
+                    results[channel] = {"channel": channel, "error": str(e)}
+            else:
+                for result in fused:
+                    progress[result.channel] = "done"
+                    results[result.channel] = _result_dict(result)
+            self.store.update(job_id, progress=progress, results=results)
+
+        if remaining and request.get("mode") == "fused":
+            await run_fused()
+        else:
+            await asyncio.gather(*(run_channel(channel) for channel in remaining))
+
+        done = [results[channel] for channel in request["channels"] if progress.get(channel) == "done"]
+        if not done:
+            self.store.update(job_id, status=FAILED, error="모든 채널 변환에 실패했습니다.")
+            return
+
+        # 3. 캘린더
+        self.store.update(job_id, status=CALENDAR)
+        transformed = [
+            TransformedContent(
+                channel=item["channel"],
+                channel_name=item["channel_name"],
+                content=item["content"],
+                cached=item["cached"]
+            )
+            for item in done
+        ]
+        calendar = await self.repurposer.abuild_calendar(transformed, request.get("calendar_mode", "local"))
+        self.store.update(job_id, status=COMPLETED, calendar=calendar)
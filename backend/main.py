@@ -1,17 +1,32 @@
 """
 Content Repurposer - FastAPI Backend
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Optional
+from typing import Callable, Optional
+from contextlib import asynccontextmanager
 import os
+import time
 from dotenv import load_dotenv
 
 from repurposer import ContentRepurposer, TransformedContent
 from scraper import BlogScraper
+from http_client import aclose_http_client, http_client_stats
 from prompts import CHANNEL_PROMPTS
 from style_analyzer import StyleAnalyzer
+from cache import transform_cache
+from similarity import near_duplicate_index
+from scrape_cache import scrape_cache
+from selector_stats import selector_ranker
+from executors import run_blocking, executor_stats, shutdown_executors, loop_lag_monitor
+from jobs import JobStore, JobManager
+from batch import stream_batch, stream_scrape_batch, BATCH_MAX_DOCUMENTS, SCRAPE_BATCH_MAX_URLS
+from ingest import IngestStore, stream_ingest, feed_candidates
+from ratelimit import RateLimitExceeded, limiter_stats
+from usage import usage_tracker, current_endpoint
+import metrics
+from tracing import trace_request
 
 load_dotenv()
 
@@ -20,11 +35,64 @@ import youtube_analyzer
 from youtube_analyzer import SearchFilters
 import transcript
 import script_generator
+from providers import LLMProvider, RoutingProvider, get_provider
+
+
+def _create_client(app: FastAPI, name: str, factory: Callable):
+    """공유 클라이언트 생성 (API 키 누락 등으로 실패하면 None, 오류는 요청 시 반환)"""
+    started = time.perf_counter()
+    try:
+        client = factory()
+    except ValueError as e:
+        app.state.client_errors[name] = str(e)
+        print(f"[lifespan] {name} 생성 실패: {e}")  # Server log
+        return None
+    app.state.client_setup_ms[name] = round((time.perf_counter() - started) * 1000, 2)
+    return client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """LLM 클라이언트/스크래퍼를 앱 시작 시 한 번만 만들어 모든 요청에서 재사용"""
+    app.state.client_errors = {}
+    app.state.client_setup_ms = {}
+
+    app.state.scraper = _create_client(app, "scraper", BlogScraper)
+    app.state.repurposer = _create_client(app, "repurposer", lambda: ContentRepurposer(scraper=app.state.scraper))
+    app.state.style_analyzer = _create_client(app, "style_analyzer", StyleAnalyzer)
+    app.state.providers = {}
+    # "auto": 위 Provider들을 지연 시간/오류율로 라우팅하고 느린 요청은 헤지
+    for provider_name in ("gemini", "claude", "auto"):
+        provider = _create_client(app, f"provider:{provider_name}", lambda: get_provider(provider_name))
+        if provider is not None:
+            app.state.providers[provider_name] = provider
+
+    app.state.job_manager = None
+    if app.state.repurposer is not None:
+        app.state.job_manager = JobManager(JobStore(), app.state.repurposer, app.state.scraper)
+        await app.state.job_manager.start()
+
+    app.state.ingest_store = IngestStore()
+
+    print(f"[lifespan] 클라이언트 생성 시간(ms): {app.state.client_setup_ms}")  # Server log
+    loop_lag_monitor.start()
+    yield
+
+    await loop_lag_monitor.stop()
+    if app.state.job_manager is not None:
+        await app.state.job_manager.stop()
+        app.state.job_manager.store.close()
+    app.state.ingest_store.close()
+    shutdown_executors()
+    app.state.scraper.close()
+    await aclose_http_client()
+
 
 app = FastAPI(
     title="Content Repurposer API",
     description="콘텐츠를 여러 소셜 미디어 채널에 맞게 변환하는 API + YouTube 대본 추출",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정 (프론트엔드 연동용)
@@ -37,11 +105,38 @@ app.add_middleware(
 )
 
 
+# 라우트별 요청 지연 시간/상태 코드/동시 처리 수 기록
+app.middleware("http")(metrics.track_request)
+# 요청 구간별 시간을 Server-Timing 헤더 / JSON 추적 로그로 출력
+app.middleware("http")(trace_request)
+
+
+@app.middleware("http")
+async def track_endpoint(request: Request, call_next):
+    """LLM 사용량을 엔드포인트별로 집계할 수 있도록 현재 요청 경로 기록"""
+    current_endpoint.set(f"{request.method} {request.url.path}")
+    return await call_next(request)
+
+
 # Request/Response 모델
 class ScrapeRequest(BaseModel):
     url: str
 
 
+class ScrapeBatchRequest(BaseModel):
+    urls: list[str]
+    max_concurrency: Optional[int] = None  # 전체 동시 요청 수 (SCRAPE_BATCH_CONCURRENCY 이하로만 줄일 수 있음)
+    per_host_concurrency: Optional[int] = None  # 호스트별 동시 요청 수 (SCRAPE_BATCH_PER_HOST 이하로만 줄일 수 있음)
+    host_delay: Optional[float] = None  # 같은 호스트 요청 시작 사이 최소 간격(초) (SCRAPE_BATCH_HOST_DELAY 이상으로만 늘릴 수 있음)
+
+
+class IngestRequest(BaseModel):
+    blog_url: str  # 블로그 주소 또는 RSS/Atom/사이트맵 주소
+    max_posts: Optional[int] = None  # 최대 글 수 (기본/상한: INGEST_MAX_POSTS)
+    force: bool = False  # 변경 신호를 무시하고 모든 글 다시 수집
+    max_concurrency: Optional[int] = None
+
+
 class ScrapeResponse(BaseModel):
     title: str
     content: str
@@ -61,6 +156,10 @@ class TransformRequest(BaseModel):
     channels: list[str] = ["blog", "instagram", "threads"]
     style_config: Optional[StyleConfig] = None
     custom_prompts: Optional[dict[str, str]] = None  # 채널별 커스텀 프롬프트
+    max_concurrency: Optional[int] = None  # 동시 변환 채널 수 (기본: TRANSFORM_MAX_CONCURRENCY)
+    mode: str = "parallel"  # parallel: 채널별 동시 호출, fused: 모든 채널을 호출 한 번으로 변환
+    calendar_mode: str = "local"  # local: 규칙 기반 캘린더 (LLM 호출 없음), llm: Gemini로 생성
+    reuse_similar: bool = True  # 조금 고친 원문이면 같은 설정의 이전 변환 결과 재사용 (False면 항상 새로 변환)
 
 
 class TransformResult(BaseModel):
@@ -68,11 +167,40 @@ class TransformResult(BaseModel):
     channel_name: str
     content: str
     char_count: int
+    cached: bool = False
+    near_duplicate: bool = False  # 유사 원문의 변환 결과를 재사용했는지 여부
+    similarity: Optional[float] = None  # 재사용한 원문과의 유사도 (0~1)
 
 
 class TransformResponse(BaseModel):
     results: list[TransformResult]
     calendar: Optional[str] = None
+    stats: Optional[dict] = None  # 변환 모드, LLM 호출 수, 입력/출력/캐시 토큰, 소요 시간
+
+
+class JobTransformRequest(TransformRequest):
+    content: str = ""
+    url: Optional[str] = None  # content 대신 URL을 주면 작업 안에서 스크랩
+
+
+class BatchDocument(BaseModel):
+    id: Optional[str] = None  # 결과 이벤트의 document 값 (없으면 목록 순번)
+    content: str = ""
+    url: Optional[str] = None  # content 대신 URL을 주면 스크랩
+
+
+class BatchTransformRequest(BaseModel):
+    documents: list[BatchDocument]
+    channels: list[str] = ["blog", "instagram", "threads"]
+    style_config: Optional[StyleConfig] = None
+    custom_prompts: Optional[dict[str, str]] = None
+    max_concurrency: Optional[int] = None  # 모든 문서 × 채널 작업에 적용되는 동시 실행 한도
+    reuse_similar: bool = True
+
+
+class JobCreatedResponse(BaseModel):
+    job_id: str
+    status: str
 
 
 class ChannelInfo(BaseModel):
@@ -114,7 +242,42 @@ class RewriteRequest(BaseModel):
     style: str = "informative"
     target_length: str = "similar"
     additional_instructions: str = ""
-    provider: str = "gemini"
+    provider: str = "gemini"  # gemini, claude, auto (라우팅 + 헤지, 명시적으로 선택할 때만)
+
+
+# 의존성 주입 - lifespan에서 만든 공유 클라이언트 반환
+def _shared_client(request: Request, name: str):
+    client = getattr(request.app.state, name, None)
+    if client is None:
+        detail = request.app.state.client_errors.get(name, f"{name}가 초기화되지 않았습니다.")
+        raise HTTPException(status_code=500, detail=detail)
+    return client
+
+
+def get_scraper(request: Request) -> BlogScraper:
+    return _shared_client(request, "scraper")
+
+
+def get_repurposer(request: Request) -> ContentRepurposer:
+    return _shared_client(request, "repurposer")
+
+
+def get_style_analyzer(request: Request) -> StyleAnalyzer:
+    return _shared_client(request, "style_analyzer")
+
+
+def get_llm_providers(request: Request) -> dict[str, LLMProvider]:
+    return request.app.state.providers
+
+
+def get_ingest_store(request: Request) -> IngestStore:
+    return _shared_client(request, "ingest_store")
+
+
+def get_job_manager(request: Request) -> JobManager:
+    if getattr(request.app.state, "job_manager", None) is None:
+        return _shared_client(request, "repurposer")  # 초기화 실패 사유 반환
+    return request.app.state.job_manager
 
 
 # API 엔드포인트
@@ -124,16 +287,18 @@ async def root():
 
 
 @app.post("/analyze-style", response_model=StyleAnalysisResponse)
-async def analyze_blog_style(request: AnalyzeStyleRequest):
+async def analyze_blog_style(
+    request: AnalyzeStyleRequest,
+    scraper: BlogScraper = Depends(get_scraper),
+    analyzer: StyleAnalyzer = Depends(get_style_analyzer)
+):
     """블로그 스타일 분석 및 프롬프트 생성"""
     try:
         # 1. Scrape blog content
-        scraper = BlogScraper()
-        scraped = scraper.scrape(request.url)
+        scraped = await scraper.ascrape(request.url)
         
         # 2. Analyze style
-        analyzer = StyleAnalyzer()
-        result = analyzer.analyze_style(scraped.content)
+        result = await run_blocking("llm", analyzer.analyze_style, scraped.content)
         
         return StyleAnalysisResponse(
             tone=result.get("tone", "분석 실패"),
@@ -142,6 +307,8 @@ async def analyze_blog_style(request: AnalyzeStyleRequest):
             structure=result.get("structure", "분석 실패"),
             generated_prompt=result.get("generated_prompt", "프롬프트 생성 실패")
         )
+    except RateLimitExceeded as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         print(f"Error in analyze_blog_style: {str(e)}")  # Server log
         raise HTTPException(status_code=400, detail=str(e))
@@ -152,21 +319,23 @@ import asyncio
 import json as json_module
 
 @app.post("/analyze-style-stream")
-async def analyze_blog_style_stream(request: AnalyzeStyleRequest):
+async def analyze_blog_style_stream(
+    request: AnalyzeStyleRequest,
+    scraper: BlogScraper = Depends(get_scraper),
+    analyzer: StyleAnalyzer = Depends(get_style_analyzer)
+):
     """블로그 스타일 분석 (스트리밍 버전)"""
     
     async def generate():
         try:
             # Step 1: Scraping
             yield f"data: {json_module.dumps({'step': 'scraping', 'message': '블로그 콘텐츠 추출 중...'})}\n\n"
-            scraper = BlogScraper()
-            scraped = scraper.scrape(request.url)
+            scraped = await scraper.ascrape(request.url)
             yield f"data: {json_module.dumps({'step': 'scraped', 'message': f'콘텐츠 추출 완료! ({len(scraped.content)}자)'})}\n\n"
             
             # Step 2: Analyzing
             yield f"data: {json_module.dumps({'step': 'analyzing', 'message': 'AI가 글 스타일을 분석하고 있습니다...'})}\n\n"
-            analyzer = StyleAnalyzer()
-            result = analyzer.analyze_style(scraped.content)
+            result = await run_blocking("llm", analyzer.analyze_style, scraped.content)
             
             # Step 3: Send results one by one
             yield f"data: {json_module.dumps({'step': 'tone', 'field': 'tone', 'value': result.get('tone', '')})}\n\n"
@@ -217,11 +386,10 @@ async def get_channel_prompt(channel: str):
 
 
 @app.post("/scrape", response_model=ScrapeResponse)
-async def scrape_url(request: ScrapeRequest):
+async def scrape_url(request: ScrapeRequest, scraper: BlogScraper = Depends(get_scraper)):
     """URL에서 콘텐츠 추출"""
     try:
-        scraper = BlogScraper()
-        result = scraper.scrape(request.url)
+        result = await scraper.ascrape(request.url)
         return ScrapeResponse(
             title=result.title,
             content=result.content,
@@ -233,12 +401,74 @@ async def scrape_url(request: ScrapeRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@app.get("/scrape/selectors")
+async def scrape_selector_stats(domain: Optional[str] = None):
+    """도메인별 본문 선택자 적중/실패 기록과 순위 (domain을 주면 해당 도메인만)"""
+    return selector_ranker.stats(domain)
+
+
+@app.post("/scrape/batch")
+async def scrape_batch(request: ScrapeBatchRequest, scraper: BlogScraper = Depends(get_scraper)):
+    """여러 URL 일괄 스크랩 - 호스트별 동시 요청 수/간격을 지키며 끝나는 대로 NDJSON 한 줄씩 전달"""
+    urls = [url.strip() for url in request.urls if url.strip()]
+    if not urls:
+        raise HTTPException(status_code=400, detail="urls가 비어 있습니다.")
+    if len(urls) > SCRAPE_BATCH_MAX_URLS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {SCRAPE_BATCH_MAX_URLS}개 URL까지 스크랩할 수 있습니다.")
+
+    async def generate():
+        try:
+            async for event in stream_scrape_batch(
+                scraper,
+                urls,
+                max_concurrency=request.max_concurrency,
+                per_host_concurrency=request.per_host_concurrency,
+                host_delay=request.host_delay
+            ):
+                yield json_module.dumps(event, ensure_ascii=False) + "\n"
+        except Exception as e:
+            yield json_module.dumps({"step": "error", "message": str(e)}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@app.post("/ingest")
+async def ingest_blog(
+    request: IngestRequest,
+    scraper: BlogScraper = Depends(get_scraper),
+    store: IngestStore = Depends(get_ingest_store)
+):
+    """블로그 증분 수집 - RSS/사이트맵에서 새 글과 바뀐 글만 가져와 NDJSON 한 줄씩 전달"""
+    if not feed_candidates(request.blog_url):
+        raise HTTPException(status_code=400, detail="피드/사이트맵을 찾을 수 없는 블로그 주소입니다.")
+
+    async def generate():
+        try:
+            async for event in stream_ingest(
+                scraper,
+                store,
+                request.blog_url,
+                max_posts=request.max_posts,
+                force=request.force,
+                max_concurrency=request.max_concurrency
+            ):
+                yield json_module.dumps(event, ensure_ascii=False) + "\n"
+        except Exception as e:
+            yield json_module.dumps({"step": "error", "message": str(e)}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@app.get("/ingest/posts")
+async def ingested_posts(feed_url: str, store: IngestStore = Depends(get_ingest_store)):
+    """피드 하나에서 수집해 둔 글 전체 (POST /ingest 응답의 feed_url 사용)"""
+    return store.posts(feed_url)
+
+
 @app.post("/transform", response_model=TransformResponse)
-async def transform_content(request: TransformRequest):
+async def transform_content(request: TransformRequest, repurposer: ContentRepurposer = Depends(get_repurposer)):
     """콘텐츠 변환"""
     try:
-        repurposer = ContentRepurposer()
-
         # 스타일 설정
         style_config = None
         if request.style_config:
@@ -249,23 +479,19 @@ async def transform_content(request: TransformRequest):
                 "custom": request.style_config.custom
             }
 
-        # 변환 실행 (커스텀 프롬프트 지원)
-        results = []
-        for channel in request.channels:
-            custom_prompt = None
-            if request.custom_prompts and channel in request.custom_prompts:
-                custom_prompt = request.custom_prompts[channel]
-
-            result = repurposer.transform_single_with_style(
-                request.content,
-                channel=channel,
-                style_config=style_config,
-                custom_prompt=custom_prompt
-            )
-            results.append(result)
+        # 변환 실행 - 채널별 동시 호출(parallel) 또는 단일 호출(fused) (커스텀 프롬프트 지원)
+        results, stats = await repurposer.atransform_with_stats(
+            request.content,
+            channels=request.channels,
+            style_config=style_config,
+            custom_prompts=request.custom_prompts,
+            mode=request.mode,
+            max_concurrency=request.max_concurrency,
+            reuse_similar=request.reuse_similar
+        )
 
         # 캘린더 생성
-        calendar = repurposer.generate_calendar(results)
+        calendar = await repurposer.abuild_calendar(results, request.calendar_mode)
 
         return TransformResponse(
             results=[
@@ -273,20 +499,230 @@ async def transform_content(request: TransformRequest):
                     channel=r.channel,
                     channel_name=r.channel_name,
                     content=r.content,
-                    char_count=len(r.content)
+                    char_count=len(r.content),
+                    cached=r.cached,
+                    near_duplicate=r.near_duplicate,
+                    similarity=r.similarity
                 )
                 for r in results
             ],
-            calendar=calendar
+            calendar=calendar,
+            stats=stats
         )
+    except RateLimitExceeded as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/transform-stream")
+async def transform_content_stream(request: TransformRequest, repurposer: ContentRepurposer = Depends(get_repurposer)):
+    """콘텐츠 변환 (스트리밍 버전) - 채널별 토큰을 생성되는 즉시 전달"""
+
+    def sse(payload: dict) -> str:
+        return f"data: {json_module.dumps(payload, ensure_ascii=False)}\n\n"
+
+    async def generate():
+        tasks = []
+        try:
+            style_config = None
+            if request.style_config:
+                style_config = request.style_config.model_dump()
+
+            custom_prompts = request.custom_prompts or {}
+            semaphore = asyncio.Semaphore(max(1, request.max_concurrency or repurposer.max_concurrency))
+            queue: asyncio.Queue = asyncio.Queue()
+
+            # 긴 원본은 채널 변환 전에 한 번만 요약
+            content, condense_stats = await repurposer.acondense(request.content)
+            if condense_stats["levels"]:
+                yield sse({"step": "condensed", **condense_stats})
+            # 유사 원문 지문도 채널마다 다시 계산하지 않도록 한 번만 (executor에서)
+            fingerprint = await repurposer.afingerprint(content)
+
+            async def run_channel(channel: str) -> Optional[TransformedContent]:
+                async with semaphore:
+                    result = None
+                    try:
+                        async for chunk in repurposer.astream_single_with_style(
+                            content,
+                            channel=channel,
+                            style_config=style_config,
+                            custom_prompt=custom_prompts.get(channel),
+                            reuse_similar=request.reuse_similar,
+                            fingerprint=fingerprint
+                        ):
+                            # 마지막 항목은 캐시/유사 원문 여부가 담긴 변환 결과
+                            if isinstance(chunk, TransformedContent):
+                                result = chunk
+                                continue
+                            await queue.put({"step": "token", "channel": channel, "value": chunk})
+                    except Exception as e:
+                        await queue.put({"step": "error", "channel": channel, "message": str(e)})
+                        return None
+
+                    await queue.put({
+                        "step": "channel_done",
+                        **TransformResult(
+                            channel=result.channel,
+                            channel_name=result.channel_name,
+                            content=result.content,
+                            char_count=len(result.content),
+                            cached=result.cached,
+                            near_duplicate=result.near_duplicate,
+                            similarity=result.similarity
+                        ).model_dump()
+                    })
+                    return result
+
+            channel_tasks = [asyncio.create_task(run_channel(channel)) for channel in request.channels]
+
+            async def close_when_finished():
+                await asyncio.gather(*channel_tasks)
+                await queue.put(None)
+
+            tasks = channel_tasks + [asyncio.create_task(close_when_finished())]
+
+            # Step 1: 채널별 토큰/완료 이벤트 전달
+            while (event := await queue.get()) is not None:
+                yield sse(event)
+
+            # Step 2: 캘린더 생성
+            results = [task.result() for task in channel_tasks if task.result() is not None]
+            if results:
+                calendar = await repurposer.abuild_calendar(results, request.calendar_mode)
+                yield sse({"step": "calendar", "value": calendar})
+
+            yield sse({"step": "done", "message": "변환 완료!", "count": len(results)})
+
+        except Exception as e:
+            yield sse({"step": "error", "message": str(e)})
+        finally:
+            # 클라이언트 연결이 끊기면 남은 채널 작업 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    return StreamingResponse(generate(), media_type="text/event-stream")
+
+
+@app.post("/transform/batch")
+async def transform_batch(
+    request: BatchTransformRequest,
+    repurposer: ContentRepurposer = Depends(get_repurposer),
+    scraper: BlogScraper = Depends(get_scraper)
+):
+    """여러 문서 일괄 변환 - (문서, 채널) 작업이 끝나는 대로 NDJSON 한 줄씩 전달"""
+    if not request.documents:
+        raise HTTPException(status_code=400, detail="documents가 비어 있습니다.")
+    if len(request.documents) > BATCH_MAX_DOCUMENTS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {BATCH_MAX_DOCUMENTS}개 문서까지 변환할 수 있습니다.")
+    if any(not document.content and not document.url for document in request.documents):
+        raise HTTPException(status_code=400, detail="각 문서에 content 또는 url이 필요합니다.")
+    unknown = [channel for channel in request.channels if channel not in CHANNEL_PROMPTS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 채널: {unknown}")
+
+    async def generate():
+        try:
+            async for event in stream_batch(
+                repurposer,
+                scraper,
+                [document.model_dump() for document in request.documents],
+                channels=list(dict.fromkeys(request.channels)),
+                style_config=request.style_config.model_dump() if request.style_config else None,
+                custom_prompts=request.custom_prompts,
+                max_concurrency=request.max_concurrency,
+                reuse_similar=request.reuse_similar
+            ):
+                yield json_module.dumps(event, ensure_ascii=False) + "\n"
+        except Exception as e:
+            yield json_module.dumps({"step": "error", "message": str(e)}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@app.post("/jobs/transform", response_model=JobCreatedResponse, status_code=202)
+async def create_transform_job(request: JobTransformRequest, job_manager: JobManager = Depends(get_job_manager)):
+    """변환 작업 등록 (즉시 작업 ID 반환, 결과는 GET /jobs/{job_id}로 조회)"""
+    if not request.content and not request.url:
+        raise HTTPException(status_code=400, detail="content 또는 url이 필요합니다.")
+    unknown = [channel for channel in request.channels if channel not in CHANNEL_PROMPTS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 채널: {unknown}")
+    if request.mode not in ("parallel", "fused"):
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 변환 모드: {request.mode}. 가능한 모드: ['parallel', 'fused']")
+
+    job_id = job_manager.submit(request.model_dump())
+    return JobCreatedResponse(job_id=job_id, status="queued")
+
+
+@app.get("/jobs/{job_id}")
+async def get_transform_job(job_id: str, job_manager: JobManager = Depends(get_job_manager)):
+    """변환 작업 상태, 채널별 진행 상황 및 (부분) 결과 조회"""
+    job = job_manager.store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+
+    request = job["request"]
+    return {
+        "job_id": job["id"],
+        "status": job["status"],
+        "progress": job["progress"],
+        "results": [job["results"][channel] for channel in request["channels"] if channel in job["results"]],
+        "calendar": job["calendar"],
+        "error": job["error"],
+        "title": request.get("title"),
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"]
+    }
+
+
+@app.get("/cache/stats")
+async def cache_stats():
+    """변환 결과 캐시 통계 (적중/미스, 크기, 유사 원문 재사용, 스크랩 캐시)"""
+    return {
+        **transform_cache.stats(),
+        "near_duplicate": near_duplicate_index.stats(),
+        "scrape": scrape_cache.stats()
+    }
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus 텍스트 형식 지표 (요청/단계별 지연 시간 히스토그램, 캐시, 업스트림 오류)"""
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@app.get("/usage")
+async def llm_usage():
+    """엔드포인트/채널/모델별 LLM 토큰 사용량, 지연 시간, 추정 비용"""
+    return usage_tracker.stats()
+
+
+@app.get("/rate-limits")
+async def rate_limit_stats():
+    """provider/모델별 요청 한도, 버킷 잔량, 대기열 지표"""
+    return limiter_stats()
+
+
 @app.get("/health")
 async def health_check():
     """헬스 체크"""
-    return {"status": "healthy", "youtube_enabled": bool(os.getenv("YOUTUBE_API_KEY"))}
+    return {
+        "status": "healthy",
+        "youtube_enabled": bool(os.getenv("YOUTUBE_API_KEY")),
+        "client_setup_ms": getattr(app.state, "client_setup_ms", {}),
+        "event_loop_lag": loop_lag_monitor.stats(),
+        "executors": executor_stats(),
+        "scrape_client": http_client_stats(),
+        "llm_routing": _routing_stats(app)
+    }
+
+
+def _routing_stats(app: FastAPI) -> Optional[dict]:
+    router = getattr(app.state, "providers", {}).get("auto")
+    return router.stats() if isinstance(router, RoutingProvider) else None
 
 
 # ============================================
@@ -326,7 +762,7 @@ async def youtube_search_get(
             min_views=min_views
         )
         
-        results = youtube_analyzer.analyze_top_videos(keyword, top_n, filters)
+        results = await run_blocking("youtube", youtube_analyzer.analyze_top_videos, keyword, top_n, filters)
         
         return {
             "success": True,
@@ -358,7 +794,7 @@ async def youtube_search_post(request: YouTubeSearchRequest):
             min_views=request.min_views
         )
         
-        results = youtube_analyzer.analyze_top_videos(request.keyword, request.top_n, filters)
+        results = await run_blocking("youtube", youtube_analyzer.analyze_top_videos, request.keyword, request.top_n, filters)
         
         return {
             "success": True,
@@ -391,7 +827,7 @@ async def youtube_trending(top_n: int = 10):
         
         for keyword in trending_keywords[:2]:
             try:
-                results = youtube_analyzer.analyze_top_videos(keyword, 10, filters)
+                results = await run_blocking("youtube", youtube_analyzer.analyze_top_videos, keyword, 10, filters)
                 all_videos.extend(results)
             except:
                 continue
@@ -431,7 +867,9 @@ async def youtube_transcript(
     }
     languages = lang_priority.get(lang, ["ko", "en"])
     
-    result = transcript.get_transcript(
+    result = await run_blocking(
+        "youtube",
+        transcript.get_transcript,
         video_id,
         languages=languages,
         include_timestamps=timestamps
@@ -446,7 +884,7 @@ async def youtube_transcript(
 @app.get("/youtube/transcript/{video_id}/languages")
 async def youtube_transcript_languages(video_id: str):
     """영상의 사용 가능한 자막 언어 목록"""
-    result = transcript.get_available_languages(video_id)
+    result = await run_blocking("youtube", transcript.get_available_languages, video_id)
     
     if not result["success"]:
         raise HTTPException(status_code=404, detail=result["error"])
@@ -455,17 +893,20 @@ async def youtube_transcript_languages(video_id: str):
 
 
 @app.post("/youtube/rewrite")
-async def youtube_rewrite(request: RewriteRequest):
+async def youtube_rewrite(request: RewriteRequest, providers: dict[str, LLMProvider] = Depends(get_llm_providers)):
     """AI를 활용한 스크립트 재구성"""
     if not request.original_script.strip():
         raise HTTPException(status_code=400, detail="원본 스크립트가 비어있습니다.")
     
-    result = script_generator.rewrite_script(
+    result = await run_blocking(
+        "llm",
+        script_generator.rewrite_script,
         original_script=request.original_script,
         style=request.style,
         target_length=request.target_length,
         additional_instructions=request.additional_instructions,
-        provider_name=request.provider
+        provider_name=request.provider,
+        provider=providers.get(request.provider)
     )
     
     if not result["success"]:
@@ -98,6 +98,27 @@ CHANNEL_PROMPTS = {
     }
 }
 
+# 모델 등급 → Gemini 모델명
+MODEL_TIERS = {
+    "flash": "gemini-2.5-flash",
+    "flash-lite": "gemini-2.5-flash-lite",
+}
+
+# 채널별 생성 설정
+# - model_tier: 짧은 채널은 더 빠르고 저렴한 flash-lite 사용
+# - max_output_tokens: 채널 분량에 맞춘 출력 토큰 상한 (flash는 thinking 토큰도 포함되므로 여유 있게)
+# - temperature: 캐주얼 채널은 조금 더 자유롭게
+CHANNEL_GENERATION_PROFILES = {
+    "blog": {"model_tier": "flash", "max_output_tokens": 4096, "temperature": 0.7},
+    "linkedin": {"model_tier": "flash", "max_output_tokens": 2048, "temperature": 0.7},
+    "instagram": {"model_tier": "flash-lite", "max_output_tokens": 1024, "temperature": 0.8},
+    "threads": {"model_tier": "flash-lite", "max_output_tokens": 512, "temperature": 0.8},
+    "twitter": {"model_tier": "flash-lite", "max_output_tokens": 512, "temperature": 0.8},
+}
+
+# 프로필이 없는 채널/용도(캘린더, fused 모드)에 쓰는 기본 설정
+DEFAULT_GENERATION_PROFILE = {"model_tier": "flash", "max_output_tokens": None, "temperature": 0.7}
+
 # 콘텐츠 캘린더 생성 프롬프트
 CALENDAR_PROMPT = """당신은 소셜 미디어 마케팅 전문가입니다.
 주어진 콘텐츠를 기반으로 일주일 발행 캘린더를 생성하세요.
@@ -124,3 +145,35 @@ CALENDAR_PROMPT = """당신은 소셜 미디어 마케팅 전문가입니다.
 
 채널키는 다음 중 하나: blog, instagram, threads, linkedin, twitter
 변환된 콘텐츠에 없는 채널은 "channel": null, "channelName": "휴식", "reason": "발행 없음"으로 표시"""
+
+
+# 다채널 일괄 변환 프롬프트 (fused 모드: 원본 콘텐츠를 한 번만 전송)
+FUSED_PROMPT = """당신은 멀티 채널 소셜 미디어 콘텐츠 전문가입니다.
+주어진 원본 콘텐츠 하나를 아래 각 채널의 규칙에 맞게 한 번에 변환하세요.
+채널마다 규칙을 독립적으로 지키고, 서로의 결과를 복사하지 마세요.
+
+{channel_instructions}
+
+{style_instruction}
+
+원본 콘텐츠:
+{content}
+
+반드시 아래 JSON 형식만 출력하세요. 다른 설명 없이 JSON만 출력:
+{output_format}
+
+각 값에는 해당 채널에 바로 게시할 수 있는 완성된 본문만 넣으세요."""
+
+
+# 긴 원본 요약 프롬프트 (map-reduce: 단락 묶음별로 요약한 뒤 이어 붙여 채널 변환에 사용)
+CONDENSE_PROMPT = """당신은 콘텐츠 편집자입니다. 아래는 긴 글의 {part}번째 부분입니다.
+이 부분을 {target_chars}자 이내로 압축하세요.
+
+규칙:
+- 핵심 주장, 사실, 숫자, 고유명사, 인용문은 빠짐없이 유지
+- 글쓴이의 어조와 시점(1인칭/존댓말 등)을 그대로 유지
+- 원문에 없는 내용은 추가하지 않음
+- 제목이나 설명 없이 압축한 본문만 출력
+
+원문 부분:
+{content}"""
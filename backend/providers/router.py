@@ -0,0 +1,210 @@
+"""
+라우팅 LLM Provider
+여러 Provider를 묶어 최근 지연 시간/오류율로 주 Provider를 고르고,
+주 Provider가 p95 지연 시간 안에 답하지 않으면 다음 Provider로 헤지 요청을 보내
+먼저 도착한 응답을 사용합니다. 주 Provider가 실패하면 바로 다음 Provider로 넘어갑니다.
+"""
+
+import os
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Optional
+from .base import LLMProvider, LLMResponse
+
+# 라우팅 대상 Provider 목록 ("이름" 또는 "이름:모델", 쉼표 구분)
+ROUTER_PROVIDERS = os.getenv("LLM_ROUTER_PROVIDERS", "gemini,claude")
+
+# 헤지 지연: 주 Provider 최근 지연 시간의 이 백분위수만큼 기다린 뒤 두 번째 요청 발사
+HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", 0.95))
+# 표본이 부족할 때 쓰는 헤지 지연(초)과 최소 헤지 지연(초)
+HEDGE_DEFAULT_DELAY = float(os.getenv("LLM_HEDGE_DELAY", 8.0))
+HEDGE_MIN_DELAY = float(os.getenv("LLM_HEDGE_MIN_DELAY", 0.5))
+HEDGE_MIN_SAMPLES = 5
+# Provider가 하나뿐일 때 같은 Provider로 헤지할지 (같은 요청이 두 번 과금되므로 기본 꺼짐)
+HEDGE_SINGLE_PROVIDER = os.getenv("LLM_HEDGE_SINGLE_PROVIDER", "0") not in ("0", "false", "False")
+
+# 최근 몇 건으로 지연 시간/오류율을 계산할지, 오류율이 이보다 높으면 후순위
+ROUTER_WINDOW = int(os.getenv("LLM_ROUTER_WINDOW", 50))
+ROUTER_MAX_ERROR_RATE = float(os.getenv("LLM_ROUTER_MAX_ERROR_RATE", 0.5))
+
+HEDGE_WORKERS = int(os.getenv("LLM_HEDGE_WORKERS", 8))
+
+
+class ProviderHealth:
+    """Provider 하나의 최근 지연 시간/성공 여부 (슬라이딩 윈도우)"""
+
+    def __init__(self, window: int = ROUTER_WINDOW):
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def count(self, counter: str) -> None:
+        """requests / hedges / hedge_wins 증가 (여러 스레드에서 호출)"""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record(self, latency: float, ok: bool) -> None:
+        with self._lock:
+            self._outcomes.append(ok)
+            if ok:
+                self._latencies.append(latency)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """성공 응답 지연 시간의 백분위수 (표본이 부족하면 None)"""
+        with self._lock:
+            if len(self._latencies) < HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def error_rate(self) -> float:
+        with self._lock:
+            if not self._outcomes:
+                return 0.0
+            return self._outcomes.count(False) / len(self._outcomes)
+
+    def stats(self) -> dict:
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        error_rate = self.error_rate()
+        with self._lock:
+            return {
+                "samples": len(self._outcomes),
+                "p50_ms": round(p50 * 1000) if p50 is not None else None,
+                "p95_ms": round(p95 * 1000) if p95 is not None else None,
+                "error_rate": round(error_rate, 3),
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+            }
+
+
+class RoutingProvider(LLMProvider):
+    """
+    헤지 요청 + 지연 시간 기반 장애 조치 Provider
+
+    - 주 Provider: 오류율이 ROUTER_MAX_ERROR_RATE 이하인 것 중 p50 지연이 가장 짧은 것
+      (지연 표본이 없는 Provider는 표본이 있는 Provider 뒤에 등록 순서대로)
+    - 헤지: 주 Provider의 p95 지연이 지나도 응답이 없으면 다음 Provider에 같은 요청 발사
+      (Provider가 하나뿐이면 LLM_HEDGE_SINGLE_PROVIDER=1일 때만 같은 Provider에 한 번 더 요청)
+    - 장애 조치: 요청이 실패하면 기다리지 않고 다음 Provider로 넘어감
+    """
+
+    def __init__(
+        self,
+        providers: list[LLMProvider],
+        hedge_percentile: float = HEDGE_PERCENTILE,
+        hedge_workers: int = HEDGE_WORKERS
+    ):
+        if not providers:
+            raise ValueError("라우팅할 LLM Provider가 없습니다.")
+        self.providers = providers
+        self.hedge_percentile = hedge_percentile
+        self.health = [ProviderHealth() for _ in providers]
+        # generate()는 llm executor 스레드에서 호출되므로 헤지 요청은 별도 풀에서 실행
+        self._pool = ThreadPoolExecutor(max_workers=hedge_workers, thread_name_prefix="llm-hedge")
+
+    def _ranked(self) -> list[int]:
+        """주 Provider부터 시도할 순서 (인덱스 목록)"""
+        def score(index: int):
+            health = self.health[index]
+            p50 = health.percentile(0.5)
+            # 표본이 없으면 가장 빠르다고 보지 않고 등록 순서(index)로만 비교
+            return (health.error_rate() > ROUTER_MAX_ERROR_RATE, p50 is None, p50 or 0.0, index)
+        return sorted(range(len(self.providers)), key=score)
+
+    def hedge_delay(self, index: int) -> float:
+        """Provider의 헤지 지연(초)"""
+        delay = self.health[index].percentile(self.hedge_percentile)
+        if delay is None:
+            return HEDGE_DEFAULT_DELAY
+        return max(HEDGE_MIN_DELAY, delay)
+
+    def _call(self, index: int, kwargs: dict) -> LLMResponse:
+        health = self.health[index]
+        health.count("requests")
+        started = time.perf_counter()
+        try:
+            response = self.providers[index].generate(**kwargs)
+        except Exception:
+            health.record(time.perf_counter() - started, ok=False)
+            raise
+        health.record(time.perf_counter() - started, ok=True)
+        return response
+
+    def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7
+    ) -> LLMResponse:
+        """
+        주 Provider로 생성, 느리면 헤지 요청, 실패하면 다음 Provider로 장애 조치
+        """
+        kwargs = {
+            "prompt": prompt,
+            "system_prompt": system_prompt,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        order = self._ranked()
+        primary = order[0]
+        # 나머지 Provider 순서대로 헤지/장애 조치 (하나뿐이면 설정에 따라 같은 Provider로 한 번 헤지)
+        backups = order[1:] or ([primary] if HEDGE_SINGLE_PROVIDER else [])
+
+        # future → (Provider 인덱스, 헤지 요청 여부)
+        pending: dict[Future, tuple[int, bool]] = {self._pool.submit(self._call, primary, kwargs): (primary, False)}
+        hedged = False
+        last_error: Optional[Exception] = None
+
+        while pending:
+            timeout = None if hedged or not backups else self.hedge_delay(primary)
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                # p95 안에 응답 없음 → 헤지 요청 (먼저 오는 응답 사용, 늦은 응답은 지연 통계에만 반영)
+                index = backups.pop(0)
+                self.health[index].count("hedges")
+                pending[self._pool.submit(self._call, index, kwargs)] = (index, True)
+                hedged = True
+                continue
+
+            for future in done:
+                index, is_hedge = pending.pop(future)
+                try:
+                    response = future.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+                if is_hedge:
+                    self.health[index].count("hedge_wins")
+                return response
+
+            # 실패 → 진행 중인 요청이 없으면 다음 Provider로 바로 장애 조치
+            if not pending and backups and len(self.providers) > 1:
+                index = backups.pop(0)
+                pending[self._pool.submit(self._call, index, kwargs)] = (index, False)
+                hedged = True
+
+        raise last_error or Exception("모든 LLM Provider 요청이 실패했습니다.")
+
+    def get_model_name(self) -> str:
+        return self.providers[self._ranked()[0]].get_model_name()
+
+    def stats(self) -> dict:
+        """Provider별 지연 시간/오류율/헤지 통계"""
+        primary = self._ranked()[0]
+        return {
+            "primary": self.providers[primary].get_model_name(),
+            "hedge_delay_ms": round(self.hedge_delay(primary) * 1000),
+            "providers": {
+                provider.get_model_name(): health.stats()
+                for provider, health in zip(self.providers, self.health)
+            },
+        }
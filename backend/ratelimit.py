@@ -0,0 +1,211 @@
+"""
+LLM 호출 속도 제한 (토큰 버킷)
+Provider/모델별로 분당 요청 수(RPM)와 분당 토큰 수(TPM) 버킷을 두고,
+한도를 넘는 요청은 업스트림 429를 받기 전에 로컬 대기열에서 기다리게 합니다.
+"""
+import os
+import json
+import time
+import asyncio
+import threading
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# (provider:model) → (RPM, TPM). LLM_RATE_LIMITS 환경변수(JSON)로 덮어쓸 수 있음
+# 예: LLM_RATE_LIMITS='{"gemini:gemini-2.5-flash": [10, 250000]}'
+DEFAULT_RATE_LIMITS = {
+    "gemini:gemini-2.5-flash": (1000, 1_000_000),
+    "gemini:gemini-2.5-flash-lite": (4000, 4_000_000),
+}
+FALLBACK_RATE_LIMIT = (60, 100_000)
+RATE_LIMITS = {
+    **DEFAULT_RATE_LIMITS,
+    **{key: tuple(value) for key, value in json.loads(os.getenv("LLM_RATE_LIMITS", "{}")).items()},
+}
+
+# 대기열 크기 / 최대 대기 시간(초)
+RATE_LIMIT_MAX_QUEUE = int(os.getenv("RATE_LIMIT_MAX_QUEUE", 100))
+RATE_LIMIT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", 30))
+
+# 응답 토큰 추정치 (요청 전에 TPM 버킷에서 미리 차감)
+OUTPUT_TOKEN_ESTIMATE = 512
+
+
+class RateLimitExceeded(Exception):
+    """대기열이 가득 찼거나 최대 대기 시간 안에 차례가 오지 않음"""
+
+
+def estimate_tokens(text: str, max_output_tokens: Optional[int] = None) -> int:
+    """프롬프트 길이로 입력+출력 토큰 수 추정 (한글 기준 약 2자당 1토큰)"""
+    output = min(max_output_tokens or OUTPUT_TOKEN_ESTIMATE, OUTPUT_TOKEN_ESTIMATE)
+    return max(1, len(text) // 2) + output
+
+
+class TokenBucketLimiter:
+    """
+    RPM/TPM 토큰 버킷 + 대기열 제한
+
+    acquire()는 asyncio 코드에서, acquire_sync()는 executor 스레드에서 사용합니다.
+    두 경로가 같은 버킷을 공유합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rpm: int,
+        tpm: int,
+        max_queue: int = RATE_LIMIT_MAX_QUEUE,
+        max_wait: float = RATE_LIMIT_MAX_WAIT
+    ):
+        self.name = name
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        self._waiting = 0
+        self._metrics = {
+            "acquired": 0,
+            "rejected": 0,
+            "queued": 0,
+            "queue_time_total": 0.0,
+            "queue_time_max": 0.0,
+        }
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def _try_take(self, tokens: int) -> float:
+        """버킷에서 차감 시도. 성공하면 0, 아니면 다시 시도할 때까지 기다릴 시간(초)"""
+        tokens = min(tokens, self.tpm)  # 한 요청이 TPM 전체보다 크면 가득 찰 때까지만 대기
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._requests >= 1 and self._tokens >= tokens:
+                self._requests -= 1
+                self._tokens -= tokens
+                return 0.0
+            request_wait = max(0.0, (1 - self._requests) * 60 / self.rpm)
+            token_wait = max(0.0, (tokens - self._tokens) * 60 / self.tpm)
+            return max(request_wait, token_wait, 0.01)
+
+    def _enter_queue(self) -> None:
+        with self._lock:
+            if self._waiting >= self.max_queue:
+                self._metrics["rejected"] += 1
+                raise RateLimitExceeded(f"{self.name} 요청 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요.")
+            self._waiting += 1
+
+    def _leave_queue(self, waited: float, acquired: bool) -> None:
+        with self._lock:
+            self._waiting -= 1
+            if acquired:
+                self._metrics["acquired"] += 1
+                if waited > 0:
+                    self._metrics["queued"] += 1
+                    self._metrics["queue_time_total"] += waited
+                    self._metrics["queue_time_max"] = max(self._metrics["queue_time_max"], waited)
+            else:
+                self._metrics["rejected"] += 1
+
+    async def acquire(self, tokens: int = 1) -> float:
+        """차례가 올 때까지 비동기로 대기. 대기한 시간(초) 반환"""
+        wait = self._try_take(tokens)
+        if wait == 0:
+            self._record_immediate()
+            return 0.0
+
+        self._enter_queue()
+        started = time.monotonic()
+        acquired = False
+        try:
+            while wait > 0:
+                if time.monotonic() - started + wait > self.max_wait:
+                    raise RateLimitExceeded(f"{self.name} 요청 한도 초과: {self.max_wait:.0f}초 안에 처리할 수 없습니다.")
+                await asyncio.sleep(wait)
+                wait = self._try_take(tokens)
+            acquired = True
+        finally:
+            waited = time.monotonic() - started
+            self._leave_queue(waited, acquired)
+        return waited
+
+    def acquire_sync(self, tokens: int = 1) -> float:
+        """acquire의 동기 버전 (executor 스레드용)"""
+        wait = self._try_take(tokens)
+        if wait == 0:
+            self._record_immediate()
+            return 0.0
+
+        self._enter_queue()
+        started = time.monotonic()
+        acquired = False
+        try:
+            while wait > 0:
+                if time.monotonic() - started + wait > self.max_wait:
+                    raise RateLimitExceeded(f"{self.name} 요청 한도 초과: {self.max_wait:.0f}초 안에 처리할 수 없습니다.")
+                time.sleep(wait)
+                wait = self._try_take(tokens)
+            acquired = True
+        finally:
+            waited = time.monotonic() - started
+            self._leave_queue(waited, acquired)
+        return waited
+
+    def _record_immediate(self) -> None:
+        """대기 없이 바로 통과한 요청 집계"""
+        with self._lock:
+            self._metrics["acquired"] += 1
+
+    def stats(self) -> dict:
+        """버킷 잔량과 대기열 지표"""
+        with self._lock:
+            self._refill(time.monotonic())
+            queued = self._metrics["queued"]
+            return {
+                "rpm": self.rpm,
+                "tpm": self.tpm,
+                "available_requests": round(self._requests, 2),
+                "available_tokens": round(self._tokens),
+                "waiting": self._waiting,
+                "max_queue": self.max_queue,
+                "acquired": self._metrics["acquired"],
+                "rejected": self._metrics["rejected"],
+                "queued": queued,
+                "queue_time_avg_ms": round(self._metrics["queue_time_total"] / queued * 1000, 1) if queued else 0.0,
+                "queue_time_max_ms": round(self._metrics["queue_time_max"] * 1000, 1),
+            }
+
+
+_limiters: dict[str, TokenBucketLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(provider: str, model: str) -> TokenBucketLimiter:
+    """provider/모델별 공유 리미터 (프로세스 전역)"""
+    # langchain-google-genai는 모델명 앞에 "models/"를 붙이기도 함
+    model = model.removeprefix("models/")
+    key = f"{provider}:{model}"
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            rpm, tpm = RATE_LIMITS.get(key, FALLBACK_RATE_LIMIT)
+            limiter = TokenBucketLimiter(key, rpm, tpm)
+            _limiters[key] = limiter
+        return limiter
+
+
+def limiter_stats() -> dict:
+    """모든 리미터 통계"""
+    with _limiters_lock:
+        limiters = list(_limiters.items())
+    return {key: limiter.stats() for key, limiter in limiters}
@@ -2,40 +2,101 @@
 Content Repurposer - 콘텐츠를 여러 채널용으로 변환하는 엔진
 """
 import os
-from typing import Optional, Union
+import re
+import json
+import time
+import asyncio
+from typing import AsyncIterator, Optional, Union
 from dotenv import load_dotenv
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import RunnableLambda
 from pydantic import BaseModel
 
-from prompts import CHANNEL_PROMPTS, CALENDAR_PROMPT
+from prompts import (
+    CHANNEL_PROMPTS,
+    CALENDAR_PROMPT,
+    FUSED_PROMPT,
+    CONDENSE_PROMPT,
+    MODEL_TIERS,
+    CHANNEL_GENERATION_PROFILES,
+    DEFAULT_GENERATION_PROFILE,
+)
 from scraper import BlogScraper, ScrapedContent
+from cache import TransformCache, transform_cache
+from similarity import NearDuplicateIndex, near_duplicate_index
+from scheduler import build_calendar
+from chunking import split_paragraphs
+from ratelimit import get_limiter, estimate_tokens
+from usage import UsageCallbackHandler
+from tracing import span
+from executors import run_blocking
 
 load_dotenv()
 
+# 동시에 실행할 채널 변환 수 (Gemini 분당 요청 한도에 맞춰 조절)
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("TRANSFORM_MAX_CONCURRENCY", 5))
+
+# 이 길이(자)를 넘는 원본은 단락 묶음별로 병렬 요약(map)한 뒤 이어 붙인 요약본(reduce)으로 변환
+CONDENSE_THRESHOLD = int(os.getenv("CONDENSE_THRESHOLD", 6000))
+CONDENSE_CHUNK_CHARS = int(os.getenv("CONDENSE_CHUNK_CHARS", 4000))
+# 요약본이 여전히 길면 다시 요약하는 최대 단계 수
+CONDENSE_MAX_LEVELS = 3
+
+
+def usage_of(message) -> Optional[dict]:
+    """LangChain 응답 메시지에서 토큰 사용량 추출"""
+    metadata = getattr(message, "usage_metadata", None)
+    if not metadata:
+        return None
+    return {
+        "input_tokens": metadata.get("input_tokens", 0),
+        "output_tokens": metadata.get("output_tokens", 0),
+        "cached_tokens": (metadata.get("input_token_details") or {}).get("cache_read", 0)
+    }
+
 
 class TransformedContent(BaseModel):
     """변환된 콘텐츠 결과"""
     channel: str
     channel_name: str
     content: str
+    cached: bool = False  # 캐시에서 반환된 결과인지 여부
+    near_duplicate: bool = False  # 조금 다른 원문의 변환 결과를 재사용했는지 여부
+    similarity: Optional[float] = None  # 재사용한 원문과의 SimHash 유사도 (0~1)
+    usage: Optional[dict] = None  # LLM 토큰 사용량 (input_tokens, output_tokens, cached_tokens)
 
 
 class ContentRepurposer:
     """콘텐츠를 여러 채널용으로 변환하는 클래스"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache: Optional[TransformCache] = None,
+        scraper: Optional[BlogScraper] = None,
+        similar_index: Optional[NearDuplicateIndex] = None
+    ):
         self.api_key = api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         if not self.api_key:
             raise ValueError("API Key가 필요합니다. .env 파일에 GEMINI_API_KEY 또는 GOOGLE_API_KEY를 설정하세요.")
         
+        self.model_name = MODEL_TIERS[DEFAULT_GENERATION_PROFILE["model_tier"]]
+        self.temperature = DEFAULT_GENERATION_PROFILE["temperature"]
         self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.5-flash",
+            model=self.model_name,
             google_api_key=self.api_key,
-            temperature=0.7
+            temperature=self.temperature
         )
-        self.scraper = BlogScraper()
+        # (모델, temperature, max_output_tokens)별 LLM 인스턴스 재사용
+        self._profile_llms: dict[tuple, ChatGoogleGenerativeAI] = {}
+        self.scraper = scraper or BlogScraper()
+        self.max_concurrency = max_concurrency
+        self.cache = cache if cache is not None else transform_cache
+        self.similar_index = similar_index if similar_index is not None else near_duplicate_index
+        self.parser = StrOutputParser()
         self._last_scraped: Optional[ScrapedContent] = None
     
     def load_from_url(self, url: str) -> ScrapedContent:
@@ -56,12 +117,13 @@ class ContentRepurposer:
         if channel not in CHANNEL_PROMPTS:
             raise ValueError(f"지원하지 않는 채널: {channel}. 가능한 채널: {list(CHANNEL_PROMPTS.keys())}")
         
-        text = self._get_content(content)
+        text = self.condense(content)
         channel_config = CHANNEL_PROMPTS[channel]
         
         # LCEL 방식: prompt | llm | output_parser
         prompt = ChatPromptTemplate.from_template(channel_config["prompt"])
-        chain = prompt | self.llm | StrOutputParser()
+        llm = self._llm_for(channel)
+        chain = prompt | self._llm_step(llm, channel) | StrOutputParser()
         
         result = chain.invoke({"content": text})
         
@@ -76,8 +138,8 @@ class ContentRepurposer:
         if channels is None:
             channels = list(CHANNEL_PROMPTS.keys())
         
-        # 콘텐츠 미리 확인
-        text = self._get_content(content)
+        # 콘텐츠 미리 확인 (긴 원본은 채널마다 다시 요약하지 않도록 한 번만 압축)
+        text = self.condense(content)
         
         results = []
         for channel in channels:
@@ -86,12 +148,8 @@ class ContentRepurposer:
         
         return results
     
-    def transform_single_with_style(self, content: Optional[str] = None, channel: str = "blog", style_config: dict = None, custom_prompt: str = None) -> TransformedContent:
-        """스타일 설정을 적용하여 단일 채널로 변환"""
-        if channel not in CHANNEL_PROMPTS:
-            raise ValueError(f"지원하지 않는 채널: {channel}. 가능한 채널: {list(CHANNEL_PROMPTS.keys())}")
-
-        text = self._get_content(content)
+    def _build_styled_prompt(self, channel: str, style_config: dict = None, custom_prompt: str = None) -> str:
+        """채널 프롬프트에 커스텀 프롬프트와 스타일 설정을 반영"""
         channel_config = CHANNEL_PROMPTS[channel]
 
         # 스타일 지시사항 생성
@@ -102,30 +160,474 @@ class ContentRepurposer:
 
         # 프롬프트에 스타일 추가
         if style_instruction:
-            styled_prompt = base_prompt.replace(
+            return base_prompt.replace(
                 "원본 콘텐츠:",
                 f"{style_instruction}\n\n원본 콘텐츠:"
             )
-        else:
-            styled_prompt = base_prompt
+        return base_prompt
+
+    @staticmethod
+    def generation_profile(channel: str) -> dict:
+        """채널별 생성 설정 (모델, 최대 출력 토큰, temperature)"""
+        profile = {**DEFAULT_GENERATION_PROFILE, **CHANNEL_GENERATION_PROFILES.get(channel, {})}
+        return {
+            "model": MODEL_TIERS[profile["model_tier"]],
+            "max_output_tokens": profile["max_output_tokens"],
+            "temperature": profile["temperature"]
+        }
 
+    def _llm_for(self, channel: str) -> ChatGoogleGenerativeAI:
+        """채널 생성 설정이 적용된 LLM 반환 (기본 설정과 같으면 self.llm)"""
+        profile = self.generation_profile(channel)
+        key = (profile["model"], profile["temperature"], profile["max_output_tokens"])
+        if key == (self.model_name, self.temperature, DEFAULT_GENERATION_PROFILE["max_output_tokens"]):
+            return self.llm
+
+        llm = self._profile_llms.get(key)
+        if llm is None:
+            llm = ChatGoogleGenerativeAI(
+                model=profile["model"],
+                google_api_key=self.api_key,
+                temperature=profile["temperature"],
+                max_output_tokens=profile["max_output_tokens"]
+            )
+            self._profile_llms[key] = llm
+        return llm
+
+    def _prepare_style_transform(self, content: Optional[str], channel: str, style_config: dict = None, custom_prompt: str = None) -> tuple[str, str, str, str]:
+        """
+        채널 검증 후 (스타일 프롬프트, 원본 텍스트, 캐시 키, 변환 설정 키) 반환
+
+        변환 설정 키는 원문을 뺀 나머지(채널, 프롬프트, 스타일, 모델)의 해시로, 유사 원문 색인에서 사용합니다.
+        """
+        if channel not in CHANNEL_PROMPTS:
+            raise ValueError(f"지원하지 않는 채널: {channel}. 가능한 채널: {list(CHANNEL_PROMPTS.keys())}")
+
+        with span("prompt_build", channel=channel):
+            text = self._get_content(content)
+            styled_prompt = self._build_styled_prompt(channel, style_config, custom_prompt)
+            profile = self.generation_profile(channel)
+            variant = {
+                "channel": channel,
+                "prompt": styled_prompt,
+                "style_config": style_config,
+                "model": profile["model"],
+                "temperature": profile["temperature"],
+                "max_output_tokens": profile["max_output_tokens"]
+            }
+            cache_key = TransformCache.make_key(content=text, **variant)
+            variant_key = TransformCache.make_key(**variant)
+        return styled_prompt, text, cache_key, variant_key
+
+    def _build_chain(self, styled_prompt: str, channel: Optional[str] = None):
+        """LCEL 체인 생성: prompt | llm (토큰 사용량을 읽기 위해 메시지 그대로 반환)"""
         prompt = ChatPromptTemplate.from_template(styled_prompt)
-        chain = prompt | self.llm | StrOutputParser()
+        llm = self._llm_for(channel) if channel else self.llm
+        return prompt | self._llm_step(llm, channel or "default")
 
-        result = chain.invoke({"content": text})
+    def _llm_step(self, llm: ChatGoogleGenerativeAI, channel: str):
+        """속도 제한 → LLM 호출 (호출마다 토큰 사용량을 channel 이름으로 집계)"""
+        callback = UsageCallbackHandler(channel, getattr(llm, "model", "unknown"))
+        return self._rate_gate(llm) | llm.with_config(callbacks=[callback])
+
+    @staticmethod
+    def _rate_gate(llm):
+        """
+        LLM 앞에 두는 속도 제한 단계
+
+        프롬프트 길이로 토큰 수를 추정해 모델별 공유 리미터에서 차례를 기다린 뒤 통과시킵니다.
+        """
+        limiter = get_limiter("gemini", getattr(llm, "model", "unknown"))
+        max_output_tokens = getattr(llm, "max_output_tokens", None)
+
+        def gate(prompt_value):
+            with span("rate_limit_wait"):
+                limiter.acquire_sync(estimate_tokens(prompt_value.to_string(), max_output_tokens))
+            return prompt_value
 
+        async def agate(prompt_value):
+            with span("rate_limit_wait"):
+                await limiter.acquire(estimate_tokens(prompt_value.to_string(), max_output_tokens))
+            return prompt_value
+
+        return RunnableLambda(gate, afunc=agate)
+
+    def _to_result(self, channel: str, content: str, cached: bool = False, usage: Optional[dict] = None, similarity: Optional[float] = None) -> TransformedContent:
+        """변환 결과를 TransformedContent로 포장 (similarity가 있으면 유사 원문 결과 재사용)"""
         return TransformedContent(
             channel=channel,
-            channel_name=channel_config["name"],
-            content=result
+            channel_name=CHANNEL_PROMPTS[channel]["name"],
+            content=content,
+            cached=cached,
+            near_duplicate=similarity is not None,
+            similarity=similarity,
+            usage=usage
         )
-    
+
+    async def afingerprint(self, text: str) -> Optional[int]:
+        """유사 원문 색인용 지문을 이벤트 루프 밖에서 계산 (색인을 쓰지 않으면 None)"""
+        if not (self.cache.enabled and self.similar_index.enabled):
+            return None
+        return await run_blocking("llm", self.similar_index.fingerprint, text)
+
+    def _cached_result(self, channel: str, text: str, cache_key: str, variant_key: str, reuse_similar: bool = True, fingerprint: Optional[int] = None) -> Optional[TransformedContent]:
+        """
+        같은 원문의 캐시 결과, 없으면 같은 설정으로 변환한 유사 원문의 결과 반환 (둘 다 없으면 None)
+
+        유사 원문은 SimHash 지문의 다른 비트 수가 NEAR_DUPLICATE_MAX_DISTANCE 이하인 경우입니다.
+        """
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return self._to_result(channel, cached, cached=True)
+        if not reuse_similar:
+            return None
+
+        match = self.similar_index.find(variant_key, text, fingerprint)
+        if match is None:
+            return None
+        cached = self.cache.get(match.cache_key)
+        if cached is None:
+            # 캐시에서 만료/삭제된 결과
+            self.similar_index.discard(match.cache_key)
+            return None
+        return self._to_result(channel, cached, cached=True, similarity=match.similarity)
+
+    def _store_result(self, text: str, cache_key: str, variant_key: str, result: str, fingerprint: Optional[int] = None) -> None:
+        """변환 결과를 캐시에 저장하고 유사 원문 색인에 추가"""
+        self.cache.set(cache_key, result)
+        if self.cache.enabled:
+            self.similar_index.add(variant_key, text, cache_key, fingerprint)
+
+    def transform_single_with_style(self, content: Optional[str] = None, channel: str = "blog", style_config: dict = None, custom_prompt: str = None, reuse_similar: bool = True) -> TransformedContent:
+        """스타일 설정을 적용하여 단일 채널로 변환 (동일/유사 원문은 캐시에서 반환, 긴 원본은 요약본으로 변환)"""
+        content = self.condense(content)
+        styled_prompt, text, cache_key, variant_key = self._prepare_style_transform(content, channel, style_config, custom_prompt)
+
+        cached = self._cached_result(channel, text, cache_key, variant_key, reuse_similar)
+        if cached is not None:
+            return cached
+
+        message = self._build_chain(styled_prompt, channel).invoke({"content": text})
+        result = self.parser.invoke(message)
+        self._store_result(text, cache_key, variant_key, result)
+
+        return self._to_result(channel, result, usage=usage_of(message))
+
+    def condense(self, content: Optional[str] = None) -> str:
+        """
+        acondense의 동기 버전 (CLI, load_from_url 경로용)
+
+        이벤트 루프 안에서는 요약을 돌릴 수 없으므로 긴 원본이면 RuntimeError를 냅니다 (acondense 사용).
+        """
+        text = self._get_content(content)
+        if len(text) <= CONDENSE_THRESHOLD:
+            return text
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.acondense(text))[0]
+        raise RuntimeError("이벤트 루프 안에서는 긴 원본을 동기로 요약할 수 없습니다. acondense 또는 비동기 변환 메서드를 사용하세요.")
+
+    async def acondense(self, content: Optional[str] = None) -> tuple[str, dict]:
+        """
+        긴 원본을 채널 변환용 요약본으로 압축 (map-reduce)
+
+        CONDENSE_THRESHOLD 이하이면 그대로 반환합니다. 넘으면 단락 경계로 나눈 조각을
+        동시에 요약하고 순서대로 이어 붙이며, 그래도 길면 한 단계 더 요약합니다.
+        조각 요약은 캐시되므로 같은 글을 다시 변환할 때는 LLM을 호출하지 않습니다.
+
+        Returns:
+            (요약본, 통계 {input_chars, digest_chars, levels, chunks, cached_chunks})
+        """
+        text = self._get_content(content)
+        stats = {"input_chars": len(text), "digest_chars": len(text), "levels": 0, "chunks": 0, "cached_chunks": 0}
+        if len(text) <= CONDENSE_THRESHOLD:
+            return text, stats
+
+        with span("condense", input_chars=len(text)):
+            while len(text) > CONDENSE_THRESHOLD and stats["levels"] < CONDENSE_MAX_LEVELS:
+                chunks = split_paragraphs(text, CONDENSE_CHUNK_CHARS)
+                # 이어 붙인 요약본이 기준 길이 안에 들어오도록 조각별 목표 길이 배분
+                target_chars = max(200, CONDENSE_THRESHOLD // len(chunks) - 20)
+                digests, cached_chunks = await self._asummarize_chunks(chunks, target_chars)
+                text = "\n\n".join(digests)
+                stats["levels"] += 1
+                stats["chunks"] += len(chunks)
+                stats["cached_chunks"] += cached_chunks
+
+        # 최대 단계까지 요약해도 길면 프롬프트 크기를 지키기 위해 자름
+        text = text[:CONDENSE_THRESHOLD]
+        stats["digest_chars"] = len(text)
+        return text, stats
+
+    async def _asummarize_chunks(self, chunks: list[str], target_chars: int) -> tuple[list[str], int]:
+        """조각별 요약 (캐시에 없는 조각만 abatch로 동시 호출). (요약 목록, 캐시 적중 수) 반환"""
+        keys = [
+            TransformCache.make_key(kind="condense", content=chunk, target_chars=target_chars, prompt=CONDENSE_PROMPT, model=self.model_name)
+            for chunk in chunks
+        ]
+        digests: list[Optional[str]] = [self.cache.get(key) for key in keys]
+        missing = [index for index, digest in enumerate(digests) if digest is None]
+
+        if missing:
+            prompt = ChatPromptTemplate.from_template(CONDENSE_PROMPT)
+            chain = prompt | self._llm_step(self.llm, "condense") | self.parser
+            outputs = await chain.abatch(
+                [{"part": index + 1, "target_chars": target_chars, "content": chunks[index]} for index in missing],
+                config={"max_concurrency": self.max_concurrency}
+            )
+            for index, output in zip(missing, outputs):
+                digests[index] = output.strip()
+                self.cache.set(keys[index], digests[index])
+
+        return digests, len(chunks) - len(missing)
+
+    async def atransform_single_with_style(self, content: Optional[str] = None, channel: str = "blog", style_config: dict = None, custom_prompt: str = None, reuse_similar: bool = True, fingerprint: Optional[int] = None) -> TransformedContent:
+        """
+        transform_single_with_style의 비동기 버전 (LangChain ainvoke 사용, 긴 원본은 요약본으로 변환)
+
+        fingerprint: 여러 채널을 변환할 때 원문당 한 번 계산한 유사 원문 지문 (없으면 executor에서 계산)
+        """
+        content, _ = await self.acondense(content)
+        styled_prompt, text, cache_key, variant_key = self._prepare_style_transform(content, channel, style_config, custom_prompt)
+        if fingerprint is None:
+            fingerprint = await self.afingerprint(text)
+
+        cached = self._cached_result(channel, text, cache_key, variant_key, reuse_similar, fingerprint)
+        if cached is not None:
+            return cached
+
+        message = await self._build_chain(styled_prompt, channel).ainvoke({"content": text})
+        result = self.parser.invoke(message)
+        self._store_result(text, cache_key, variant_key, result, fingerprint)
+
+        return self._to_result(channel, result, usage=usage_of(message))
+
+    async def astream_single_with_style(self, content: Optional[str] = None, channel: str = "blog", style_config: dict = None, custom_prompt: str = None, reuse_similar: bool = True, fingerprint: Optional[int] = None) -> AsyncIterator[Union[str, TransformedContent]]:
+        """
+        스타일 설정을 적용하여 단일 채널로 변환하며 생성되는 토큰을 바로 전달
+
+        캐시(또는 유사 원문 결과)에 있으면 전체 결과를 한 번에 전달합니다. 긴 원본은 요약본으로 변환합니다.
+        토큰(str)을 모두 전달한 뒤 마지막으로 TransformedContent(cached, near_duplicate, similarity 포함)를 전달합니다.
+        """
+        content, _ = await self.acondense(content)
+        styled_prompt, text, cache_key, variant_key = self._prepare_style_transform(content, channel, style_config, custom_prompt)
+        if fingerprint is None:
+            fingerprint = await self.afingerprint(text)
+
+        cached = self._cached_result(channel, text, cache_key, variant_key, reuse_similar, fingerprint)
+        if cached is not None:
+            yield cached.content
+            yield cached
+            return
+
+        parts = []
+        async for chunk in (self._build_chain(styled_prompt, channel) | self.parser).astream({"content": text}):
+            parts.append(chunk)
+            yield chunk
+
+        result = "".join(parts)
+        self._store_result(text, cache_key, variant_key, result, fingerprint)
+        yield self._to_result(channel, result)
+
+    async def atransform_multi_with_style(
+        self,
+        content: Optional[str] = None,
+        channels: list[str] = None,
+        style_config: dict = None,
+        custom_prompts: Optional[dict[str, str]] = None,
+        max_concurrency: Optional[int] = None,
+        reuse_similar: bool = True
+    ) -> list[TransformedContent]:
+        """
+        여러 채널을 동시에 변환
+
+        모든 채널 체인을 동시에 실행하므로 전체 소요 시간은 가장 느린 채널 하나와 비슷합니다.
+        max_concurrency로 동시에 진행되는 LLM 호출 수를 제한할 수 있습니다.
+        결과는 channels 순서대로 반환됩니다.
+        긴 원본은 채널 변환 전에 한 번만 요약합니다.
+        """
+        if channels is None:
+            channels = list(CHANNEL_PROMPTS.keys())
+
+        text, _ = await self.acondense(content)
+        # 유사 원문 지문은 채널마다 다시 계산하지 않도록 원문당 한 번만
+        fingerprint = await self.afingerprint(text)
+        custom_prompts = custom_prompts or {}
+        limit = max_concurrency or self.max_concurrency
+        semaphore = asyncio.Semaphore(max(1, limit))
+
+        async def run(channel: str) -> TransformedContent:
+            async with semaphore:
+                return await self.atransform_single_with_style(
+                    text,
+                    channel=channel,
+                    style_config=style_config,
+                    custom_prompt=custom_prompts.get(channel),
+                    reuse_similar=reuse_similar,
+                    fingerprint=fingerprint
+                )
+
+        return list(await asyncio.gather(*(run(channel) for channel in channels)))
+
+    async def atransform_fused(
+        self,
+        content: Optional[str] = None,
+        channels: list[str] = None,
+        style_config: dict = None,
+        custom_prompts: Optional[dict[str, str]] = None,
+        max_concurrency: Optional[int] = None,
+        reuse_similar: bool = True
+    ) -> tuple[list[TransformedContent], dict]:
+        """
+        여러 채널을 LLM 호출 한 번으로 변환 (fused 모드)
+
+        원본 콘텐츠를 한 번만 보내고 채널별 결과를 JSON 객체로 받습니다.
+        JSON에서 빠졌거나 파싱에 실패한 채널은 채널별 호출로 다시 변환합니다.
+
+        Returns:
+            (channels 순서의 결과 목록, 호출 통계)
+        """
+        if channels is None:
+            channels = list(CHANNEL_PROMPTS.keys())
+
+        text, _ = await self.acondense(content)
+        fingerprint = await self.afingerprint(text)
+        custom_prompts = custom_prompts or {}
+        results: dict[str, TransformedContent] = {}
+        cache_keys: dict[str, tuple[str, str]] = {}
+
+        for channel in channels:
+            _, _, cache_key, variant_key = self._prepare_style_transform(text, channel, style_config, custom_prompts.get(channel))
+            cached = self._cached_result(channel, text, f"fused:{cache_key}", f"fused:{variant_key}", reuse_similar, fingerprint)
+            if cached is not None:
+                results[channel] = cached
+            else:
+                cache_keys[channel] = (f"fused:{cache_key}", f"fused:{variant_key}")
+
+        pending = [channel for channel in channels if channel not in results]
+        fused_usage = None
+        if pending:
+            try:
+                message = await self._build_fused_chain(pending, style_config, custom_prompts).ainvoke({"content": text})
+                fused_usage = usage_of(message)
+                outputs = self._parse_json_object(self.parser.invoke(message))
+            except Exception as e:
+                print(f"Fused transform failed, falling back to per-channel calls: {e}")  # Server log
+                outputs = {}
+
+            for channel in pending:
+                value = outputs.get(channel)
+                if isinstance(value, str) and value.strip():
+                    results[channel] = self._to_result(channel, value.strip())
+                    self._store_result(text, *cache_keys[channel], value.strip(), fingerprint)
+
+        # 파싱 실패 채널은 채널별 호출로 대체
+        fallback_channels = [channel for channel in channels if channel not in results]
+        fallback = []
+        if fallback_channels:
+            fallback = await self.atransform_multi_with_style(
+                text,
+                channels=fallback_channels,
+                style_config=style_config,
+                custom_prompts=custom_prompts,
+                max_concurrency=max_concurrency,
+                reuse_similar=reuse_similar
+            )
+            results.update({result.channel: result for result in fallback})
+
+        ordered = [results[channel] for channel in channels]
+        stats = self.usage_summary("fused", fallback, extra_usage=[fused_usage] if pending else [])
+        stats["cached_channels"] = [result.channel for result in ordered if result.cached]
+        stats["near_duplicate_channels"] = [result.channel for result in ordered if result.near_duplicate]
+        stats["fallback_channels"] = fallback_channels
+        return ordered, stats
+
+    def _build_fused_chain(self, channels: list[str], style_config: dict = None, custom_prompts: Optional[dict[str, str]] = None):
+        """fused 모드 체인: 채널별 규칙을 하나의 프롬프트로 합침"""
+        custom_prompts = custom_prompts or {}
+        sections = []
+        for channel in channels:
+            # 채널 프롬프트에서 '원본 콘텐츠:' 앞부분(역할/규칙)만 사용
+            base_prompt = self._build_styled_prompt(channel, None, custom_prompts.get(channel))
+            instruction = base_prompt.split("원본 콘텐츠:")[0].replace("{content}", "").strip()
+            sections.append(f"### [{channel}] {CHANNEL_PROMPTS[channel]['name']}\n{instruction}")
+
+        output_format = json.dumps(
+            {channel: f"{CHANNEL_PROMPTS[channel]['name']} 변환 결과" for channel in channels},
+            ensure_ascii=False,
+            indent=2
+        )
+        prompt = ChatPromptTemplate.from_template(FUSED_PROMPT).partial(
+            channel_instructions="\n\n".join(sections),
+            style_instruction=self._build_style_instruction(style_config) if style_config else "",
+            output_format=output_format
+        )
+        return prompt | self._llm_step(self.llm, "fused")
+
+    @staticmethod
+    def _parse_json_object(response_text: str) -> dict:
+        """LLM 응답에서 JSON 객체 추출 (마크다운 코드 블록 처리)"""
+        response_text = response_text.strip()
+        match = re.search(r'```(?:json)?\s*(.*?)\s*```', response_text, re.DOTALL)
+        if match:
+            response_text = match.group(1)
+        result = json.loads(response_text)
+        if not isinstance(result, dict):
+            raise ValueError("JSON 객체가 아닙니다.")
+        return result
+
+    async def atransform_with_stats(
+        self,
+        content: Optional[str] = None,
+        channels: list[str] = None,
+        style_config: dict = None,
+        custom_prompts: Optional[dict[str, str]] = None,
+        mode: str = "parallel",
+        max_concurrency: Optional[int] = None,
+        reuse_similar: bool = True
+    ) -> tuple[list[TransformedContent], dict]:
+        """
+        변환 모드에 따라 여러 채널을 변환하고 토큰/지연 통계를 함께 반환
+
+        Args:
+            mode: "parallel" (채널별 동시 호출) 또는 "fused" (호출 한 번)
+            reuse_similar: 조금 고친 원문이면 이전 변환 결과를 재사용 (False면 항상 새로 변환)
+        """
+        if mode not in ("parallel", "fused"):
+            raise ValueError(f"지원하지 않는 변환 모드: {mode}. 가능한 모드: ['parallel', 'fused']")
+
+        started = time.perf_counter()
+        text, condense_stats = await self.acondense(content)
+        if mode == "fused":
+            results, stats = await self.atransform_fused(text, channels, style_config, custom_prompts, max_concurrency, reuse_similar)
+        else:
+            results = await self.atransform_multi_with_style(text, channels, style_config, custom_prompts, max_concurrency, reuse_similar)
+            stats = self.usage_summary("parallel", results)
+        stats["condense"] = condense_stats
+        stats["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return results, stats
+
+    @staticmethod
+    def usage_summary(mode: str, results: list[TransformedContent], extra_usage: Optional[list[Optional[dict]]] = None) -> dict:
+        """변환 결과의 LLM 호출 수와 토큰 사용량 합계"""
+        usages = [result.usage for result in results if not result.cached] + list(extra_usage or [])
+        return {
+            "mode": mode,
+            "llm_calls": len(usages),
+            "cached_channels": [result.channel for result in results if result.cached],
+            "near_duplicate_channels": [result.channel for result in results if result.near_duplicate],
+            "input_tokens": sum(usage["input_tokens"] for usage in usages if usage),
+            "output_tokens": sum(usage["output_tokens"] for usage in usages if usage),
+            "cached_tokens": sum(usage.get("cached_tokens", 0) for usage in usages if usage)
+        }
+
     def transform_multi_with_style(self, content: Optional[str] = None, channels: list[str] = None, style_config: dict = None) -> list[TransformedContent]:
         """스타일 설정을 적용하여 여러 채널로 변환"""
         if channels is None:
             channels = list(CHANNEL_PROMPTS.keys())
         
-        text = self._get_content(content)
+        text = self.condense(content)
         
         results = []
         for channel in channels:
@@ -184,11 +686,36 @@ class ContentRepurposer:
         
         # LCEL 방식
         prompt = ChatPromptTemplate.from_template(CALENDAR_PROMPT)
-        chain = prompt | self.llm | StrOutputParser()
+        chain = prompt | self._llm_step(self.llm, "calendar") | StrOutputParser()
         
         result = chain.invoke({"transformed_contents": contents_text})
         
         return result
+
+    async def agenerate_calendar(self, transformed_contents: list[TransformedContent]) -> str:
+        """발행 캘린더 생성 (비동기)"""
+        contents_text = "\n\n".join([
+            f"[{tc.channel_name}]\n{tc.content}"
+            for tc in transformed_contents
+        ])
+
+        prompt = ChatPromptTemplate.from_template(CALENDAR_PROMPT)
+        chain = prompt | self._llm_step(self.llm, "calendar") | StrOutputParser()
+
+        return await chain.ainvoke({"transformed_contents": contents_text})
+
+    async def abuild_calendar(self, transformed_contents: list[TransformedContent], mode: str = "local") -> str:
+        """
+        발행 캘린더 생성
+
+        Args:
+            mode: "local" (규칙 기반, LLM 호출 없음) 또는 "llm" (Gemini로 생성)
+        """
+        if mode == "local":
+            return build_calendar([tc.channel for tc in transformed_contents])
+        if mode == "llm":
+            return await self.agenerate_calendar(transformed_contents)
+        raise ValueError(f"지원하지 않는 캘린더 모드: {mode}. 가능한 모드: ['local', 'llm']")
     
     @staticmethod
     def list_channels() -> dict:
@@ -0,0 +1,103 @@
+"""
+규칙 기반 발행 캘린더 생성기
+CALENDAR_PROMPT와 같은 규칙(평일=전문 채널, 주말=캐주얼 채널, 채널별 최적 발행 시간)을
+LLM 호출 없이 로컬에서 적용하여 동일한 JSON 구조의 주간 캘린더를 만듭니다.
+"""
+import json
+
+from prompts import CHANNEL_PROMPTS
+
+# (한글 요일, 영문 요일) - 월요일부터
+WEEKDAYS = [
+    ("월", "monday"),
+    ("화", "tuesday"),
+    ("수", "wednesday"),
+    ("목", "thursday"),
+    ("금", "friday"),
+    ("토", "saturday"),
+    ("일", "sunday"),
+]
+WEEKEND = {"saturday", "sunday"}
+
+# 채널별 선호 요일(우선순위 순), 발행 시간(한국 시간), 이유
+CHANNEL_SCHEDULE = {
+    "blog": {
+        "days": ["tuesday", "thursday", "monday", "wednesday", "friday"],
+        "time": "09:00",
+        "reason": "출근 직후 정보 탐색이 많은 평일 오전, 검색 유입에 유리",
+    },
+    "linkedin": {
+        "days": ["wednesday", "tuesday", "thursday", "monday", "friday"],
+        "time": "08:00",
+        "reason": "직장인이 출근길에 업무 관련 콘텐츠를 보는 평일 아침",
+    },
+    "twitter": {
+        "days": ["friday", "monday", "wednesday", "thursday", "tuesday"],
+        "time": "12:00",
+        "reason": "점심시간 실시간 피드 확인이 몰리는 평일 정오",
+    },
+    "instagram": {
+        "days": ["saturday", "sunday"],
+        "time": "19:00",
+        "reason": "여유롭게 피드를 둘러보는 주말 저녁, 캐주얼 콘텐츠에 적합",
+    },
+    "threads": {
+        "days": ["sunday", "saturday"],
+        "time": "21:00",
+        "reason": "대화와 댓글 참여가 활발한 주말 밤",
+    },
+}
+
+REST_DAY = {"channel": None, "channelName": "휴식", "time": "-", "reason": "발행 없음"}
+
+
+def _candidate_days(channel: str) -> list[str]:
+    """채널을 배정할 요일 후보 (선호 요일 → 같은 성격의 요일 → 나머지 요일)"""
+    preferred = CHANNEL_SCHEDULE.get(channel, {}).get("days", [])
+    is_casual = bool(preferred) and all(day in WEEKEND for day in preferred)
+    same_kind = [day for _, day in WEEKDAYS if (day in WEEKEND) == is_casual]
+    others = [day for _, day in WEEKDAYS]
+    ordered = []
+    for day in preferred + same_kind + others:
+        if day not in ordered:
+            ordered.append(day)
+    return ordered
+
+
+def build_schedule(channels: list[str]) -> list[dict]:
+    """
+    채널 목록으로 7일 발행 일정 생성
+
+    하루에 한 채널씩, 채널마다 가장 선호하는 빈 요일에 배정합니다.
+    배정되지 않은 요일은 '휴식'으로 표시합니다.
+    """
+    assigned: dict[str, str] = {}
+    for channel in dict.fromkeys(channels):
+        if channel not in CHANNEL_PROMPTS:
+            continue
+        for day in _candidate_days(channel):
+            if day not in assigned:
+                assigned[day] = channel
+                break
+
+    schedule = []
+    for day_ko, day_en in WEEKDAYS:
+        channel = assigned.get(day_en)
+        if channel is None:
+            schedule.append({"day": day_ko, "dayEn": day_en, **REST_DAY})
+            continue
+        config = CHANNEL_SCHEDULE.get(channel, {"time": "10:00", "reason": "채널 성격에 맞는 시간대"})
+        schedule.append({
+            "day": day_ko,
+            "dayEn": day_en,
+            "channel": channel,
+            "channelName": CHANNEL_PROMPTS[channel]["name"],
+            "time": config["time"],
+            "reason": config["reason"],
+        })
+    return schedule
+
+
+def build_calendar(channels: list[str]) -> str:
+    """generate_calendar와 같은 JSON 문자열 형식의 주간 캘린더"""
+    return json.dumps(build_schedule(channels), ensure_ascii=False, indent=2)
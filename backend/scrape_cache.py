@@ -0,0 +1,215 @@
+"""
+스크랩 결과 캐시 (HTTP 조건부 요청)
+정규화한 URL별로 원본 HTML, 추출한 ScrapedContent, 검증자(ETag / Last-Modified)를 저장합니다.
+ttl 안에서는 그대로 반환하고, 지나면 If-None-Match / If-Modified-Since로 재검증해
+304 응답이면 다운로드와 HTML 파싱을 모두 건너뜁니다.
+"""
+import os
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from dotenv import load_dotenv
+
+from metrics import CACHE_REQUESTS
+
+load_dotenv()
+
+# 정규화 시 제거하는 추적용 쿼리 파라미터
+TRACKING_PARAMS = ("utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content", "fbclid", "gclid")
+
+
+def normalize_url(url: str) -> str:
+    """캐시 키용 URL 정규화 (스킴/호스트 소문자, 프래그먼트/추적 파라미터 제거, 쿼리 정렬)"""
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+@dataclass
+class ScrapeCacheEntry:
+    """URL 하나의 스크랩 결과와 재검증 정보"""
+    content: dict  # ScrapedContent 필드
+    html: str
+    fetch_url: str  # 본문을 실제로 받은 URL (네이버는 iframe 주소, 재검증 시 이 주소로 바로 요청)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0  # 마지막으로 받았거나 재검증한 시각
+
+    def conditional_headers(self) -> dict:
+        """재검증 요청 헤더"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ScrapeCache:
+    """
+    스크랩 결과 캐시
+
+    - 1단계: 메모리 LRU (max_entries개까지 유지)
+    - 2단계: SQLite 디스크 캐시 (db_path 지정 시)
+    ttl(초) 안의 항목은 그대로 사용하고, 지난 항목은 재검증 대상으로 돌려줍니다.
+    max_age(초)가 지난 항목은 버립니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float = 600,
+        max_age: float = 7 * 86400,
+        db_path: Optional[str] = None
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_age = max_age
+        self.db_path = db_path
+
+        self._memory: OrderedDict[str, ScrapeCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            "fresh_hits": 0,
+            "revalidated": 0,
+            "changed": 0,
+            "misses": 0,
+            "evictions": 0
+        }
+
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS scrape_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )"""
+            )
+            self._db.commit()
+
+    @classmethod
+    def from_env(cls) -> "ScrapeCache":
+        """환경변수 설정으로 캐시 생성"""
+        return cls(
+            max_entries=int(os.getenv("SCRAPE_CACHE_SIZE", 256)),
+            ttl=float(os.getenv("SCRAPE_CACHE_TTL", 600)),
+            max_age=float(os.getenv("SCRAPE_CACHE_MAX_AGE", 7 * 86400)),
+            db_path=os.getenv("SCRAPE_CACHE_DB") or None
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 or self._db is not None
+
+    def is_fresh(self, entry: ScrapeCacheEntry) -> bool:
+        return time.time() - entry.fetched_at <= self.ttl
+
+    def get(self, url: str) -> Optional[ScrapeCacheEntry]:
+        """캐시 조회 (신선도와 관계없이 max_age 안의 항목 반환, 없으면 None)"""
+        key = normalize_url(url)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None and self._db is not None:
+                row = self._db.execute("SELECT value FROM scrape_cache WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    entry = ScrapeCacheEntry(**json.loads(row[0]))
+                    self._remember(key, entry)
+            if entry is not None and now - entry.fetched_at > self.max_age:
+                self._delete(key)
+                entry = None
+
+            if entry is None:
+                self._counters["misses"] += 1
+                CACHE_REQUESTS.inc(cache="scrape", result="miss")
+                return None
+            self._memory.move_to_end(key)
+            if now - entry.fetched_at <= self.ttl:
+                self._counters["fresh_hits"] += 1
+                CACHE_REQUESTS.inc(cache="scrape", result="fresh_hit")
+            return entry
+
+    def set(self, url: str, entry: ScrapeCacheEntry) -> None:
+        """새로 받은 결과 저장"""
+        if not self.enabled:
+            return
+        key = normalize_url(url)
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO scrape_cache (key, value, fetched_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(asdict(entry), ensure_ascii=False), entry.fetched_at)
+                )
+                self._db.commit()
+
+    def mark_revalidated(self, url: str, entry: ScrapeCacheEntry) -> None:
+        """304 응답 - 저장된 결과를 그대로 두고 신선도만 갱신"""
+        entry.fetched_at = time.time()
+        with self._lock:
+            self._counters["revalidated"] += 1
+        CACHE_REQUESTS.inc(cache="scrape", result="revalidated")
+        self.set(url, entry)
+
+    def mark_changed(self) -> None:
+        """재검증했지만 페이지가 바뀌어 새로 받은 경우"""
+        with self._lock:
+            self._counters["changed"] += 1
+        CACHE_REQUESTS.inc(cache="scrape", result="changed")
+
+    def _remember(self, key: str, entry: ScrapeCacheEntry) -> None:
+        """메모리 LRU에 저장 (락을 잡은 상태에서 호출)"""
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def _delete(self, key: str) -> None:
+        """항목 삭제 (락을 잡은 상태에서 호출)"""
+        self._memory.pop(key, None)
+        if self._db is not None:
+            self._db.execute("DELETE FROM scrape_cache WHERE key = ?", (key,))
+            self._db.commit()
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM scrape_cache")
+                self._db.commit()
+
+    def stats(self) -> dict:
+        """신선 적중/재검증/미스 통계와 크기"""
+        with self._lock:
+            lookups = self._counters["fresh_hits"] + self._counters["revalidated"] + self._counters["changed"] + self._counters["misses"]
+            disk_entries = None
+            if self._db is not None:
+                disk_entries = self._db.execute("SELECT COUNT(*) FROM scrape_cache").fetchone()[0]
+            return {
+                **self._counters,
+                "skipped_download_rate": round((self._counters["fresh_hits"] + self._counters["revalidated"]) / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "disk_entries": disk_entries,
+                "ttl": self.ttl,
+                "max_age": self.max_age
+            }
+
+
+# 프로세스 전역 스크랩 캐시
+scrape_cache = ScrapeCache.from_env()
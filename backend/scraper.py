@@ -1,11 +1,45 @@
 """
 블로그/웹페이지에서 콘텐츠 추출하는 모듈
 """
+import os
+import re
+import time
+import httpx
 import requests
+from abc import ABC, abstractmethod
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-from urllib.parse import urlparse
+from urllib.parse import urlparse, parse_qs, urlencode
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+
+from metrics import Counter, timed, UPSTREAM_ERRORS
+from tracing import span
+from executors import run_blocking
+from http_client import open_stream
+from html_stream import BoundedBody, ContentBoundaryScanner
+from scrape_cache import ScrapeCache, ScrapeCacheEntry, scrape_cache
+from selector_stats import SelectorRanker, selector_ranker, FALLBACK_SELECTOR
+
+# 추출 본문 최대 길이 (메모리 보호용, 변환 프롬프트 크기는 repurposer의 요약 단계가 제한)
+SCRAPE_MAX_CHARS = int(os.getenv("SCRAPE_MAX_CHARS", 100_000))
+
+# 응답 본문 최대 수신 크기 (바이트), 넘으면 받은 만큼만 파싱
+SCRAPE_MAX_BYTES = int(os.getenv("SCRAPE_MAX_BYTES", 2_000_000))
+# 본문 컨테이너가 닫히거나 본문 텍스트가 SCRAPE_MAX_CHARS만큼 모이면 나머지 다운로드 생략
+SCRAPE_EARLY_EXIT = os.getenv("SCRAPE_EARLY_EXIT", "1") not in ("0", "false", "False")
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# 네이버 블로그 본문 주소: mobile (m.blog.naver.com, 가벼움) 또는 desktop (iframe과 같은 PostView)
+NAVER_VIEW = os.getenv("NAVER_VIEW", "mobile")
+
+DOWNLOAD_STOPS = Counter("scrape_download_stops_total", "스크랩 다운로드를 끝까지 받지 않고 멈춘 수", ("reason",))
+
+# HTML 파서 엔진: auto (selectolax가 설치되어 있으면 사용), selectolax, soup
+SCRAPE_PARSER = os.getenv("SCRAPE_PARSER", "auto")
+
+# 본문 추출 전에 제거하는 요소
+REMOVED_TAGS = ["script", "style", "nav", "header", "footer", "aside", "iframe"]
 
 
 @dataclass
@@ -17,6 +51,184 @@ class ScrapedContent:
     source: str  # 블로그 플랫폼 (naver, tistory, etc.)
 
 
+_NAVER_HOSTS = ("blog.naver.com", "m.blog.naver.com")
+_NAVER_POST_PATH = re.compile(r"^/([A-Za-z0-9_-]+)/(\d+)/?$")
+
+
+def resolve_naver_post_url(url: str, view: str = NAVER_VIEW) -> Optional[str]:
+    """
+    네이버 블로그 글 주소를 본문 페이지(PostView) 주소로 바로 변환 (래퍼 페이지 요청 생략)
+
+    지원 형태:
+        blog.naver.com/{blogId}/{logNo}, m.blog.naver.com/{blogId}/{logNo}
+        blog.naver.com/PostView.naver?blogId=..&logNo=.. (.nhn 포함, m. 포함)
+        blog.naver.com/{blogId}?Redirect=Log&logNo=..
+    알 수 없는 형태(블로그 홈 등)면 None
+    """
+    parsed = urlparse(url.strip())
+    if parsed.netloc.lower() not in _NAVER_HOSTS:
+        return None
+    query = {name: values[0] for name, values in parse_qs(parsed.query).items()}
+
+    match = _NAVER_POST_PATH.match(parsed.path)
+    if match and not parsed.path.lower().startswith("/postview"):
+        blog_id, log_no = match.groups()
+    elif query.get("blogId") and query.get("logNo", "").isdigit():
+        blog_id, log_no = query["blogId"], query["logNo"]
+    elif query.get("logNo", "").isdigit() and re.fullmatch(r"/[A-Za-z0-9_-]+/?", parsed.path):
+        blog_id, log_no = parsed.path.strip("/"), query["logNo"]
+    else:
+        return None
+
+    if view == "desktop":
+        params = {"blogId": blog_id, "logNo": log_no, "redirect": "Dlog", "widgetTypeCall": "true", "directAccess": "false"}
+        return f"https://blog.naver.com/PostView.naver?{urlencode(params)}"
+    return f"https://m.blog.naver.com/PostView.naver?{urlencode({'blogId': blog_id, 'logNo': log_no})}"
+
+
+class HTMLParserBackend(ABC):
+    """
+    HTML 파서 엔진 공통 인터페이스
+
+    하위 클래스는 문서 생성, 요소 제거, 선택자 텍스트 추출만 구현하고
+    선택자 순회/본문 길이 판단은 모든 엔진이 같은 규칙(extract)을 따릅니다.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def parse(self, html: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove(self, document, tags: list[str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def first_text(self, document, selector: str) -> Optional[str]:
+        """선택자에 맞는 첫 요소의 텍스트 (텍스트 노드마다 앞뒤 공백 제거, 줄바꿈으로 연결). 없으면 None"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def title(self, document) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def attribute(self, document, selector: str, name: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def find_iframe_src(self, html: str, iframe_id: str) -> Optional[str]:
+        """iframe의 src 값 (네이버 블로그 본문 주소 찾기용)"""
+        return self.attribute(self.parse(html), f"iframe#{iframe_id}", "src")
+
+    def extract(self, html: str, selectors: list[str]) -> tuple[str, str, Optional[str]]:
+        """
+        불필요한 요소 제거 후 (제목, 본문, 본문을 찾은 선택자) 추출
+
+        선택자로 100자 이상을 못 찾으면 body 전체 사용
+        """
+        document = self.parse(html)
+        self.remove(document, REMOVED_TAGS)
+        title = self.title(document)
+
+        content = ""
+        matched = None
+        for selector in selectors:
+            text = self.first_text(document, selector)
+            if text is not None:
+                content, matched = text, selector
+                if len(content) > 100:  # 충분한 콘텐츠가 있으면 사용
+                    break
+
+        if not content or len(content) < 100:
+            body = self.first_text(document, FALLBACK_SELECTOR)
+            if body is not None:
+                content, matched = body, FALLBACK_SELECTOR
+        return title, content, matched
+
+
+class SoupParser(HTMLParserBackend):
+    """BeautifulSoup + 내장 html.parser (순수 파이썬, 추가 의존성 없음)"""
+
+    name = "soup"
+
+    def parse(self, html: str):
+        return BeautifulSoup(html, "html.parser")
+
+    def remove(self, document, tags: list[str]) -> None:
+        for tag in document.find_all(tags):
+            tag.decompose()
+
+    def first_text(self, document, selector: str) -> Optional[str]:
+        element = document.select_one(selector)
+        return element.get_text(separator="\n", strip=True) if element else None
+
+    def title(self, document) -> str:
+        title_tag = document.find("h1") or document.find("title")
+        return title_tag.get_text(strip=True) if title_tag else ""
+
+    def attribute(self, document, selector: str, name: str) -> Optional[str]:
+        element = document.select_one(selector)
+        return element.get(name) if element else None
+
+
+class SelectolaxParser(HTMLParserBackend):
+    """
+    selectolax (lexbor, C 구현) 파서
+
+    html.parser보다 수 배~수십 배 빠르고 파싱 중 GIL을 오래 잡지 않습니다.
+    같은 CSS 선택자(PLATFORM_SELECTORS)를 그대로 지원합니다.
+    """
+
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self._parser_class = LexborHTMLParser
+
+    def parse(self, html: str):
+        return self._parser_class(html)
+
+    def remove(self, document, tags: list[str]) -> None:
+        for node in document.css(", ".join(tags)):
+            node.decompose()
+
+    def first_text(self, document, selector: str) -> Optional[str]:
+        node = document.css_first(selector)
+        if node is None:
+            return None
+        return "\n".join(
+            text for text in (child.text_content.strip() for child in node.traverse(include_text=True) if child.tag == "-text")
+            if text
+        )
+
+    def title(self, document) -> str:
+        node = document.css_first("h1") or document.css_first("title")
+        return node.text(strip=True) if node is not None else ""
+
+    def attribute(self, document, selector: str, name: str) -> Optional[str]:
+        node = document.css_first(selector)
+        return node.attributes.get(name) if node is not None else None
+
+
+PARSER_BACKENDS = {
+    SoupParser.name: SoupParser,
+    SelectolaxParser.name: SelectolaxParser,
+}
+
+
+def get_parser_backend(name: str = SCRAPE_PARSER) -> HTMLParserBackend:
+    """이름으로 파서 엔진 생성 (auto면 selectolax, 설치되어 있지 않으면 soup)"""
+    if name == "auto":
+        try:
+            return SelectolaxParser()
+        except ImportError:
+            return SoupParser()
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"지원하지 않는 파서: {name}. 가능한 값: {['auto', *PARSER_BACKENDS]}")
+    return PARSER_BACKENDS[name]()
+
+
 class BlogScraper:
     """블로그 콘텐츠 스크래퍼"""
     
@@ -31,6 +243,8 @@ class BlogScraper:
             ".post-view",
             "#postViewArea",
             ".sect_dsc",
+            "#viewTypeSelector",  # 모바일 구 에디터
+            ".post_ct",
         ],
         "tistory": [
             ".entry-content",
@@ -60,9 +274,29 @@ class BlogScraper:
         ]
     }
     
-    def __init__(self):
+    # 호스트별 keep-alive 커넥션 풀 크기
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 20
+    
+    def __init__(
+        self,
+        cache: Optional[ScrapeCache] = None,
+        parser: Optional[HTMLParserBackend] = None,
+        ranker: Optional[SelectorRanker] = None
+    ):
+        self.cache = cache if cache is not None else scrape_cache
+        self.ranker = ranker if ranker is not None else selector_ranker
+        self.parser = parser or get_parser_backend()
         self.session = requests.Session()
         self.session.headers.update(self.HEADERS)
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS, pool_maxsize=self.POOL_MAXSIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    def close(self):
+        """커넥션 풀 정리, 선택자 통계 저장"""
+        self.session.close()
+        self.ranker.flush()
     
     def _detect_platform(self, url: str) -> str:
         """URL에서 블로그 플랫폼 감지"""
@@ -81,53 +315,100 @@ class BlogScraper:
         else:
             return "default"
     
+    def _new_body(self, content_type: Optional[str], platform: Optional[str], domain: Optional[str] = None) -> BoundedBody:
+        """
+        응답 본문 버퍼 (platform을 주면 해당 플랫폼 본문 컨테이너 기준으로 조기 종료)
+
+        조기 종료 기준은 추출할 때 처음 시도할 선택자(도메인 선택자 순위 반영)입니다.
+        시도할 선택자가 없으면(늘 body로 내려가는 도메인) 본문 전체가 필요하므로 조기 종료하지 않습니다.
+        """
+        scanner = None
+        if platform and SCRAPE_EARLY_EXIT:
+            selectors = self.ranker.peek(domain, self.PLATFORM_SELECTORS.get(platform, self.PLATFORM_SELECTORS["default"]))
+            if selectors:
+                scanner = ContentBoundaryScanner(selectors[0], SCRAPE_MAX_CHARS)
+        return BoundedBody(SCRAPE_MAX_BYTES, content_type, scanner)
+
+    @staticmethod
+    def _finish_body(body: BoundedBody) -> str:
+        if body.stop_reason:
+            DOWNLOAD_STOPS.inc(reason=body.stop_reason)
+        return body.text()
+
+    def _fetch_page(self, url: str, platform: Optional[str] = None) -> tuple[requests.Response, Optional[str]]:
+        """크기 제한 스트리밍 GET. (응답, HTML) 반환 - 성공 응답이 아니면 HTML은 None"""
+        with self.session.get(url, timeout=10, stream=True) as response:
+            if not response.ok:
+                return response, None
+            body = self._new_body(response.headers.get("Content-Type"), platform, SelectorRanker.domain_of(urlparse(url).netloc))
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+                if body.feed(chunk):
+                    break
+        return response, self._finish_body(body)
+
+    async def _afetch_page(self, url: str, platform: Optional[str] = None, headers: Optional[dict] = None) -> tuple[httpx.Response, Optional[str]]:
+        """_fetch_page의 비동기 버전 (공유 httpx 클라이언트 사용)"""
+        async with open_stream(url, headers=headers or {}) as response:
+            if not response.is_success:
+                return response, None
+            body = self._new_body(response.headers.get("Content-Type"), platform, SelectorRanker.domain_of(urlparse(url).netloc))
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_BYTES):
+                if body.feed(chunk):
+                    break
+        return response, self._finish_body(body)
+
     def _get_naver_blog_content(self, url: str) -> Optional[str]:
-        """네이버 블로그 iframe 처리"""
+        """네이버 블로그 본문 (알려진 주소 형태는 본문 페이지 한 번, 아니면 래퍼 페이지 → iframe)"""
         try:
-            response = self.session.get(url)
-            soup = BeautifulSoup(response.text, "html.parser")
+            post_url = resolve_naver_post_url(url)
+            if post_url:
+                _, html = self._fetch_page(post_url, "naver")
+                return html
+
+            _, html = self._fetch_page(url, "naver")
             
             # iframe URL 추출
-            iframe = soup.find("iframe", id="mainFrame")
-            if iframe and iframe.get("src"):
-                iframe_url = "https://blog.naver.com" + iframe["src"]
-                response = self.session.get(iframe_url)
-                return response.text
+            iframe_src = self.parser.find_iframe_src(html, "mainFrame") if html else None
+            if iframe_src:
+                iframe_url = "https://blog.naver.com" + iframe_src
+                with span("naver_iframe"):
+                    _, html = self._fetch_page(iframe_url, "naver")
             
-            return response.text
+            return html
         except Exception:
+            UPSTREAM_ERRORS.inc(upstream="scrape")
             return None
     
-    def _extract_content(self, html: str, platform: str) -> tuple[str, str]:
-        """HTML에서 제목과 본문 추출"""
-        soup = BeautifulSoup(html, "html.parser")
-        
-        # 불필요한 요소 제거
-        for tag in soup.find_all(["script", "style", "nav", "header", "footer", "aside", "iframe"]):
-            tag.decompose()
-        
-        # 제목 추출
-        title = ""
-        title_tag = soup.find("h1") or soup.find("title")
-        if title_tag:
-            title = title_tag.get_text(strip=True)
-        
-        # 본문 추출 - 플랫폼별 선택자 시도
-        selectors = self.PLATFORM_SELECTORS.get(platform, self.PLATFORM_SELECTORS["default"])
-        content = ""
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                content = element.get_text(separator="\n", strip=True)
-                if len(content) > 100:  # 충분한 콘텐츠가 있으면 사용
-                    break
-        
-        # 선택자로 못 찾으면 body에서 추출
-        if not content or len(content) < 100:
-            body = soup.find("body")
-            if body:
-                content = body.get_text(separator="\n", strip=True)
+    async def _aget_naver_blog_content(self, url: str) -> Optional[tuple[httpx.Response, Optional[str]]]:
+        """_get_naver_blog_content의 비동기 버전 (본문이 담긴 (응답, HTML) 반환)"""
+        try:
+            post_url = resolve_naver_post_url(url)
+            if post_url:
+                return await self._afetch_page(post_url, "naver")
+
+            response, html = await self._afetch_page(url, "naver")
+
+            iframe_src = self.parser.find_iframe_src(html, "mainFrame") if html else None
+            if iframe_src:
+                iframe_url = "https://blog.naver.com" + iframe_src
+                with span("naver_iframe"):
+                    response, html = await self._afetch_page(iframe_url, "naver")
+
+            return response, html
+        except Exception:
+            UPSTREAM_ERRORS.inc(upstream="scrape")
+            return None
+    
+    def _extract_content(self, html: str, platform: str, domain: Optional[str] = None) -> tuple[str, str]:
+        """
+        HTML에서 제목과 본문 추출 (플랫폼별 선택자 → body 순서, 파서 엔진은 SCRAPE_PARSER)
+
+        domain을 주면 그 도메인에서 본문을 찾았던 선택자를 먼저 시도하고 결과를 기록합니다.
+        """
+        baseline = self.PLATFORM_SELECTORS.get(platform, self.PLATFORM_SELECTORS["default"])
+        selectors = self.ranker.order(domain, baseline)
+        title, content, matched = self.parser.extract(html, selectors)
+        self.ranker.record(domain, baseline, selectors, matched)
         
         # 텍스트 정리
         lines = [line.strip() for line in content.split("\n") if line.strip()]
@@ -138,34 +419,91 @@ class BlogScraper:
     def scrape(self, url: str) -> ScrapedContent:
         """URL에서 콘텐츠 추출"""
         platform = self._detect_platform(url)
-        
+        with span("scrape", platform=platform):
+            return self._scrape(url, platform)
+
+    def _scrape(self, url: str, platform: str) -> ScrapedContent:
         try:
-            # 네이버 블로그는 특별 처리
-            if platform == "naver":
-                html = self._get_naver_blog_content(url)
-            else:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                html = response.text
+            with timed("scrape_fetch", upstream="scrape"):
+                # 네이버 블로그는 특별 처리
+                if platform == "naver":
+                    html = self._get_naver_blog_content(url)
+                else:
+                    response, html = self._fetch_page(url, platform)
+                    response.raise_for_status()
             
-            if not html:
-                raise ValueError("페이지를 불러올 수 없습니다.")
-            
-            title, content = self._extract_content(html, platform)
-            
-            if not content or len(content) < 50:
-                raise ValueError("콘텐츠를 추출할 수 없습니다. 페이지 구조를 확인하세요.")
-            
-            return ScrapedContent(
-                url=url,
-                title=title,
-                content=content[:5000],  # 최대 5000자로 제한
-                source=platform
-            )
+            return self._build_result(url, platform, html)
             
         except requests.RequestException as e:
             raise ValueError(f"페이지 요청 실패: {e}")
 
+    async def ascrape(self, url: str, revalidate: bool = False) -> ScrapedContent:
+        """
+        scrape()의 비동기 버전
+
+        프로세스 공유 httpx 클라이언트로 가져오므로 같은 호스트는 keep-alive(HTTP/2) 커넥션을 재사용하고,
+        HTML 파싱만 scrape executor에서 실행합니다. 본문은 SCRAPE_MAX_BYTES까지만 받고,
+        본문 컨테이너가 닫히면 나머지는 받지 않습니다.
+
+        스크랩 캐시에 SCRAPE_CACHE_TTL 안의 결과가 있으면 요청 없이 반환하고, 지난 결과는
+        ETag / Last-Modified로 재검증해 304이면 다운로드와 파싱 없이 저장된 결과를 반환합니다.
+        revalidate=True면 TTL 안의 결과도 요청 없이 쓰지 않고 항상 조건부 요청으로 확인합니다.
+        """
+        platform = self._detect_platform(url)
+        # 네이버는 주소 형태가 달라도 같은 글이면 같은 캐시 항목 사용
+        cache_url = (resolve_naver_post_url(url) or url) if platform == "naver" else url
+        cached = self.cache.get(cache_url)
+        if cached is not None and not revalidate and self.cache.is_fresh(cached):
+            return ScrapedContent(**{**cached.content, "url": url})
+
+        with span("scrape", platform=platform):
+            try:
+                with timed("scrape_fetch", upstream="scrape"):
+                    if cached is not None:
+                        # 재검증 - 본문 주소로 바로 조건부 요청 (네이버도 iframe 주소 한 번만 요청)
+                        response, html = await self._afetch_page(cached.fetch_url, platform, headers=cached.conditional_headers())
+                        if response.status_code == 304:
+                            self.cache.mark_revalidated(cache_url, cached)
+                            return ScrapedContent(**{**cached.content, "url": url})
+                        self.cache.mark_changed()
+                    elif platform == "naver":
+                        response, html = await self._aget_naver_blog_content(url) or (None, None)
+                    else:
+                        response, html = await self._afetch_page(url, platform)
+                    if response is not None:
+                        response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise ValueError(f"페이지 요청 실패: {e}")
+
+            result = await run_blocking("scrape", self._build_result, url, platform, html)
+            self.cache.set(cache_url, ScrapeCacheEntry(
+                content=asdict(result),
+                html=html,
+                fetch_url=str(response.url),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                fetched_at=time.time()
+            ))
+            return result
+
+    def _build_result(self, url: str, platform: str, html: Optional[str]) -> ScrapedContent:
+        """가져온 HTML에서 제목/본문을 추출해 ScrapedContent 생성"""
+        if not html:
+            raise ValueError("페이지를 불러올 수 없습니다.")
+        
+        with timed("html_parse"):
+            title, content = self._extract_content(html, platform, SelectorRanker.domain_of(urlparse(url).netloc))
+        
+        if not content or len(content) < 50:
+            raise ValueError("콘텐츠를 추출할 수 없습니다. 페이지 구조를 확인하세요.")
+        
+        return ScrapedContent(
+            url=url,
+            title=title,
+            content=content[:SCRAPE_MAX_CHARS],  # 긴 글은 변환 시 요약본으로 압축
+            source=platform
+        )
+
 
 def main():
     """테스트"""
@@ -3,8 +3,11 @@
 참고 스크립트를 기반으로 새로운 대본을 재구성
 """
 
+import time
 from typing import Optional
-from providers import get_provider, LLMResponse
+from providers import get_provider, LLMProvider, LLMResponse
+from usage import usage_tracker
+from tracing import span
 
 
 # 스크립트 재구성 프롬프트 템플릿
@@ -31,12 +34,33 @@ REWRITE_PROMPT_TEMPLATE = """## 참고 스크립트:
 """
 
 
+def _generate(provider: LLMProvider, channel: str, **kwargs) -> LLMResponse:
+    """provider.generate 호출 후 토큰 사용량/지연 시간을 usage_tracker에 기록"""
+    started = time.perf_counter()
+    try:
+        with span(f"llm.{channel}", model=provider.get_model_name()):
+            response = provider.generate(**kwargs)
+    except Exception:
+        usage_tracker.record(channel, provider.get_model_name(), latency=time.perf_counter() - started, error=True)
+        raise
+    usage_tracker.record(
+        channel,
+        response.model,
+        input_tokens=response.input_tokens or 0,
+        output_tokens=response.output_tokens or 0,
+        cached_tokens=response.cached_tokens or 0,
+        latency=time.perf_counter() - started
+    )
+    return response
+
+
 def rewrite_script(
     original_script: str,
     style: str = "informative",
     target_length: str = "similar",
     additional_instructions: str = "",
-    provider_name: str = "gemini"
+    provider_name: str = "gemini",
+    provider: Optional[LLMProvider] = None
 ) -> dict:
     """
     스크립트 재구성
@@ -47,6 +71,7 @@ def rewrite_script(
         target_length: 길이 ("shorter", "similar", "longer")
         additional_instructions: 추가 지시사항
         provider_name: LLM 제공자 ("gemini" 또는 "claude")
+        provider: 재사용할 Provider 인스턴스 (없으면 provider_name으로 새로 생성)
         
     Returns:
         dict: 재구성된 스크립트 및 메타데이터
@@ -80,11 +105,14 @@ def rewrite_script(
     )
     
     try:
-        # LLM Provider 가져오기
-        provider = get_provider(provider_name)
+        # LLM Provider 가져오기 (공유 인스턴스가 없을 때만 생성)
+        if provider is None:
+            provider = get_provider(provider_name)
         
         # 텍스트 생성
-        response = provider.generate(
+        response = _generate(
+            provider,
+            "script_rewrite",
             prompt=prompt,
             system_prompt=SYSTEM_PROMPT,
             temperature=0.7
@@ -109,7 +137,8 @@ def rewrite_script(
 
 def analyze_script(
     script: str,
-    provider_name: str = "gemini"
+    provider_name: str = "gemini",
+    provider: Optional[LLMProvider] = None
 ) -> dict:
     """
     스크립트 분석 (구조, 주제, 톤 파악)
@@ -127,8 +156,11 @@ def analyze_script(
 """
     
     try:
-        provider = get_provider(provider_name)
-        response = provider.generate(
+        if provider is None:
+            provider = get_provider(provider_name)
+        response = _generate(
+            provider,
+            "script_analysis",
             prompt=analysis_prompt,
             temperature=0.3  # 분석은 일관성 있게
         )
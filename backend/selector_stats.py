@@ -0,0 +1,202 @@
+"""
+도메인별 본문 선택자 순위
+도메인마다 어떤 선택자가 본문(100자 이상)을 찾았고 어떤 선택자가 매번 실패했는지 기록해,
+그 도메인에서 한 번도 본문을 찾지 못한 선택자는 다음 요청부터 시도하지 않습니다.
+늘 body로 내려가는 도메인은 선택자 탐색 없이 바로 body를 쓰고, 주기적인 확인 추출로만 다시 살펴봅니다.
+통계는 메모리에 모으고 SQLite(SELECTOR_STATS_DB, 기본 selector_stats.db)에 주기적으로 저장합니다.
+"""
+import os
+import time
+import sqlite3
+import threading
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 선택자 후보가 모두 실패했을 때 쓰는 최종 선택자 (HTMLParserBackend.extract, 순위에는 넣지 않음)
+FALLBACK_SELECTOR = "body"
+
+
+class SelectorRanker:
+    """
+    (도메인, 선택자)별 적중/실패 기록과 선택자 순서 결정
+
+    - hits: 그 선택자로 본문을 찾음
+    - misses: 시도했지만 요소가 없거나 본문이 짧아 다음 선택자로 넘어감
+    한 번도 적중하지 않고 min_misses번 이상 실패한 선택자는 목록에서 빼고 시도하지 않습니다.
+    나머지 선택자의 상대 순서는 플랫폼 순서 그대로이며, 모든 선택자가 빠진 도메인은 바로 body를 씁니다.
+    verify_every번째 추출마다 원래 순서로 모두 시도해 다시 쓰이게 된 선택자를 찾아냅니다
+    (한 번이라도 적중하면 더 이상 빼지 않음).
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        db_path: Optional[str] = None,
+        flush_interval: float = 30,
+        min_misses: int = 5,
+        verify_every: int = 20
+    ):
+        self.enabled = enabled
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.min_misses = min_misses
+        self.verify_every = verify_every
+
+        # 도메인 → 선택자 → [hits, misses]
+        self._stats: dict[str, dict[str, list[int]]] = {}
+        # 도메인 → 순서 결정 횟수 (원래 순서로 확인할 차례 계산용)
+        self._orders: dict[str, int] = {}
+        self._dirty: set[tuple[str, str]] = set()
+        self._last_flush = time.time()
+        self._lock = threading.Lock()
+        self._counters = {"extractions": 0, "selector_scans": 0, "scans_saved": 0, "reordered": 0, "verified": 0}
+
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS selector_stats (
+                    domain TEXT NOT NULL,
+                    selector TEXT NOT NULL,
+                    hits INTEGER NOT NULL,
+                    misses INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (domain, selector)
+                )"""
+            )
+            self._db.commit()
+            for domain, selector, hits, misses in self._db.execute("SELECT domain, selector, hits, misses FROM selector_stats"):
+                if selector != FALLBACK_SELECTOR:
+                    self._stats.setdefault(domain, {})[selector] = [hits, misses]
+
+    @classmethod
+    def from_env(cls) -> "SelectorRanker":
+        """환경변수 설정으로 생성"""
+        return cls(
+            enabled=os.getenv("SELECTOR_RANKING", "1") not in ("0", "false", "False"),
+            db_path=os.getenv("SELECTOR_STATS_DB", "selector_stats.db") or None,
+            flush_interval=float(os.getenv("SELECTOR_STATS_FLUSH_SECONDS", 30)),
+            min_misses=int(os.getenv("SELECTOR_MIN_MISSES", 5)),
+            verify_every=int(os.getenv("SELECTOR_VERIFY_EVERY", 20))
+        )
+
+    @staticmethod
+    def domain_of(host: str) -> str:
+        host = host.lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def _is_dead(self, counts: Optional[list[int]]) -> bool:
+        return counts is not None and counts[0] == 0 and counts[1] >= self.min_misses
+
+    def order(self, domain: Optional[str], selectors: list[str]) -> list[str]:
+        """도메인 기록에 따라 시도할 선택자 목록 (늘 실패한 선택자는 제외, 기록이 없으면 그대로)"""
+        if not self.enabled or not domain:
+            return selectors
+        with self._lock:
+            stats = self._stats.get(domain)
+            if not stats:
+                return selectors
+            count = self._orders.get(domain, 0) + 1
+            self._orders[domain] = count
+            if self.verify_every > 0 and count % self.verify_every == 0:
+                self._counters["verified"] += 1
+                return selectors
+            dead = [selector for selector in selectors if self._is_dead(stats.get(selector))]
+        if not dead:
+            return selectors
+        return [selector for selector in selectors if selector not in dead]
+
+    def peek(self, domain: Optional[str], selectors: list[str]) -> list[str]:
+        """다음 order() 호출이 돌려줄 선택자 목록 (기록/횟수는 바꾸지 않음, 스트리밍 조기 종료 기준용)"""
+        if not self.enabled or not domain:
+            return selectors
+        with self._lock:
+            stats = self._stats.get(domain)
+            if not stats:
+                return selectors
+            if self.verify_every > 0 and (self._orders.get(domain, 0) + 1) % self.verify_every == 0:
+                return selectors
+            return [selector for selector in selectors if not self._is_dead(stats.get(selector))]
+
+    def record(self, domain: Optional[str], baseline: list[str], tried: list[str], matched: Optional[str]) -> None:
+        """
+        추출 결과 기록
+
+        Args:
+            baseline: 원래 선택자 순서 (절약한 탐색 수 계산용)
+            tried: 실제 시도한 선택자 (order() 결과)
+            matched: 본문을 찾은 선택자 (body로 내려갔거나 못 찾았으면 body 또는 None)
+        """
+        if not self.enabled or not domain:
+            return
+        # matched 앞의 선택자는 모두 실패, body로 내려갔으면 목록 전체가 실패 (body 자체는 기록하지 않음)
+        scanned = tried[:tried.index(matched) + 1] if matched in tried else tried
+        would_scan = baseline[:baseline.index(matched) + 1] if matched in baseline else baseline
+        with self._lock:
+            stats = self._stats.setdefault(domain, {})
+            for selector in scanned:
+                counts = stats.setdefault(selector, [0, 0])
+                if selector == matched:
+                    counts[0] += 1
+                else:
+                    counts[1] += 1
+                self._dirty.add((domain, selector))
+            self._counters["extractions"] += 1
+            self._counters["selector_scans"] += len(scanned)
+            self._counters["scans_saved"] += max(0, len(would_scan) - len(scanned))
+            if tried != baseline:
+                self._counters["reordered"] += 1
+            due = self._db is not None and time.time() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """바뀐 기록을 SQLite에 저장"""
+        if self._db is None:
+            return
+        now = time.time()
+        with self._lock:
+            rows = [(domain, selector, *self._stats[domain][selector], now) for domain, selector in self._dirty]
+            self._dirty.clear()
+            self._last_flush = now
+            if rows:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO selector_stats (domain, selector, hits, misses, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._orders.clear()
+            self._dirty.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM selector_stats")
+                self._db.commit()
+
+    def stats(self, domain: Optional[str] = None) -> dict:
+        """전체 탐색 절약 통계와 도메인별 선택자 순위 (domain을 주면 해당 도메인만)"""
+        with self._lock:
+            domains = {
+                name: [
+                    {"selector": selector, "hits": hits, "misses": misses, "hit_rate": round(hits / (hits + misses), 4)}
+                    for selector, (hits, misses) in sorted(selectors.items(), key=lambda item: (-item[1][0], item[1][1]))
+                ]
+                for name, selectors in self._stats.items()
+                if domain is None or name == domain
+            }
+            return {
+                **self._counters,
+                "enabled": self.enabled,
+                "persisted": self._db is not None,
+                "min_misses": self.min_misses,
+                "verify_every": self.verify_every,
+                "domains": domains
+            }
+
+
+# 프로세스 전역 선택자 순위
+selector_ranker = SelectorRanker.from_env()
@@ -0,0 +1,212 @@
+"""
+유사 원문 감지 (SimHash)
+오타 수정이나 꼬리말 삭제처럼 조금만 고친 원문을 다시 보냈을 때,
+같은 채널/스타일로 이미 변환한 결과를 찾아 LLM 호출 없이 재사용할 수 있게 합니다.
+"""
+import os
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+FINGERPRINT_BITS = 64
+# 지문 비교 단위: 공백을 정규화한 원문의 글자 n-gram (한국어는 어절보다 글자 단위가 편집에 강함)
+SHINGLE_SIZE = 4
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def simhash(text: str) -> int:
+    """원문의 64비트 SimHash 지문 (비슷한 글일수록 다른 비트 수가 적음)"""
+    normalized = _WHITESPACE.sub(" ", text).strip().lower()
+    weights = [0] * FINGERPRINT_BITS
+    counts: dict[str, int] = {}
+    for i in range(max(1, len(normalized) - SHINGLE_SIZE + 1)):
+        shingle = normalized[i:i + SHINGLE_SIZE]
+        counts[shingle] = counts.get(shingle, 0) + 1
+
+    for shingle, count in counts.items():
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+@dataclass
+class NearDuplicate:
+    """찾은 유사 원문의 변환 결과 캐시 키와 유사도"""
+    cache_key: str
+    distance: int
+    similarity: float  # 1 - (다른 비트 수 / 64)
+
+
+class NearDuplicateIndex:
+    """
+    (변환 설정, SimHash 지문) → 변환 결과 캐시 키 색인
+
+    - 변환 설정 키(채널, 프롬프트, 스타일, 모델)가 같은 항목끼리만 비교합니다.
+    - 지문을 max_distance + 1개 구간으로 나눠 구간별 버킷에 넣으므로, 다른 비트가
+      max_distance개 이하인 지문은 적어도 한 구간이 같아 버킷 몇 개만 보면 찾을 수 있습니다.
+    - max_entries를 넘으면 가장 오래 쓰이지 않은 항목부터 지웁니다.
+    """
+
+    # 원문 해시 → 지문 메모 크기 (같은 원문을 여러 채널로 변환할 때 지문을 다시 계산하지 않음)
+    FINGERPRINT_MEMO_SIZE = 256
+
+    def __init__(self, max_distance: int = 3, max_entries: int = 2000, min_chars: int = 200):
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        self.min_chars = min_chars
+        bands = max(1, min(max_distance + 1, FINGERPRINT_BITS))
+        width = FINGERPRINT_BITS // bands
+        # (시작 비트, 비트 수) 목록, 나머지 비트는 마지막 구간에 포함
+        self._bands = [(i * width, width if i < bands - 1 else FINGERPRINT_BITS - i * width) for i in range(bands)]
+
+        # 캐시 키 → (변환 설정 키, 지문)
+        self._entries: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        # (변환 설정 키, 구간 번호, 구간 값) → 캐시 키 집합
+        self._buckets: dict[tuple[str, int, int], set[str]] = {}
+        # 원문 해시 → 지문
+        self._memo: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"lookups": 0, "hits": 0, "adds": 0, "evictions": 0, "fingerprints": 0}
+
+    @classmethod
+    def from_env(cls) -> "NearDuplicateIndex":
+        """환경변수 설정으로 색인 생성"""
+        return cls(
+            max_distance=int(os.getenv("NEAR_DUPLICATE_MAX_DISTANCE", 3)),
+            max_entries=int(os.getenv("NEAR_DUPLICATE_INDEX_SIZE", 2000)),
+            min_chars=int(os.getenv("NEAR_DUPLICATE_MIN_CHARS", 200))
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_distance > 0 and self.max_entries > 0
+
+    def _band_keys(self, variant_key: str, fingerprint: int) -> list[tuple[str, int, int]]:
+        return [
+            (variant_key, index, fingerprint >> start & ((1 << width) - 1))
+            for index, (start, width) in enumerate(self._bands)
+        ]
+
+    def fingerprint(self, text: str) -> Optional[int]:
+        """
+        원문의 SimHash 지문 (색인을 쓰지 않는 원문이면 None)
+
+        simhash는 순수 파이썬이라 긴 원문에서 수십 ms가 걸리므로, 같은 원문은 메모에서 돌려줍니다.
+        이벤트 루프에서는 run_blocking으로 호출하세요.
+        """
+        if not self.enabled or len(text) < self.min_chars:
+            return None
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with self._lock:
+            fingerprint = self._memo.get(digest)
+            if fingerprint is not None:
+                self._memo.move_to_end(digest)
+                return fingerprint
+        fingerprint = simhash(text)
+        with self._lock:
+            self._memo[digest] = fingerprint
+            self._counters["fingerprints"] += 1
+            while len(self._memo) > self.FINGERPRINT_MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return fingerprint
+
+    def add(self, variant_key: str, text: str, cache_key: str, fingerprint: Optional[int] = None) -> None:
+        """변환 결과를 색인에 추가 (fingerprint를 주면 지문을 다시 계산하지 않음)"""
+        if not self.enabled or len(text) < self.min_chars:
+            return
+        if fingerprint is None:
+            fingerprint = self.fingerprint(text)
+        with self._lock:
+            self._remove(cache_key)
+            self._entries[cache_key] = (variant_key, fingerprint)
+            for band_key in self._band_keys(variant_key, fingerprint):
+                self._buckets.setdefault(band_key, set()).add(cache_key)
+            self._counters["adds"] += 1
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._counters["evictions"] += 1
+
+    def find(self, variant_key: str, text: str, fingerprint: Optional[int] = None) -> Optional[NearDuplicate]:
+        """같은 변환 설정에서 가장 비슷한 원문 찾기 (max_distance 이하가 없으면 None, fingerprint를 주면 재사용)"""
+        if not self.enabled or len(text) < self.min_chars:
+            return None
+        if fingerprint is None:
+            fingerprint = self.fingerprint(text)
+        with self._lock:
+            self._counters["lookups"] += 1
+            candidates = set()
+            for band_key in self._band_keys(variant_key, fingerprint):
+                candidates |= self._buckets.get(band_key, set())
+
+            best: Optional[tuple[int, str]] = None
+            for cache_key in candidates:
+                distance = hamming(fingerprint, self._entries[cache_key][1])
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    best = (distance, cache_key)
+            if best is None:
+                return None
+
+            distance, cache_key = best
+            self._entries.move_to_end(cache_key)
+            self._counters["hits"] += 1
+        return NearDuplicate(
+            cache_key=cache_key,
+            distance=distance,
+            similarity=round(1 - distance / FINGERPRINT_BITS, 4)
+        )
+
+    def discard(self, cache_key: str) -> None:
+        """캐시에서 사라진 결과를 색인에서 제거"""
+        with self._lock:
+            self._remove(cache_key)
+
+    def _remove(self, cache_key: str) -> None:
+        """항목 제거 (락을 잡은 상태에서 호출)"""
+        entry = self._entries.pop(cache_key, None)
+        if entry is None:
+            return
+        for band_key in self._band_keys(*entry):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(cache_key)
+                if not bucket:
+                    del self._buckets[band_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self._memo.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._counters["lookups"]
+            return {
+                **self._counters,
+                "hit_rate": round(self._counters["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "max_distance": self.max_distance,
+                "min_chars": self.min_chars
+            }
+
+
+# 프로세스 전역 유사 원문 색인
+near_duplicate_index = NearDuplicateIndex.from_env()
@@ -8,9 +8,18 @@ import os
 from dotenv import load_dotenv
 import json
 import re
+import time
+
+from ratelimit import get_limiter, estimate_tokens
+from usage import usage_tracker
+from tracing import span
+from chunking import sample_excerpt
 
 load_dotenv()
 
+# 문체 분석에 보낼 원문 길이 (긴 글은 앞/중간/끝 단락을 골라 발췌)
+STYLE_SAMPLE_CHARS = 8000
+
 
 class StyleAnalyzer:
     """Analyzes writing style from blog content and generates prompts."""
@@ -20,7 +29,9 @@ class StyleAnalyzer:
         if not api_key:
             raise ValueError("GEMINI_API_KEY 환경 변수가 설정되지 않았습니다.")
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash-lite')
+        self.model_name = 'gemini-2.5-flash-lite'
+        self.model = genai.GenerativeModel(self.model_name)
+        self.limiter = get_limiter("gemini", self.model_name)
 
     def analyze_style(self, content: str) -> dict:
         """
@@ -36,7 +47,7 @@ class StyleAnalyzer:
 
 분석할 글:
 ---
-{content[:8000]}
+{sample_excerpt(content, STYLE_SAMPLE_CHARS)}
 ---
 
 **특히 다음 두 가지에 집중하여 분석해주세요:**
@@ -84,8 +95,26 @@ class StyleAnalyzer:
 
 **중요: 각 분석 필드는 3-5문장으로! generated_prompt만 길고 상세하게!**"""
 
+        # 한도 초과(RateLimitExceeded)는 분석 실패로 삼키지 않고 호출한 쪽으로 전달
+        self.limiter.acquire_sync(estimate_tokens(analysis_prompt, 2048))
+
         try:
-            response = self.model.generate_content(analysis_prompt)
+            started = time.perf_counter()
+            try:
+                with span("llm.style_analysis", model=self.model_name):
+                    response = self.model.generate_content(analysis_prompt)
+            except Exception:
+                usage_tracker.record("style_analysis", self.model_name, latency=time.perf_counter() - started, error=True)
+                raise
+            usage = response.usage_metadata
+            usage_tracker.record(
+                "style_analysis",
+                self.model_name,
+                input_tokens=usage.prompt_token_count,
+                output_tokens=usage.candidates_token_count,
+                cached_tokens=usage.cached_content_token_count,
+                latency=time.perf_counter() - started
+            )
             response_text = response.text.strip()
             
             # Extract JSON from response (handle markdown code blocks)
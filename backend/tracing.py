@@ -0,0 +1,134 @@
+"""
+요청 단위 추적 (span)
+요청마다 스크랩, 파싱, LLM 호출, YouTube API 호출 등의 구간 시간을 모아
+Server-Timing 응답 헤더로 보내고, 설정하면 JSON 추적 로그로도 남깁니다.
+span은 ContextVar로 전달되므로 run_blocking으로 넘긴 executor 스레드 안의 구간도 같은 요청에 기록됩니다.
+"""
+import os
+import re
+import json
+import time
+import uuid
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Server-Timing 헤더 출력 여부 (내부 구간 이름을 숨기려면 0)
+SERVER_TIMING = os.getenv("SERVER_TIMING", "1") not in ("0", "false", "False")
+# JSON 추적 로그 출력 여부와, 이 시간(ms) 이상 걸린 요청만 기록하는 기준
+TRACE_LOG = os.getenv("TRACE_LOG", "0") in ("1", "true", "True")
+TRACE_LOG_SLOW_MS = float(os.getenv("TRACE_LOG_SLOW_MS", 0))
+
+_TOKEN_INVALID = re.compile(r"[^A-Za-z0-9!#$%&'*+\-.^_`|~]")
+
+
+class Trace:
+    """요청 하나의 span 모음"""
+
+    def __init__(self):
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.started = time.perf_counter()
+        self.spans: list[dict] = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, started: float, duration: float, **attrs) -> None:
+        """구간 추가 (started는 time.perf_counter 값, duration은 초)"""
+        record = {
+            "name": name,
+            "start_ms": round((started - self.started) * 1000, 2),
+            "duration_ms": round(duration * 1000, 2),
+            **attrs,
+        }
+        with self._lock:
+            self.spans.append(record)
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started) * 1000, 2)
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (구간 순서대로, 마지막에 전체 시간)"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda record: record["start_ms"])
+        entries = []
+        for record in spans:
+            entry = f'{_TOKEN_INVALID.sub("_", record["name"])};dur={record["duration_ms"]}'
+            if "channel" in record:
+                entry += f';desc="{_TOKEN_INVALID.sub("_", str(record["channel"]))}"'
+            entries.append(entry)
+        entries.append(f"total;dur={self.elapsed_ms()}")
+        return ", ".join(entries)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            spans = sorted(self.spans, key=lambda record: record["start_ms"])
+        return {"trace_id": self.trace_id, "duration_ms": self.elapsed_ms(), "spans": spans}
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """with 블록을 현재 요청의 span으로 기록 (요청 밖에서는 아무것도 하지 않음)"""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    started = time.perf_counter()
+    error = None
+    try:
+        yield
+    except Exception as e:
+        error = type(e).__name__
+        raise
+    finally:
+        if error:
+            attrs["error"] = error
+        trace.add(name, started, time.perf_counter() - started, **attrs)
+
+
+def _log(trace: Trace, method: str, path: str, status: int) -> None:
+    record = trace.to_dict()
+    if record["duration_ms"] < TRACE_LOG_SLOW_MS:
+        return
+    print(json.dumps({"trace": {"method": method, "path": path, "status": status, **record}}, ensure_ascii=False))  # Server log
+
+
+async def trace_request(request, call_next):
+    """
+    요청마다 Trace를 만들고 Server-Timing / X-Trace-Id 헤더 추가 (FastAPI http 미들웨어)
+
+    스트리밍 응답은 헤더가 먼저 나가므로 헤더에는 응답 시작 전 구간만 담기고,
+    JSON 로그는 본문 전송이 끝난 뒤 전체 구간으로 남깁니다.
+    """
+    trace = Trace()
+    token = _current_trace.set(trace)
+    try:
+        response = await call_next(request)
+    finally:
+        _current_trace.reset(token)
+
+    response.headers["X-Trace-Id"] = trace.trace_id
+    if SERVER_TIMING:
+        response.headers["Server-Timing"] = trace.server_timing()
+
+    if TRACE_LOG:
+        body = response.body_iterator
+
+        async def logged_body():
+            try:
+                async for chunk in body:
+                    yield chunk
+            finally:
+                _log(trace, request.method, request.url.path, response.status_code)
+
+        response.body_iterator = logged_body()
+    return response
@@ -0,0 +1,178 @@
+"""
+LLM 토큰/비용 집계
+모든 LLM 호출의 입력/출력/캐시 토큰, 지연 시간, 추정 비용을 엔드포인트·채널·모델별로 모읍니다.
+엔드포인트는 요청 미들웨어가 current_endpoint에 기록하고, executor 스레드까지 그대로 전달됩니다.
+"""
+import os
+import json
+import time
+import threading
+from contextvars import ContextVar
+from typing import Optional
+from uuid import UUID
+from dotenv import load_dotenv
+from langchain_core.callbacks import BaseCallbackHandler
+
+from metrics import LLM_LATENCY, UPSTREAM_ERRORS
+from tracing import Trace, current_trace
+
+load_dotenv()
+
+# 모델별 100만 토큰당 가격(USD): (입력, 출력, 캐시 입력). MODEL_PRICES 환경변수(JSON)로 덮어쓸 수 있음
+DEFAULT_MODEL_PRICES = {
+    "gemini-2.5-flash": (0.30, 2.50, 0.075),
+    "gemini-2.5-flash-lite": (0.10, 0.40, 0.025),
+}
+MODEL_PRICES = {
+    **DEFAULT_MODEL_PRICES,
+    **{model: tuple(prices) for model, prices in json.loads(os.getenv("MODEL_PRICES", "{}")).items()},
+}
+
+# 현재 요청의 엔드포인트 (예: "POST /transform"), 요청 밖(작업 워커 등)에서는 직접 지정
+current_endpoint: ContextVar[str] = ContextVar("current_endpoint", default="-")
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int, cached_tokens: int = 0) -> float:
+    """토큰 수로 추정 비용(USD) 계산 (가격표에 없는 모델은 0)"""
+    prices = MODEL_PRICES.get(model.removeprefix("models/"))
+    if prices is None:
+        return 0.0
+    input_price, output_price, cached_price = prices
+    uncached = max(0, input_tokens - cached_tokens)
+    return (uncached * input_price + cached_tokens * cached_price + output_tokens * output_price) / 1_000_000
+
+
+class UsageTracker:
+    """(엔드포인트, 채널, 모델)별 LLM 사용량 누적기"""
+
+    FIELDS = ("calls", "errors", "input_tokens", "output_tokens", "cached_tokens", "latency_ms", "cost_usd")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rows: dict[tuple[str, str, str], dict] = {}
+
+    def record(
+        self,
+        channel: str,
+        model: str,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cached_tokens: int = 0,
+        latency: float = 0.0,
+        error: bool = False,
+        endpoint: Optional[str] = None
+    ) -> None:
+        """LLM 호출 1건 기록 (latency는 초 단위, /metrics 히스토그램에도 반영)"""
+        model = model.removeprefix("models/")
+        LLM_LATENCY.observe(latency, channel=channel, model=model)
+        if error:
+            UPSTREAM_ERRORS.inc(upstream="llm")
+        key = (endpoint or current_endpoint.get(), channel, model)
+        with self._lock:
+            row = self._rows.setdefault(key, dict.fromkeys(self.FIELDS, 0))
+            row["calls"] += 1
+            row["errors"] += int(error)
+            row["input_tokens"] += input_tokens
+            row["output_tokens"] += output_tokens
+            row["cached_tokens"] += cached_tokens
+            row["latency_ms"] += latency * 1000
+            row["cost_usd"] += estimate_cost(model, input_tokens, output_tokens, cached_tokens)
+
+    @classmethod
+    def _rollup(cls, rows: list[tuple[tuple, dict]], position: int) -> dict:
+        grouped: dict[str, dict] = {}
+        for key, row in rows:
+            total = grouped.setdefault(key[position], dict.fromkeys(cls.FIELDS, 0))
+            for field in cls.FIELDS:
+                total[field] += row[field]
+        return {name: cls._format(total) for name, total in grouped.items()}
+
+    @staticmethod
+    def _format(row: dict) -> dict:
+        calls = row["calls"]
+        return {
+            **row,
+            "latency_ms": round(row["latency_ms"], 1),
+            "avg_latency_ms": round(row["latency_ms"] / calls, 1) if calls else 0.0,
+            "cost_usd": round(row["cost_usd"], 6),
+        }
+
+    def stats(self) -> dict:
+        """엔드포인트/채널/모델별 합계와 토큰을 가장 많이 쓴 조합 순 상세 목록"""
+        with self._lock:
+            rows = [(key, dict(row)) for key, row in self._rows.items()]
+        rows.sort(key=lambda item: item[1]["input_tokens"] + item[1]["output_tokens"], reverse=True)
+        total = dict.fromkeys(self.FIELDS, 0)
+        for _, row in rows:
+            for field in self.FIELDS:
+                total[field] += row[field]
+        return {
+            "total": self._format(total),
+            "by_endpoint": self._rollup(rows, 0),
+            "by_channel": self._rollup(rows, 1),
+            "by_model": self._rollup(rows, 2),
+            "rows": [
+                {"endpoint": endpoint, "channel": channel, "model": model, **self._format(row)}
+                for (endpoint, channel, model), row in rows
+            ],
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._rows.clear()
+
+
+usage_tracker = UsageTracker()
+
+
+class UsageCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain 채팅 모델 호출의 usage_metadata를 usage_tracker에 기록
+
+    invoke/ainvoke/astream 모두 on_llm_end가 호출되므로 스트리밍 응답도 집계됩니다.
+    """
+
+    run_inline = True  # 엔드포인트 ContextVar를 읽기 위해 호출한 컨텍스트에서 바로 실행
+
+    def __init__(self, channel: str, model: str, tracker: UsageTracker = usage_tracker):
+        self.channel = channel
+        self.model = model
+        self.tracker = tracker
+        self._started: dict[UUID, tuple[float, str, Optional[Trace]]] = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs) -> None:
+        self._started[run_id] = (time.perf_counter(), current_endpoint.get(), current_trace())
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs) -> None:
+        started, endpoint, trace = self._started.pop(run_id, (time.perf_counter(), None, None))
+        input_tokens = output_tokens = cached_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                metadata = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                input_tokens += metadata.get("input_tokens", 0)
+                output_tokens += metadata.get("output_tokens", 0)
+                cached_tokens += (metadata.get("input_token_details") or {}).get("cache_read", 0)
+        self.tracker.record(
+            self.channel,
+            self.model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cached_tokens=cached_tokens,
+            latency=time.perf_counter() - started,
+            endpoint=endpoint
+        )
+        if trace is not None:
+            trace.add(
+                f"llm.{self.channel}",
+                started,
+                time.perf_counter() - started,
+                model=self.model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens
+            )
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs) -> None:
+        started, endpoint, trace = self._started.pop(run_id, (time.perf_counter(), None, None))
+        self.tracker.record(self.channel, self.model, latency=time.perf_counter() - started, error=True, endpoint=endpoint)
+        if trace is not None:
+            trace.add(f"llm.{self.channel}", started, time.perf_counter() - started, model=self.model, error=type(error).__name__)
@@ -11,6 +11,7 @@ from dataclasses import dataclass
 import re
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from metrics import timed
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -145,7 +146,8 @@ def search_videos(keyword: str, filters: SearchFilters, max_results: int = 50) -
         if published_after:
             search_params["publishedAfter"] = published_after
         
-        search_response = youtube.search().list(**search_params).execute()
+        with timed("youtube_search", upstream="youtube"):
+            search_response = youtube.search().list(**search_params).execute()
         
         videos = []
         for item in search_response.get("items", []):
@@ -169,10 +171,11 @@ def get_video_statistics(video_ids: list[str]) -> dict:
     youtube = create_youtube_client()
     
     try:
-        stats_response = youtube.videos().list(
-            part="statistics,contentDetails",
-            id=",".join(video_ids)
-        ).execute()
+        with timed("youtube_stats", upstream="youtube"):
+            stats_response = youtube.videos().list(
+                part="statistics,contentDetails",
+                id=",".join(video_ids)
+            ).execute()
         
         stats = {}
         for item in stats_response.get("items", []):
@@ -0,0 +1,120 @@
+"""
+블로킹 호출 전용 스레드 풀 + 이벤트 루프 지연 모니터
+동기 라이브러리(requests, google-generativeai, googleapiclient, youtube-transcript-api) 호출을
+업스트림 종류별로 크기를 따로 잡은 executor에서 실행하여 uvicorn 이벤트 루프를 막지 않습니다.
+"""
+import os
+import time
+import asyncio
+import functools
+import contextvars
+import statistics
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# 업스트림 종류별 최대 동시 스레드 수
+EXECUTOR_SIZES = {
+    "scrape": int(os.getenv("SCRAPE_WORKERS", 16)),
+    "llm": int(os.getenv("LLM_WORKERS", 8)),
+    "youtube": int(os.getenv("YOUTUBE_WORKERS", 8)),
+}
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+
+
+def get_executor(kind: str) -> ThreadPoolExecutor:
+    """업스트림 종류(scrape, llm, youtube)에 해당하는 executor 반환"""
+    if kind not in EXECUTOR_SIZES:
+        raise ValueError(f"Unknown executor: {kind}. 가능한 값: {list(EXECUTOR_SIZES.keys())}")
+    executor = _executors.get(kind)
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=EXECUTOR_SIZES[kind], thread_name_prefix=f"{kind}-worker")
+        _executors[kind] = executor
+    return executor
+
+
+async def run_blocking(kind: str, func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    블로킹 함수를 해당 종류의 executor에서 실행하고 결과를 기다림
+
+    asyncio.to_thread처럼 현재 contextvars를 워커 스레드로 전달합니다.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(kind), call)
+
+
+def executor_stats() -> dict:
+    """executor별 크기와 대기 중인 작업 수"""
+    return {
+        kind: {
+            "max_workers": size,
+            "threads": len(_executors[kind]._threads) if kind in _executors else 0,
+            "queued": _executors[kind]._work_queue.qsize() if kind in _executors else 0,
+        }
+        for kind, size in EXECUTOR_SIZES.items()
+    }
+
+
+def shutdown_executors() -> None:
+    """모든 executor 종료 (앱 종료 시 호출)"""
+    for executor in _executors.values():
+        executor.shutdown(wait=False, cancel_futures=True)
+    _executors.clear()
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 지연 측정기
+
+    interval초마다 sleep을 걸고 실제로 깨어난 시각과의 차이를 기록합니다.
+    블로킹 호출이 루프를 잡고 있으면 이 값이 커집니다.
+    """
+
+    def __init__(self, interval: float = 0.1, window: int = 600):
+        self.interval = interval
+        self._samples: deque[float] = deque(maxlen=window)
+        self._max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - started - self.interval)
+            self._samples.append(lag)
+            self._max_lag = max(self._max_lag, lag)
+
+    def stats(self) -> dict:
+        """최근 window개 샘플 기준 지연 통계 (ms)"""
+        if not self._samples:
+            return {"samples": 0, "current_ms": 0.0, "mean_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(self._samples)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return {
+            "samples": len(ordered),
+            "current_ms": round(self._samples[-1] * 1000, 2),
+            "mean_ms": round(statistics.mean(ordered) * 1000, 2),
+            "p99_ms": round(p99 * 1000, 2),
+            "max_ms": round(self._max_lag * 1000, 2),
+        }
+
+
+loop_lag_monitor = LoopLagMonitor()
@@ -3,22 +3,46 @@ YouTube 인기 영상 분석 API 서버
 필터링 및 가중치 조절 기능 지원
 """
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel
 from typing import Optional
+from contextlib import asynccontextmanager
 import youtube_analyzer
 from youtube_analyzer import SearchFilters
 import transcript
 import script_generator
 import config
+from providers import get_provider
+import metrics
+from tracing import trace_request
+from executors import run_blocking, executor_stats, shutdown_executors, loop_lag_monitor
+from usage import usage_tracker, current_endpoint
+from ratelimit import limiter_stats
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """이벤트 루프 지연 모니터 시작 / 라우팅 Provider 준비 / 종료 시 executor 정리"""
+    try:
+        # 지연 통계가 요청 사이에 유지되도록 "auto" Provider를 미리 생성
+        app.state.router = get_provider("auto")
+    except ValueError as e:
+        app.state.router = None
+        print(f"[lifespan] LLM 라우팅 Provider 생성 실패: {e}")  # Server log
+    loop_lag_monitor.start()
+    yield
+    await loop_lag_monitor.stop()
+    shutdown_executors()
+
 
 app = FastAPI(
     title="YouTube 콘텐츠 플래너",
     description="인기 영상 분석 및 AI 스크립트 재구성 도구",
-    version="2.3.0"
+    version="2.3.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -30,6 +54,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우트별 요청 지연 시간/상태 코드/동시 처리 수 기록
+app.middleware("http")(metrics.track_request)
+# 요청 구간별 시간을 Server-Timing 헤더 / JSON 추적 로그로 출력
+app.middleware("http")(trace_request)
+
+
+@app.middleware("http")
+async def track_endpoint(request: Request, call_next):
+    """LLM 사용량을 엔드포인트별로 집계할 수 있도록 현재 요청 경로 기록"""
+    current_endpoint.set(f"{request.method} {request.url.path}")
+    return await call_next(request)
+
 # 정적 파일 서빙
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -107,14 +143,14 @@ async def get_trending_videos(
         # 여러 키워드로 검색하여 영상 수집
         for keyword in trending_keywords[:2]:  # API 할당량 절약을 위해 2개만
             try:
-                results = youtube_analyzer.analyze_top_videos(keyword, 10, filters)
+                results = await run_blocking("youtube", youtube_analyzer.analyze_top_videos, keyword, 10, filters)
                 all_videos.extend(results)
             except:
                 continue
         
         if not all_videos:
             # 대체 키워드 시도
-            results = youtube_analyzer.analyze_top_videos("trending", top_n, filters)
+            results = await run_blocking("youtube", youtube_analyzer.analyze_top_videos, "trending", top_n, filters)
             all_videos = results
         
         # 중복 제거 (video_id 기준)
@@ -174,7 +210,7 @@ async def search_top_videos_get(
             min_views=min_views
         )
         
-        results = youtube_analyzer.analyze_top_videos(keyword, top_n, filters)
+        results = await run_blocking("youtube", youtube_analyzer.analyze_top_videos, keyword, top_n, filters)
         
         return {
             "success": True,
@@ -218,8 +254,10 @@ async def search_top_videos_post(request: SearchRequest):
             min_views=request.min_views
         )
         
-        results = youtube_analyzer.analyze_top_videos(
-            request.keyword, 
+        results = await run_blocking(
+            "youtube",
+            youtube_analyzer.analyze_top_videos,
+            request.keyword,
             request.top_n, 
             filters
         )
@@ -240,10 +278,26 @@ async def health_check():
     return {
         "status": "healthy",
         "api_key_configured": bool(config.YOUTUBE_API_KEY),
-        "version": "2.2.0"
+        "version": "2.2.0",
+        "event_loop_lag": loop_lag_monitor.stats(),
+        "executors": executor_stats(),
+        "llm_routing": app.state.router.stats() if getattr(app.state, "router", None) else None,
+        "rate_limits": limiter_stats()
     }
 
 
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus 텍스트 형식 지표"""
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@app.get("/api/usage")
+async def llm_usage():
+    """엔드포인트/채널/모델별 LLM 토큰 사용량, 지연 시간, 추정 비용"""
+    return usage_tracker.stats()
+
+
 @app.get("/api/transcript/{video_id}")
 async def get_video_transcript(
     video_id: str,
@@ -266,7 +320,9 @@ async def get_video_transcript(
     }
     languages = lang_priority.get(lang, ["ko", "en"])
     
-    result = transcript.get_transcript(
+    result = await run_blocking(
+        "youtube",
+        transcript.get_transcript,
         video_id,
         languages=languages,
         include_timestamps=timestamps
@@ -284,7 +340,7 @@ async def get_video_transcript(
 @app.get("/api/transcript/{video_id}/languages")
 async def get_available_transcript_languages(video_id: str):
     """해당 영상에서 사용 가능한 자막 언어 목록 조회"""
-    result = transcript.get_available_languages(video_id)
+    result = await run_blocking("youtube", transcript.get_available_languages, video_id)
     
     if not result["success"]:
         raise HTTPException(
@@ -305,7 +361,7 @@ class RewriteRequest(BaseModel):
     style: str = "informative"  # informative, entertaining, educational, conversational
     target_length: str = "similar"  # shorter, similar, longer
     additional_instructions: str = ""
-    provider: str = "gemini"  # gemini, claude
+    provider: str = "gemini"  # gemini, claude, auto (라우팅 + 헤지, 명시적으로 선택할 때만)
 
 
 @app.post("/api/rewrite")
@@ -316,7 +372,7 @@ async def rewrite_script_api(request: RewriteRequest):
     - original_script: 원본 스크립트
     - style: 스타일 (informative, entertaining, educational, conversational)
     - target_length: 길이 (shorter, similar, longer)
-    - provider: LLM 제공자 (gemini, claude)
+    - provider: LLM 제공자 (기본 gemini, claude, auto=라우팅 + 헤지)
     """
     if not request.original_script.strip():
         raise HTTPException(
@@ -324,7 +380,9 @@ async def rewrite_script_api(request: RewriteRequest):
             detail="원본 스크립트가 비어있습니다."
         )
     
-    result = script_generator.rewrite_script(
+    result = await run_blocking(
+        "llm",
+        script_generator.rewrite_script,
         original_script=request.original_script,
         style=request.style,
         target_length=request.target_length,
@@ -334,7 +392,7 @@ async def rewrite_script_api(request: RewriteRequest):
     
     if not result["success"]:
         raise HTTPException(
-            status_code=500,
+            status_code=429 if result.get("rate_limited") else 500,
             detail=result["error"]
         )
     
@@ -350,14 +408,16 @@ async def analyze_script_api(request: RewriteRequest):
             detail="스크립트가 비어있습니다."
         )
     
-    result = script_generator.analyze_script(
+    result = await run_blocking(
+        "llm",
+        script_generator.analyze_script,
         script=request.original_script,
         provider_name=request.provider
     )
     
     if not result["success"]:
         raise HTTPException(
-            status_code=500,
+            status_code=429 if result.get("rate_limited") else 500,
             detail=result["error"]
         )
     
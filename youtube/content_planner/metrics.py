@@ -0,0 +1,189 @@
+"""
+Prometheus 텍스트 형식 지표
+외부 라이브러리나 수집기 없이 프로세스 안에서 카운터/게이지/히스토그램을 모아 /metrics로 노출합니다.
+관측 1건은 락 한 번과 버킷 탐색(bisect)뿐이라 운영 환경에서 켜 두어도 부담이 적습니다.
+"""
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+from tracing import span
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 초 단위 기본 버킷 (LLM 호출까지 포함하도록 60초까지)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: dict[tuple, object] = {}
+        REGISTRY.append(self)
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(labels.get(name, "") for name in self.labelnames)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_value(key, value))
+        return lines
+
+    def _render_value(self, key: tuple, value) -> list[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {value}"]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    TYPE = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """현재 값 (증가/감소 가능)"""
+    TYPE = "gauge"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+    TYPE = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [버킷별 개수..., +Inf 개수], 합계
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """with 블록 실행 시간 관측"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _render_value(self, key: tuple, value) -> list[str]:
+        counts, total = value[0][:], value[1]
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(float(bound))
+            bucket_labels = _format_labels(self.labelnames, key, f'le="{le}"')
+            lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {total}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+REGISTRY: list[_Metric] = []
+
+
+def render() -> str:
+    """등록된 모든 지표를 Prometheus 텍스트 형식으로 출력"""
+    lines = []
+    for metric in list(REGISTRY):
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ============================================
+# 공통 지표
+# ============================================
+
+HTTP_REQUESTS = Counter("http_requests_total", "HTTP 요청 수", ("method", "route", "status"))
+HTTP_LATENCY = Histogram("http_request_duration_seconds", "HTTP 요청 처리 시간 (스트리밍은 응답 시작까지)", ("method", "route"))
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수")
+
+STAGE_LATENCY = Histogram("stage_duration_seconds", "단계별 처리 시간 (스크랩, 파싱, YouTube 호출 등)", ("stage",))
+LLM_LATENCY = Histogram("llm_call_duration_seconds", "채널별 LLM 호출 시간", ("channel", "model"))
+CACHE_REQUESTS = Counter("cache_requests_total", "캐시 조회 수", ("cache", "result"))
+UPSTREAM_ERRORS = Counter("upstream_errors_total", "업스트림 호출 오류 수", ("upstream",))
+
+
+@contextmanager
+def timed(stage: str, upstream: Optional[str] = None):
+    """
+    단계 실행 시간을 stage_duration_seconds에 기록 (같은 이름의 요청 추적 span도 함께 기록)
+
+    upstream을 지정하면 블록에서 예외가 나올 때 upstream_errors_total도 올립니다.
+    """
+    started = time.perf_counter()
+    try:
+        with span(stage):
+            yield
+    except Exception:
+        if upstream:
+            UPSTREAM_ERRORS.inc(upstream=upstream)
+        raise
+    finally:
+        STAGE_LATENCY.observe(time.perf_counter() - started, stage=stage)
+
+
+async def track_request(request, call_next):
+    """
+    요청 지연 시간/상태 코드/동시 처리 수 기록 (FastAPI http 미들웨어)
+
+    라우트는 경로 템플릿(/jobs/{job_id})으로 기록해 라벨 수가 늘어나지 않게 합니다.
+    """
+    HTTP_IN_FLIGHT.inc()
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        HTTP_IN_FLIGHT.dec()
+        route = request.scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        HTTP_LATENCY.observe(time.perf_counter() - started, method=request.method, route=path)
+        HTTP_REQUESTS.inc(method=request.method, route=path, status=str(status))
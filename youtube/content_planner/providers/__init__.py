@@ -4,5 +4,6 @@ LLM Provider들을 모듈화하여 관리
 """
 
 from .base import LLMProvider, LLMResponse, get_provider
+from .router import RoutingProvider
 
-__all__ = ["LLMProvider", "LLMResponse", "get_provider"]
+__all__ = ["LLMProvider", "LLMResponse", "get_provider", "RoutingProvider"]
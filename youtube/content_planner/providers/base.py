@@ -3,6 +3,7 @@ LLM Provider 추상화 베이스 클래스
 Gemini, Claude 등 다양한 LLM을 쉽게 교체할 수 있도록 설계
 """
 
+import threading
 from abc import ABC, abstractmethod
 from typing import Optional
 from dataclasses import dataclass
@@ -13,7 +14,10 @@ class LLMResponse:
     """LLM 응답 데이터"""
     text: str
     model: str
-    tokens_used: Optional[int] = None
+    tokens_used: Optional[int] = None  # 입력 + 출력 토큰
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    cached_tokens: Optional[int] = None  # 입력 중 컨텍스트 캐시에서 읽은 토큰
     
 
 class LLMProvider(ABC):
@@ -54,21 +58,49 @@ class LLMProvider(ABC):
         pass
 
 
-def get_provider(provider_name: str = "gemini") -> LLMProvider:
+def get_provider(provider_name: str = "gemini", model: Optional[str] = None) -> LLMProvider:
     """
     Provider 팩토리 함수
     
     Args:
-        provider_name: "gemini" 또는 "claude"
+        provider_name: "gemini", "claude" 또는 "auto" (여러 Provider 라우팅 + 헤지)
+        model: 사용할 모델 (없으면 Provider 기본값)
         
     Returns:
-        LLMProvider 인스턴스
+        LLMProvider 인스턴스 ("auto"는 프로세스 전역에서 공유)
     """
+    kwargs = {"model": model} if model else {}
     if provider_name == "gemini":
         from .gemini import GeminiProvider
-        return GeminiProvider()
+        return GeminiProvider(**kwargs)
     elif provider_name == "claude":
         from .claude import ClaudeProvider
-        return ClaudeProvider()
+        return ClaudeProvider(**kwargs)
+    elif provider_name == "auto":
+        return _get_routing_provider()
     else:
         raise ValueError(f"Unknown provider: {provider_name}")
+
+
+_routing_provider: Optional[LLMProvider] = None
+_routing_lock = threading.Lock()
+
+
+def _get_routing_provider() -> LLMProvider:
+    """LLM_ROUTER_PROVIDERS로 RoutingProvider 생성 (지연 통계 유지를 위해 한 번만 생성)"""
+    global _routing_provider
+    with _routing_lock:
+        if _routing_provider is None:
+            from .router import RoutingProvider, ROUTER_PROVIDERS
+            providers = []
+            for spec in ROUTER_PROVIDERS.split(","):
+                name, _, model = spec.strip().partition(":")
+                if not name or name == "auto":
+                    continue
+                try:
+                    providers.append(get_provider(name, model or None))
+                except ValueError as e:
+                    # API 키가 없는 Provider는 제외
+                    print(f"[router] {spec.strip()} 제외: {e}")  # Server log
+            _routing_provider = RoutingProvider(providers)
+        return _routing_provider
@@ -6,6 +6,7 @@ Google Gemini API 연동
 import os
 from typing import Optional
 import google.generativeai as genai
+from ratelimit import get_limiter, estimate_tokens
 from .base import LLMProvider, LLMResponse
 
 
@@ -27,6 +28,7 @@ class GeminiProvider(LLMProvider):
         genai.configure(api_key=self.api_key)
         self.model_name = model
         self.model = genai.GenerativeModel(model)
+        self.limiter = get_limiter("gemini", model)
     
     def generate(
         self,
@@ -38,12 +40,15 @@ class GeminiProvider(LLMProvider):
         """
         Gemini를 사용하여 텍스트 생성
         """
+        # 시스템 프롬프트가 있으면 프롬프트에 포함
+        full_prompt = prompt
+        if system_prompt:
+            full_prompt = f"{system_prompt}\n\n{prompt}"
+
+        # 모델별 공유 리미터에서 차례 대기 (한도 초과 시 RateLimitExceeded)
+        self.limiter.acquire_sync(estimate_tokens(full_prompt, max_tokens))
+
         try:
-            # 시스템 프롬프트가 있으면 프롬프트에 포함
-            full_prompt = prompt
-            if system_prompt:
-                full_prompt = f"{system_prompt}\n\n{prompt}"
-            
             # 생성 설정
             generation_config = genai.GenerationConfig(
                 max_output_tokens=max_tokens,
@@ -56,10 +61,14 @@ class GeminiProvider(LLMProvider):
                 generation_config=generation_config
             )
             
+            usage = response.usage_metadata
             return LLMResponse(
                 text=response.text,
                 model=self.model_name,
-                tokens_used=None  # Gemini는 토큰 수를 직접 제공하지 않음
+                tokens_used=usage.total_token_count,
+                input_tokens=usage.prompt_token_count,
+                output_tokens=usage.candidates_token_count,
+                cached_tokens=usage.cached_content_token_count
             )
             
         except Exception as e:
@@ -3,8 +3,12 @@
 참고 스크립트를 기반으로 새로운 대본을 재구성
 """
 
+import time
 from typing import Optional
-from providers import get_provider, LLMResponse
+from providers import get_provider, LLMProvider, LLMResponse
+from tracing import span
+from usage import usage_tracker
+from ratelimit import RateLimitExceeded
 
 
 # 스크립트 재구성 프롬프트 템플릿
@@ -31,6 +35,26 @@ REWRITE_PROMPT_TEMPLATE = """## 참고 스크립트:
 """
 
 
+def _generate(provider: LLMProvider, channel: str, **kwargs) -> LLMResponse:
+    """provider.generate 호출 후 토큰 사용량/지연 시간을 usage_tracker에 기록"""
+    started = time.perf_counter()
+    try:
+        with span(f"llm.{channel}", model=provider.get_model_name()):
+            response = provider.generate(**kwargs)
+    except Exception:
+        usage_tracker.record(channel, provider.get_model_name(), latency=time.perf_counter() - started, error=True)
+        raise
+    usage_tracker.record(
+        channel,
+        response.model,
+        input_tokens=response.input_tokens or 0,
+        output_tokens=response.output_tokens or 0,
+        cached_tokens=response.cached_tokens or 0,
+        latency=time.perf_counter() - started
+    )
+    return response
+
+
 def rewrite_script(
     original_script: str,
     style: str = "informative",
@@ -84,7 +108,9 @@ def rewrite_script(
         provider = get_provider(provider_name)
         
         # 텍스트 생성
-        response = provider.generate(
+        response = _generate(
+            provider,
+            "script_rewrite",
             prompt=prompt,
             system_prompt=SYSTEM_PROMPT,
             temperature=0.7
@@ -100,6 +126,12 @@ def rewrite_script(
             "target_length": target_length
         }
         
+    except RateLimitExceeded as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "rate_limited": True
+        }
     except Exception as e:
         return {
             "success": False,
@@ -128,7 +160,9 @@ def analyze_script(
     
     try:
         provider = get_provider(provider_name)
-        response = provider.generate(
+        response = _generate(
+            provider,
+            "script_analysis",
             prompt=analysis_prompt,
             temperature=0.3  # 분석은 일관성 있게
         )
@@ -139,6 +173,12 @@ def analyze_script(
             "model_used": response.model
         }
         
+    except RateLimitExceeded as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "rate_limited": True
+        }
     except Exception as e:
         return {
             "success": False,
@@ -5,6 +5,7 @@ youtube-transcript-api 1.2.x 버전 사용
 
 from youtube_transcript_api import YouTubeTranscriptApi
 import re
+from metrics import timed
 
 
 def extract_video_id(url_or_id: str) -> str:
@@ -49,7 +50,8 @@ def get_transcript(
     try:
         # 간단한 API 호출
         ytt_api = YouTubeTranscriptApi()
-        fetched = ytt_api.fetch(video_id, languages=languages)
+        with timed("transcript_fetch", upstream="youtube_transcript"):
+            fetched = ytt_api.fetch(video_id, languages=languages)
         
         # 전체 텍스트 생성
         if include_timestamps:
@@ -95,7 +97,8 @@ def get_available_languages(video_id: str) -> dict:
     
     try:
         ytt_api = YouTubeTranscriptApi()
-        transcript_list = ytt_api.list(video_id)
+        with timed("transcript_languages", upstream="youtube_transcript"):
+            transcript_list = ytt_api.list(video_id)
         
         manual = []
         generated = []